@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""
+Interleaved rANS Model of the Camera ANS Path
+Table-driven decoder (slot -> symbol/freq/bias per context) over lockstep lanes,
+matching encoder and symbol_mapper_lookup, for benchmark bitstreams of any size
+"""
+
+import time
+import numpy as np
+
+# ans_decoder parameters
+BITSTREAM_WIDTH = 32
+STATE_WIDTH = 32
+CONTEXT_WIDTH = 4
+PROB_WIDTH = 8
+SYMBOL_WIDTH = 4
+SYNTAX_WIDTH = 16
+NUM_SYMBOLS = 16
+NUM_CONTEXTS = 16
+TABLE_SIZE = 256                 # symbol_decoder slots = 2^PROB_WIDTH
+
+# rANS with a 32-bit state renormalized 16 bits at a time:
+# state in [RANS_L, 2^32), each 32-bit bitstream_in word carries two units
+SCALE_BITS = PROB_WIDTH
+UNIT_BITS = 16
+RANS_L = 1 << (STATE_WIDTH - UNIT_BITS)
+UNIT_MASK = (1 << UNIT_BITS) - 1
+
+DEFAULT_LANES = 64
+
+
+def rtl_prob_table():
+    """probability_lookup initial table: prob_table[ctx][sym] = ctx * 16 + sym (8-bit)"""
+    ctx = np.arange(NUM_CONTEXTS)[:, None]
+    sym = np.arange(NUM_SYMBOLS)[None, :]
+    return ((ctx * 16 + sym) & ((1 << PROB_WIDTH) - 1)).astype(np.int64)
+
+
+def normalize_frequencies(counts, total=TABLE_SIZE):
+    """Scale (contexts, symbols) counts to integer frequencies summing to `total`, each >= 1"""
+    counts = np.asarray(counts, dtype=np.float64)
+    contexts, symbols = counts.shape
+    weights = np.where(counts.sum(axis=1, keepdims=True) > 0, counts, 1.0)
+    share = weights / weights.sum(axis=1, keepdims=True) * (total - symbols)
+    freq = np.floor(share).astype(np.int64) + 1
+    # Hand out the remainder to the largest fractional parts
+    remainder = total - freq.sum(axis=1)
+    order = np.argsort(-(share - np.floor(share)), axis=1, kind='stable')
+    rank = np.empty_like(order)
+    np.put_along_axis(rank, order, np.arange(symbols)[None, :].repeat(contexts, 0), axis=1)
+    freq += rank < remainder[:, None]
+    return freq
+
+
+def syntax_map_table():
+    """symbol_mapper_lookup as a (contexts, symbols) uint16 table"""
+    sym = np.arange(NUM_SYMBOLS, dtype=np.int64)
+    table = np.full((NUM_CONTEXTS, NUM_SYMBOLS), (1 << SYNTAX_WIDTH) - 1, dtype=np.int64)
+    table[0] = sym                      # QP
+    table[1] = sym << 2                 # Motion vector
+    table[2] = sym == 0                 # Binary flag
+    table[3] = sym << 4                 # {8'd0, symbol, 4'd0}
+    return table.astype(np.uint16)
+
+
+def units_to_words(units):
+    """16-bit renormalization units -> 32-bit bitstream_in words (first unit in the high half)"""
+    units = np.asarray(units, dtype=np.uint32)
+    if len(units) % 2:
+        units = np.append(units, np.uint32(0))
+    return (units[0::2] << UNIT_BITS) | units[1::2]
+
+
+def words_to_units(words):
+    """32-bit bitstream_in words -> 16-bit units"""
+    words = np.asarray(words, dtype=np.uint32)
+    return np.stack([words >> UNIT_BITS, words & UNIT_MASK], axis=1).reshape(-1).astype(np.uint16)
+
+
+class RANSModel:
+    """Per-context static rANS with TABLE_SIZE-slot decode tables
+
+    Symbol i is coded on lane i % lanes. All lanes decode one symbol per step
+    and the lanes that drop below RANS_L refill from the shared unit stream in
+    lane order, so one step is a handful of vector operations. The stream
+    starts with each lane's final encoder state (high unit first).
+    """
+
+    def __init__(self, freq=None, lanes=DEFAULT_LANES):
+        freq = normalize_frequencies(rtl_prob_table()) if freq is None else np.asarray(freq, dtype=np.int64)
+        if freq.shape != (NUM_CONTEXTS, NUM_SYMBOLS) or (freq.sum(axis=1) != TABLE_SIZE).any() or (freq < 1).any():
+            raise ValueError(f"Frequencies must be ({NUM_CONTEXTS}, {NUM_SYMBOLS}), >= 1 and sum to {TABLE_SIZE} per context")
+        self.freq = freq
+        self.cum = np.concatenate([np.zeros((NUM_CONTEXTS, 1), dtype=np.int64), np.cumsum(freq, axis=1)[:, :-1]], axis=1)
+        self.lanes = lanes
+        self.syntax_map = syntax_map_table()
+
+        # Decode tables indexed by (context << PROB_WIDTH) | slot
+        sym_of_slot = np.stack([np.repeat(np.arange(NUM_SYMBOLS), f) for f in freq])
+        slots = np.arange(TABLE_SIZE)[None, :]
+        ctx = np.arange(NUM_CONTEXTS)[:, None]
+        self.slot_symbol = sym_of_slot.reshape(-1).astype(np.uint8)
+        self.slot_freq = freq[ctx, sym_of_slot].reshape(-1)
+        self.slot_bias = (slots - self.cum[ctx, sym_of_slot]).reshape(-1)
+
+    @classmethod
+    def from_symbols(cls, contexts, symbols, lanes=DEFAULT_LANES):
+        """Model fitted to a symbol/context histogram"""
+        counts = np.zeros((NUM_CONTEXTS, NUM_SYMBOLS), dtype=np.int64)
+        np.add.at(counts, (np.asarray(contexts), np.asarray(symbols)), 1)
+        return cls(normalize_frequencies(counts), lanes)
+
+    def encode(self, contexts, symbols):
+        """(n,) contexts and symbols -> uint16 unit stream"""
+        contexts = np.asarray(contexts, dtype=np.int64)
+        symbols = np.asarray(symbols, dtype=np.int64)
+        n = len(symbols)
+        lanes = self.lanes
+        x = np.full(lanes, RANS_L, dtype=np.int64)
+        freq = self.freq[contexts, symbols]
+        cum = self.cum[contexts, symbols]
+
+        chunks = []
+        for lo in range(((n - 1) // lanes) * lanes if n else -1, -1, -lanes):
+            hi = min(lo + lanes, n)
+            xs = x[:hi - lo]
+            f = freq[lo:hi]
+            need = xs >= (f << (STATE_WIDTH - SCALE_BITS))
+            if need.any():
+                chunks.append(xs[need] & UNIT_MASK)
+                xs[need] >>= UNIT_BITS
+            q, r = np.divmod(xs, f)
+            xs[...] = (q << SCALE_BITS) + r + cum[lo:hi]
+            if not need.any():
+                chunks.append(np.empty(0, dtype=np.int64))
+
+        head = np.stack([x >> UNIT_BITS, x & UNIT_MASK], axis=1).reshape(-1)
+        return np.concatenate([head] + chunks[::-1]).astype(np.uint16)
+
+    def decode(self, units, contexts, return_state=False):
+        """uint16 unit stream + per-symbol contexts -> (n,) uint8 symbols"""
+        units = np.asarray(units, dtype=np.int64)
+        contexts = np.asarray(contexts, dtype=np.int64)
+        n = len(contexts)
+        lanes = self.lanes
+        x = (units[0:2 * lanes:2] << UNIT_BITS) | units[1:2 * lanes:2]
+        pos = 2 * lanes
+
+        base = contexts << PROB_WIDTH
+        symbols = np.empty(n, dtype=np.uint8)
+        for lo in range(0, n, lanes):
+            hi = min(lo + lanes, n)
+            xs = x[:hi - lo]
+            idx = base[lo:hi] | (xs & (TABLE_SIZE - 1))
+            symbols[lo:hi] = self.slot_symbol[idx]
+            xs[...] = self.slot_freq[idx] * (xs >> SCALE_BITS) + self.slot_bias[idx]
+            need = xs < RANS_L
+            count = np.count_nonzero(need)
+            if count:
+                xs[need] = (xs[need] << UNIT_BITS) | units[pos:pos + count]
+                pos += count
+        if return_state:
+            return symbols, x, pos
+        return symbols
+
+    def decode_syntax(self, units, contexts):
+        """Decoded symbols through symbol_mapper_lookup -> (n,) uint16 syntax elements"""
+        symbols = self.decode(units, contexts)
+        return self.syntax_map[np.asarray(contexts), symbols]
+
+    def bits_per_symbol(self, contexts):
+        """Model entropy in bits for the given context sequence"""
+        p = self.freq / TABLE_SIZE
+        entropy = -(p * np.log2(p)).sum(axis=1)
+        return float(entropy[np.asarray(contexts)].mean())
+
+
+def camera_syntax_contexts(n, seed=0):
+    """Context sequence shaped like camera slice data: per block a QP, MV pair, flag, then coefficients"""
+    pattern = np.array([0, 1, 1, 2] + list(range(3, NUM_CONTEXTS)) * 2)
+    reps = -(-n // len(pattern))
+    contexts = np.tile(pattern, reps)[:n]
+    rng = np.random.default_rng(seed)
+    # Drop some coefficient contexts so blocks vary in length
+    keep = (contexts < 3) | (rng.random(n) < 0.75)
+    contexts = contexts[keep]
+    if len(contexts) < n:
+        contexts = np.concatenate([contexts, camera_syntax_contexts(n - len(contexts), seed + 1)])
+    return contexts[:n]
+
+
+def generate_stream(n_symbols, model=None, seed=0):
+    """Synthetic compressed camera bitstream: (words, contexts, symbols)
+
+    Symbols are drawn from the model's own per-context distribution, so the
+    stream compresses to the model entropy.
+    """
+    model = model or RANSModel()
+    rng = np.random.default_rng(seed)
+    contexts = camera_syntax_contexts(n_symbols, seed)
+    cdf = np.cumsum(model.freq, axis=1)
+    draws = rng.integers(0, TABLE_SIZE, size=n_symbols)
+    symbols = (draws[:, None] >= cdf[contexts]).sum(axis=1)
+    units = model.encode(contexts, symbols)
+    return units_to_words(units), contexts, symbols
+
+
+if __name__ == "__main__":
+    print("🗜️ Camera ANS (rANS) Model Demo")
+    print("=" * 50)
+
+    model = RANSModel(lanes=256)
+    n = 2000000
+    start = time.perf_counter()
+    words, contexts, symbols = generate_stream(n, model)
+    encode_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    decoded = model.decode(words_to_units(words), contexts)
+    decode_time = time.perf_counter() - start
+
+    print(f"  Symbols: {n}, stream: {len(words)} x 32-bit words "
+          f"({len(words) * 32 / n:.3f} bits/symbol, entropy {model.bits_per_symbol(contexts):.3f})")
+    print(f"  Encode: {encode_time * 1000:.1f} ms ({n / encode_time / 1e6:.1f} M symbols/s)")
+    print(f"  Decode: {decode_time * 1000:.1f} ms ({n / decode_time / 1e6:.1f} M symbols/s)")
+    print(f"  Round trip: {np.array_equal(decoded, symbols)}")
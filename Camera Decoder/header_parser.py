@@ -0,0 +1,317 @@
+#!/usr/bin/env python3
+"""
+Exp-Golomb Header Parsing Layer for the Camera Decoder
+Word-buffered bit reader (64-bit refills, ue(v) via int.bit_length),
+SPS/PPS/slice-header parsers and a parameter-set cache keyed by id
+"""
+
+import os
+import time
+import tempfile
+import numpy as np
+
+from nal_scanner import NALIndex, add_emulation_prevention, START_CODE, LONG_START_CODE
+
+# H.265 nal_unit_type values (header_decoder tests nal_unit[7:0] == 8'h42, the SPS header byte)
+NAL_VPS = 32
+NAL_SPS = 33
+NAL_PPS = 34
+NAL_SLICE_TYPES = range(0, 22)
+NAL_HEADER_BYTES = 2
+
+SLICE_I, SLICE_P, SLICE_B = 0, 1, 2
+SLICE_TYPE_NAMES = {SLICE_I: 'I', SLICE_P: 'P', SLICE_B: 'B'}
+
+MAX_DIMENSION = 8192          # sps_decoder rejects width/height of 0 or > 8192
+MAX_QP = 51
+MAX_TILES_MINUS1 = 15
+MAX_LEADING_ZEROS = 32        # bitstream_reader errors beyond 32 leading zeros
+
+REFILL_BYTES = 8
+
+
+class BitReader:
+    """MSB-first bit reader over an RBSP, refilled 64 bits at a time
+
+    ue(v) counts the leading zeros of the buffered window with
+    int.bit_length() instead of walking the bits.
+    """
+
+    def __init__(self, data, byte_offset=0):
+        self._data = data             # bytes or memoryview, refills slice without copying the whole unit
+        self._next = byte_offset
+        self._cache = 0
+        self._bits = 0
+
+    def _refill(self):
+        chunk = self._data[self._next:self._next + REFILL_BYTES]
+        if not chunk:
+            raise ValueError("Bitstream exhausted")
+        self._cache = (self._cache << (8 * len(chunk))) | int.from_bytes(chunk, 'big')
+        self._bits += 8 * len(chunk)
+        self._next += len(chunk)
+
+    def read_bits(self, n):
+        """u(n)"""
+        while self._bits < n:
+            self._refill()
+        self._bits -= n
+        value = self._cache >> self._bits
+        self._cache &= (1 << self._bits) - 1
+        return value
+
+    def read_flag(self):
+        """u(1) as bool"""
+        return bool(self.read_bits(1))
+
+    def read_ue(self):
+        """ue(v): 2^lz - 1 + next lz bits"""
+        while self._bits <= 2 * MAX_LEADING_ZEROS and self._next < len(self._data):
+            self._refill()
+        if self._cache == 0:
+            raise ValueError("Exp-Golomb code without terminating one bit")
+        leading_zeros = self._bits - self._cache.bit_length()
+        if leading_zeros > MAX_LEADING_ZEROS:
+            raise ValueError(f"Exp-Golomb code with {leading_zeros} leading zeros")
+        return self.read_bits(2 * leading_zeros + 1) - 1
+
+    def read_se(self):
+        """se(v): ue(v) k mapped to (-1)^(k+1) * ceil(k / 2)"""
+        k = self.read_ue()
+        return (k + 1) >> 1 if k & 1 else -(k >> 1)
+
+    @property
+    def bit_pos(self):
+        return 8 * self._next - self._bits
+
+    def bits_left(self):
+        return 8 * (len(self._data) - self._next) + self._bits
+
+
+class BitWriter:
+    """MSB-first bit writer, the encoder side of BitReader"""
+
+    def __init__(self):
+        self._value = 0
+        self._bits = 0
+
+    def write_bits(self, value, n):
+        if value >> n:
+            raise ValueError(f"Value {value} does not fit in {n} bits")
+        self._value = (self._value << n) | value
+        self._bits += n
+
+    def write_flag(self, flag):
+        self.write_bits(int(bool(flag)), 1)
+
+    def write_ue(self, value):
+        code = value + 1
+        self.write_bits(code, 2 * code.bit_length() - 1)
+
+    def write_se(self, value):
+        self.write_ue(2 * value - 1 if value > 0 else -2 * value)
+
+    def rbsp_trailing_bits(self):
+        """rbsp_stop_one_bit then zero bits up to a byte boundary"""
+        self.write_bits(1, 1)
+        self.write_bits(0, -self._bits % 8)
+
+    def to_bytes(self):
+        if self._bits % 8:
+            raise ValueError("RBSP is not byte aligned")
+        return self._value.to_bytes(self._bits // 8, 'big')
+
+
+def nal_header(nal_type, layer_id=0, temporal_id=0):
+    """2-byte H.265 NAL unit header"""
+    return bytes([nal_type << 1 | layer_id >> 5, (layer_id & 0x1F) << 3 | (temporal_id + 1)])
+
+
+# --- Parameter sets: sps_decoder / pps_decoder fields, preceded by their ids ---
+
+def parse_sps(reader):
+    """sps_id, then profile u(8), width ue, height ue, fps u(8), chroma_format_idc ue, bit_depth_luma_minus8 ue"""
+    sps = {'sps_id': reader.read_ue(), 'profile': reader.read_bits(8)}
+    for name in ('width', 'height'):
+        value = reader.read_ue()
+        if value == 0 or value > MAX_DIMENSION:
+            raise ValueError(f"SPS {name} {value} outside 1..{MAX_DIMENSION}")
+        sps[name] = value & 0xFFFF
+    sps['fps'] = reader.read_bits(8)
+    sps['chroma_format'] = reader.read_ue() & 0x3          # 2-bit header_decoder port
+    sps['bit_depth'] = (reader.read_ue() + 8) & 0xF         # 4-bit port
+    return sps
+
+
+def parse_pps(reader):
+    """pps_id, sps_id, then qp u(6), tiles_enabled u(1) [, num_tile_columns/rows_minus1 ue]"""
+    pps = {'pps_id': reader.read_ue(), 'sps_id': reader.read_ue(), 'qp': reader.read_bits(6)}
+    if pps['qp'] > MAX_QP:
+        raise ValueError(f"PPS qp {pps['qp']} > {MAX_QP}")
+    pps['tiles_enabled'] = reader.read_flag()
+    pps['tile_cols'] = pps['tile_rows'] = 0
+    if pps['tiles_enabled']:
+        for name in ('tile_cols', 'tile_rows'):
+            minus1 = reader.read_ue()
+            if minus1 > MAX_TILES_MINUS1:
+                raise ValueError(f"PPS {name} {minus1 + 1} > {MAX_TILES_MINUS1 + 1}")
+            pps[name] = minus1 + 1
+    return pps
+
+
+def parse_slice_header(reader):
+    """pps_id, then slice_header_parser fields: slice_type u(2), ref counts u(3) (P/B, B), slice_qp_delta u(6)"""
+    header = {'pps_id': reader.read_ue(), 'slice_type': reader.read_bits(2)}
+    if header['slice_type'] not in SLICE_TYPE_NAMES:
+        raise ValueError(f"Invalid slice_type {header['slice_type']}")
+    header['num_ref_idx_l0_active_minus1'] = reader.read_bits(3) if header['slice_type'] != SLICE_I else 0
+    header['num_ref_idx_l1_active_minus1'] = reader.read_bits(3) if header['slice_type'] == SLICE_B else 0
+    header['slice_qp_delta'] = reader.read_bits(6)
+    header['header_bits'] = reader.bit_pos
+    return header
+
+
+def validate(sps, pps):
+    """parameter_validator: Main/Main10, 16-aligned size, 4:2:0, 8/10-bit, fps > 0, tiles set"""
+    return (sps['profile'] in (1, 2)
+            and sps['width'] % 16 == 0 and sps['height'] % 16 == 0
+            and pps['qp'] <= MAX_QP
+            and sps['chroma_format'] == 1
+            and sps['bit_depth'] in (8, 10)
+            and sps['fps'] != 0
+            and not (pps['tiles_enabled'] and (pps['tile_cols'] == 0 or pps['tile_rows'] == 0)))
+
+
+class HeaderParser:
+    """SPS/PPS/slice-header parsing with parameter sets cached by id
+
+    A parameter set whose id is already cached with byte-identical RBSP is
+    not parsed again; only its leading id is read to find the cache entry.
+    Slice headers resolve their PPS and SPS from the cache.
+    """
+
+    def __init__(self):
+        self.sps = {}
+        self.pps = {}
+        self._raw = {}
+        self.stats = {'parsed': 0, 'cache_hits': 0, 'slices': 0, 'skipped': 0}
+
+    def _parameter_set(self, kind, table, parse, rbsp):
+        reader = BitReader(rbsp, NAL_HEADER_BYTES)
+        ps_id = reader.read_ue()
+        raw = self._raw.get((kind, ps_id))
+        if raw is not None and raw == rbsp:
+            self.stats['cache_hits'] += 1
+            return table[ps_id]
+        params = parse(BitReader(rbsp, NAL_HEADER_BYTES))
+        self._raw[(kind, ps_id)] = bytes(rbsp)
+        table[ps_id] = params
+        self.stats['parsed'] += 1
+        return params
+
+    def parse_nal(self, rbsp, nal_type=None):
+        """Parse one unescaped NAL unit; returns (nal_type, fields) or (nal_type, None) for other units"""
+        nal_type = (rbsp[0] >> 1) & 0x3F if nal_type is None else nal_type
+        if nal_type == NAL_SPS:
+            return nal_type, self._parameter_set('sps', self.sps, parse_sps, rbsp)
+        if nal_type == NAL_PPS:
+            return nal_type, self._parameter_set('pps', self.pps, parse_pps, rbsp)
+        if nal_type in NAL_SLICE_TYPES:
+            header = parse_slice_header(BitReader(rbsp, NAL_HEADER_BYTES))
+            pps = self.pps.get(header['pps_id'])
+            if pps is None or pps['sps_id'] not in self.sps:
+                raise ValueError(f"Slice refers to missing PPS {header['pps_id']} or its SPS")
+            header['qp'] = (pps['qp'] + header['slice_qp_delta']) & 0x3F   # base_qp + slice_qp_delta
+            self.stats['slices'] += 1
+            return nal_type, header
+        self.stats['skipped'] += 1
+        return nal_type, None
+
+    def parse_index(self, index):
+        """Slice headers of every unit in a NALIndex, each tagged with its NAL index"""
+        slices = []
+        for i, nal_type in enumerate(index.types.tolist()):
+            _, header = self.parse_nal(index.rbsp(i), nal_type)
+            if header is not None and nal_type in NAL_SLICE_TYPES:
+                header['nal_index'] = i
+                slices.append(header)
+        return slices
+
+
+# --- Writers, for building test and benchmark recordings ---
+
+def build_sps(sps_id=0, profile=1, width=640, height=480, fps=30, chroma_format=1, bit_depth=8):
+    w = BitWriter()
+    w.write_ue(sps_id)
+    w.write_bits(profile, 8)
+    w.write_ue(width)
+    w.write_ue(height)
+    w.write_bits(fps, 8)
+    w.write_ue(chroma_format)
+    w.write_ue(bit_depth - 8)
+    w.rbsp_trailing_bits()
+    return nal_header(NAL_SPS) + w.to_bytes()
+
+
+def build_pps(pps_id=0, sps_id=0, qp=26, tile_cols=0, tile_rows=0):
+    w = BitWriter()
+    w.write_ue(pps_id)
+    w.write_ue(sps_id)
+    w.write_bits(qp, 6)
+    w.write_flag(tile_cols > 0)
+    if tile_cols > 0:
+        w.write_ue(tile_cols - 1)
+        w.write_ue(tile_rows - 1)
+    w.rbsp_trailing_bits()
+    return nal_header(NAL_PPS) + w.to_bytes()
+
+
+def build_slice(pps_id=0, slice_type=SLICE_I, ref_l0=0, ref_l1=0, qp_delta=0, payload=b'', nal_type=1):
+    w = BitWriter()
+    w.write_ue(pps_id)
+    w.write_bits(slice_type, 2)
+    if slice_type != SLICE_I:
+        w.write_bits(ref_l0, 3)
+    if slice_type == SLICE_B:
+        w.write_bits(ref_l1, 3)
+    w.write_bits(qp_delta, 6)
+    w.rbsp_trailing_bits()
+    return nal_header(nal_type) + w.to_bytes() + payload
+
+
+def write_recording(path, frames, gop=30, payload_bytes=2000, seed=0):
+    """Annex-B recording: SPS + PPS repeated every GOP, then one slice per frame"""
+    rng = np.random.default_rng(seed)
+    with open(path, 'wb') as f:
+        for frame in range(frames):
+            if frame % gop == 0:
+                f.write(LONG_START_CODE + add_emulation_prevention(build_sps()))
+                f.write(START_CODE + add_emulation_prevention(build_pps(pps_id=frame // gop % 2, qp=26)))
+            slice_type = SLICE_I if frame % gop == 0 else (SLICE_P if frame % 3 else SLICE_B)
+            payload = rng.integers(1, 256, size=payload_bytes, dtype=np.uint8).tobytes()
+            nal = build_slice(frame // gop % 2, slice_type, int(rng.integers(0, 4)), int(rng.integers(0, 4)),
+                              int(rng.integers(0, 8)), payload, nal_type=19 if slice_type == SLICE_I else 1)
+            f.write(LONG_START_CODE + add_emulation_prevention(nal))
+
+
+if __name__ == "__main__":
+    print("🧾 Header Parsing Layer Demo")
+    print("=" * 50)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'recording.h265')
+        frames = 30000
+        write_recording(path, frames)
+
+        with NALIndex(path) as index:
+            start = time.perf_counter()
+            parser = HeaderParser()
+            slices = parser.parse_index(index)
+            elapsed = time.perf_counter() - start
+
+            types = np.bincount([s['slice_type'] for s in slices], minlength=3)
+            print(f"  Recording: {os.path.getsize(path) / 1e6:.1f} MB, {len(index)} NAL units")
+            print(f"  Slices: " + ", ".join(f"{SLICE_TYPE_NAMES[t]}={c}" for t, c in enumerate(types)))
+            print(f"  Parameter sets parsed: {parser.stats['parsed']}, cache hits: {parser.stats['cache_hits']}")
+            print(f"  Valid: {validate(parser.sps[0], parser.pps[0])}")
+            print(f"  Time: {elapsed * 1000:.1f} ms ({len(index) / elapsed / 1e3:.0f} k NAL units/s)")
@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+Batched Golden Model of inverse_quant_transform
+inverse_quantizer + transform_size_selector + separable inverse_transform,
+blocks grouped by transform size and transformed with two matmuls per group
+"""
+
+import time
+import numpy as np
+
+# inverse_quant_transform parameters
+COEFF_WIDTH = 16
+QP_WIDTH = 6
+MAX_SIZE = 32
+BIT_DEPTH = 8
+
+COEFF_MIN, COEFF_MAX = -(1 << (COEFF_WIDTH - 1)), (1 << (COEFF_WIDTH - 1)) - 1
+
+# inverse_quantizer scale_factor[k] = LEVEL * 2^14 stored in 20 bits:
+# 64 << 14 truncates to 0 and 72 << 14 to 8 << 14
+SF_WIDTH = 20
+LEVEL_SCALE = np.array([40, 45, 51, 57, 64, 72], dtype=np.int64)
+RTL_LEVEL_SCALE = ((LEVEL_SCALE << 14) & ((1 << SF_WIDTH) - 1)) >> 14
+
+TRANSFORM_SIZES = (4, 8, 16, 32)   # transform_size codes 2'b00 .. 2'b11
+
+# HEVC DCT-II basis magnitudes |T32[k][n]| = A[(2n+1)k mod 128 folded], A[0] = DC
+_DCT_MAGNITUDES = np.array([
+    64, 90, 90, 90, 89, 88, 87, 85, 83, 82, 80, 78, 75, 73, 70, 67,
+    64, 61, 57, 54, 50, 46, 43, 38, 36, 31, 25, 22, 18, 13, 9, 4, 0
+], dtype=np.int64)
+
+
+def wrap(values, bits=COEFF_WIDTH):
+    """Two's complement truncation to `bits`"""
+    half = 1 << (bits - 1)
+    return ((np.asarray(values, dtype=np.int64) + half) & ((1 << bits) - 1)) - half
+
+
+def dct_matrix(size):
+    """HEVC integer DCT-II matrix T (size x size), rows are basis functions"""
+    k = np.arange(0, MAX_SIZE, MAX_SIZE // size)[:, None]
+    n = np.arange(size)[None, :]
+    m = ((2 * n + 1) * k) % 128
+    m = np.where(m > 64, 128 - m, m)                 # cos(2pi - x) = cos(x)
+    sign = np.where(m > 32, -1, 1)                   # cos(pi - x) = -cos(x)
+    T = sign * _DCT_MAGNITUDES[np.where(m > 32, 64 - m, m)]
+    T[0] = 64
+    return T
+
+
+def inverse_quantize(quantized, qp):
+    """inverse_quantizer on whole blocks: (..., N, N) coefficients, qp broadcast per block
+
+    The 16-bit coefficient multiplies the unsigned 20-bit scale factor, so the
+    product is formed unsigned; the extra 2^16 * scale term and the 36-bit
+    wrap are multiples of 2^16 after the >>> and vanish in the 16-bit result,
+    leaving wrap16(q * level * 2^(QP/6)). The clamp after it compares a
+    16-bit value and never fires.
+    """
+    quantized = np.asarray(quantized, dtype=np.int64)
+    qp = np.asarray(qp, dtype=np.int64) & ((1 << QP_WIDTH) - 1)
+    scale = RTL_LEVEL_SCALE[qp % 6] << (qp // 6)
+    scale = np.where(qp >= 52, 0, scale)
+    scale = scale.reshape(scale.shape + (1,) * (quantized.ndim - scale.ndim))
+    return wrap(quantized * scale)
+
+
+def transform_size_selector(syntax_elements, cu_size=0b11):
+    """transform_size code per block (inverse_quant_transform ties cu_size to 2'b11)"""
+    syntax = np.asarray(syntax_elements, dtype=np.int64)
+    cu_size = np.broadcast_to(np.asarray(cu_size, dtype=np.int64), syntax.shape)
+    low = syntax & 0b11
+    return np.select(
+        [cu_size == 0b00, cu_size == 0b01],
+        [np.where(syntax & 1, 0, 1), np.where(low == 0b11, 0, low)],
+        default=np.where(syntax & 0b1000, 3, 2)
+    )
+
+
+class InverseTransformModel:
+    """Separable inverse_transform: row pass, then column pass, per block size
+
+    transform='rtl' is the idct_1d placeholder as written (in * 64 >>> 6,
+    truncated to 16 bits, i.e. the identity). transform='hevc' is the
+    standard integer IDCT the RTL comment asks for: column pass with shift 7,
+    row pass with shift 20 - BIT_DEPTH, rounding and 16-bit clipping after
+    each stage.
+    """
+
+    def __init__(self, transform='rtl'):
+        if transform == 'rtl':
+            self.bases = {s: 64 * np.eye(s, dtype=np.int64) for s in TRANSFORM_SIZES}
+            self.shifts = (6, 6)
+            self.rounding = False
+            self.saturate = False
+            self.rows_first = True
+        elif transform == 'hevc':
+            self.bases = {s: dct_matrix(s) for s in TRANSFORM_SIZES}
+            self.shifts = (7, 20 - BIT_DEPTH)
+            self.rounding = True
+            self.saturate = True
+            self.rows_first = False
+        else:
+            raise ValueError(f"Unknown transform '{transform}' (expected 'rtl' or 'hevc')")
+        self.transform = transform
+        # |basis| <= 90 and inputs are 16-bit, so every 32-term dot product
+        # stays below 2^28 and float64 matmul is exact
+        self._bases_f = {s: T.astype(np.float64) for s, T in self.bases.items()}
+
+    def _stage(self, sums, shift):
+        """Shift one pass back into 16 bits (rounded/clipped or truncated)"""
+        values = np.rint(sums).astype(np.int64)
+        if self.rounding:
+            values += 1 << (shift - 1)
+        values >>= shift
+        if self.saturate:
+            return np.clip(values, COEFF_MIN, COEFF_MAX)
+        return wrap(values)
+
+    def run(self, blocks):
+        """(B, s, s) coefficients of one transform size -> (B, s, s) int16 residuals"""
+        blocks = np.asarray(blocks, dtype=np.float64)
+        T = self._bases_f[blocks.shape[-1]]
+        first, second = self.shifts
+        if self.rows_first:
+            stage = self._stage(blocks @ T, first)                        # rows: x[r] . T
+            out = self._stage(T.T @ stage.astype(np.float64), second)     # columns
+        else:
+            stage = self._stage(T.T @ blocks, first)                      # columns
+            out = self._stage(stage.astype(np.float64) @ T, second)       # rows
+        return out.astype(np.int16)
+
+    __call__ = run
+
+
+class InverseQuantTransformModel:
+    """inverse_quant_transform over a frame's worth of blocks in one pass"""
+
+    def __init__(self, transform='rtl', cu_size=0b11):
+        self.transform = InverseTransformModel(transform)
+        self.cu_size = cu_size
+
+    def run(self, quantized, qp, syntax_elements, cu_size=None):
+        """(B, 32, 32) quantized coefficients -> (B, 32, 32) int16 residual_data
+
+        qp and syntax_elements are scalars or per-block arrays. Only the
+        top-left transform_size x transform_size region is produced; the RTL
+        leaves the rest of residual_data untouched, here it is zero.
+        """
+        quantized = np.asarray(quantized).reshape(-1, MAX_SIZE, MAX_SIZE)
+        batch = len(quantized)
+        qp = np.broadcast_to(np.asarray(qp, dtype=np.int64), (batch,))
+        codes = np.broadcast_to(
+            transform_size_selector(syntax_elements, self.cu_size if cu_size is None else cu_size), (batch,))
+
+        residual = np.zeros((batch, MAX_SIZE, MAX_SIZE), dtype=np.int16)
+        for code, size in enumerate(TRANSFORM_SIZES):
+            idx = np.flatnonzero(codes == code)
+            if len(idx) == 0:
+                continue
+            # Dequantize only the region the transform reads
+            coeffs = inverse_quantize(quantized[idx, :size, :size], qp[idx])
+            residual[idx, :size, :size] = self.transform.run(coeffs)
+        return residual
+
+    __call__ = run
+
+    def size_histogram(self, syntax_elements, cu_size=None):
+        """Number of blocks per transform size"""
+        codes = transform_size_selector(syntax_elements, self.cu_size if cu_size is None else cu_size)
+        counts = np.bincount(np.ravel(codes), minlength=len(TRANSFORM_SIZES))
+        return dict(zip(TRANSFORM_SIZES, counts.tolist()))
+
+
+if __name__ == "__main__":
+    print("🔢 Inverse Quant & Transform Golden Model Demo")
+    print("=" * 50)
+
+    rng = np.random.default_rng(0)
+    # 640x480 frame: 1200 blocks of 16x16 luma residual, mixed transform sizes
+    batch = 1200
+    quantized = rng.integers(-64, 64, size=(batch, MAX_SIZE, MAX_SIZE), dtype=np.int16)
+    qp = rng.integers(0, 52, size=batch)
+    syntax = rng.integers(0, 256, size=batch)
+    cu_size = rng.integers(0, 4, size=batch)
+
+    for transform in ('rtl', 'hevc'):
+        model = InverseQuantTransformModel(transform)
+        start = time.perf_counter()
+        residual = model.run(quantized, qp, syntax, cu_size=cu_size)
+        elapsed = time.perf_counter() - start
+        print(f"  {transform:4s}: {batch} blocks -> {residual.shape} in {elapsed * 1000:.1f} ms")
+
+    print(f"  Sizes: {model.size_histogram(syntax, cu_size)}")
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Frame-Level Golden Model of loop_filters
+deblocking_filter and sao_filter as masked whole-frame NumPy passes,
+frame_buffer_manager as a circular reference-frame buffer, any resolution
+"""
+
+import time
+import numpy as np
+
+# loop_filters parameters
+WIDTH = 640
+HEIGHT = 480
+N = 8              # Block size
+THRESHOLD = 10     # Deblocking threshold
+OFFSET = 2         # SAO band offset
+NUM_FRAMES = 4     # Reference frames
+
+SAO_BAND_LOW = 100
+SAO_BAND_HIGH = 150
+
+EDGE_DIRECTIONS = ('vertical', 'horizontal')
+
+
+def sao_table(offset=OFFSET, band_low=SAO_BAND_LOW, band_high=SAO_BAND_HIGH):
+    """256-entry sao_filter lookup: band pixels get +offset, saturated at 255"""
+    pixel = np.arange(256, dtype=np.int64)
+    in_band = (pixel >= band_low) & (pixel <= band_high)
+    return np.where(in_band, np.minimum(pixel + offset, 255), pixel).astype(np.uint8)
+
+
+class LoopFilterModel:
+    """deblocking_filter -> sao_filter -> frame_buffer_manager over whole frames
+
+    deblocking_filter compares each pixel with its right neighbour inside an
+    N-wide block and, below THRESHOLD, replaces it with (a + b) >> 1. The last
+    column of every block always averages across the block edge (diff is
+    forced to 0). The sum is evaluated in the 8-bit context of the
+    assignment, so rtl_arithmetic=True drops its carry; False keeps the
+    9-bit sum. At the right frame border the RTL reads past the array (X);
+    the model leaves that pixel unchanged.
+
+    edges selects the passes: ('vertical',) is the RTL, which only filters
+    along rows; ('vertical', 'horizontal') adds the same rule down columns,
+    applied to the output of the first pass.
+    """
+
+    def __init__(self, width=WIDTH, height=HEIGHT, block_size=N, threshold=THRESHOLD,
+                 offset=OFFSET, num_frames=NUM_FRAMES, edges=('vertical',), rtl_arithmetic=True):
+        for edge in edges:
+            if edge not in EDGE_DIRECTIONS:
+                raise ValueError(f"Unknown edge direction '{edge}' (expected one of {EDGE_DIRECTIONS})")
+        self.width = width
+        self.height = height
+        self.block_size = block_size
+        self.threshold = threshold
+        self.edges = tuple(edges)
+        self.rtl_arithmetic = rtl_arithmetic
+        self.sao_lut = sao_table(offset)
+
+        # frame_buffer_manager state (reset: all zeros, write_ptr = 0)
+        self.reference_frames = np.zeros((num_frames, height, width), dtype=np.uint8)
+        self.write_ptr = 0
+
+        self._scratch = {}
+
+    def _buffers(self, shape):
+        """int16 / bool scratch for one pass orientation, reused across frames"""
+        if shape not in self._scratch:
+            self._scratch[shape] = (np.empty(shape, dtype=np.int16),
+                                    np.empty(shape, dtype=np.int16),
+                                    np.empty(shape, dtype=bool))
+        return self._scratch[shape]
+
+    def _deblock_pass(self, src, dst):
+        """One deblocking direction along the last axis (src is copied first, so dst may alias it)"""
+        wide, pair, mask = self._buffers(src.shape)
+        wide[...] = src
+
+        # diff = |p[x] - p[x+1]| inside a block, forced to 0 on the block's last column
+        left, right = wide[:, :-1], wide[:, 1:]
+        diff = pair[:, :-1]
+        np.subtract(left, right, out=diff)
+        np.abs(diff, out=diff)
+        diff[:, self.block_size - 1::self.block_size] = 0
+        np.less(diff, self.threshold, out=mask[:, :-1])
+        mask[:, -1] = False
+
+        np.add(left, right, out=diff)
+        if self.rtl_arithmetic:
+            diff &= 0xFF
+        diff >>= 1
+
+        np.copyto(dst, src)
+        np.copyto(dst, pair, where=mask, casting='unsafe')
+        return dst
+
+    def deblock(self, frame, out=None):
+        """deblocking_filter on an (H, W) uint8 frame"""
+        frame = np.asarray(frame, dtype=np.uint8)
+        out = np.empty_like(frame) if out is None else out
+        src = frame
+        for edge in self.edges:
+            # Horizontal edges: the same rule down columns, on transposed views
+            if edge == 'vertical':
+                self._deblock_pass(src, out)
+            else:
+                self._deblock_pass(src.T, out.T)
+            src = out
+        return out
+
+    def sao(self, frame, out=None):
+        """sao_filter band offset via the 256-entry table"""
+        return np.take(self.sao_lut, np.asarray(frame, dtype=np.uint8), out=out)
+
+    def filter(self, frame, out=None):
+        """reconstructed_frame -> filtered_frame (deblocking then SAO)"""
+        out = self.deblock(frame, out=out)
+        return self.sao(out, out=out)
+
+    def process(self, frame, new_frame_ready=True):
+        """Filter one frame and, on new_frame_ready, store it at write_ptr"""
+        filtered = self.filter(frame)
+        if new_frame_ready:
+            self.reference_frames[self.write_ptr] = filtered
+            self.write_ptr = (self.write_ptr + 1) % len(self.reference_frames)
+        return filtered
+
+    __call__ = process
+
+    def reset(self):
+        """reset_n: clear the reference frames and write pointer"""
+        self.reference_frames[...] = 0
+        self.write_ptr = 0
+
+
+def benchmark(resolutions=((640, 480), (1280, 720), (1920, 1080), (3840, 2160)), runs=10, seed=0, **kwargs):
+    """Per-frame filter time at each resolution, for cost-scaling estimates"""
+    rng = np.random.default_rng(seed)
+    results = []
+    for width, height in resolutions:
+        model = LoopFilterModel(width=width, height=height, **kwargs)
+        frame = rng.integers(0, 256, size=(height, width), dtype=np.uint8)
+        out = np.empty_like(frame)
+        model.filter(frame, out=out)
+        start = time.perf_counter()
+        for _ in range(runs):
+            model.filter(frame, out=out)
+        elapsed = (time.perf_counter() - start) / runs
+        results.append({
+            'width': width,
+            'height': height,
+            'ms_per_frame': elapsed * 1000,
+            'ns_per_pixel': elapsed * 1e9 / (width * height)
+        })
+    return results
+
+
+if __name__ == "__main__":
+    print("🧹 Loop Filters Golden Model Demo")
+    print("=" * 50)
+
+    for edges in (('vertical',), ('vertical', 'horizontal')):
+        print(f"  Edges: {' + '.join(edges)}")
+        for r in benchmark(edges=edges):
+            print(f"    {r['width']:4d}x{r['height']:<4d}: {r['ms_per_frame']:7.2f} ms/frame "
+                  f"({r['ns_per_pixel']:.2f} ns/pixel)")
@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+Streaming NAL Unit Scanner for Annex-B Camera Bitstreams
+Memory-mapped start-code indexing with NumPy masks, zero-copy NAL unit views
+and bulk emulation-prevention byte removal
+"""
+
+import os
+import mmap
+import time
+import tempfile
+import numpy as np
+
+START_CODE = b'\x00\x00\x01'
+LONG_START_CODE = b'\x00\x00\x00\x01'
+EMULATION_PREVENTION = 0x03
+
+CHUNK_BYTES = 16 << 20        # Scan granularity, bounds the mask memory
+
+
+def scan_buffer(data, base=0):
+    """Start codes and emulation-prevention bytes in one buffer
+
+    Returns (start_codes, epb): absolute offsets of every 00 00 01 and of the
+    03 in every 00 00 03. Both are found from the positions of 00 00 pairs.
+    """
+    arr = np.frombuffer(data, dtype=np.uint8)
+    if len(arr) < 3:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+    pairs = np.flatnonzero((arr[:-2] == 0) & (arr[1:-1] == 0))
+    third = arr[pairs + 2]
+    return pairs[third == 1] + base, pairs[third == EMULATION_PREVENTION] + 2 + base
+
+
+def remove_emulation_prevention(data, epb=None, base=0):
+    """EBSP -> RBSP: drop the 03 of each 00 00 03 (one bulk np.delete)
+
+    epb optionally gives the absolute EPB offsets already found by the
+    scanner, with `base` the absolute offset of data[0].
+    """
+    arr = np.frombuffer(data, dtype=np.uint8)
+    if epb is None:
+        _, epb = scan_buffer(data)
+    else:
+        epb = np.asarray(epb, dtype=np.int64) - base
+    if len(epb) == 0:
+        return bytes(arr)
+    return np.delete(arr, epb).tobytes()
+
+
+def add_emulation_prevention(rbsp):
+    """RBSP -> EBSP: insert 03 after every 00 00 that precedes a byte <= 03
+
+    Only 00 00 pairs are visited (bytes.find), so payloads without long zero
+    runs escape at memory speed. A trailing 00 gets a final 03 as well.
+    """
+    out = bytearray(rbsp)
+    pos = out.find(b'\x00\x00')
+    while pos >= 0:
+        if pos + 2 < len(out) and out[pos + 2] <= EMULATION_PREVENTION:
+            out.insert(pos + 2, EMULATION_PREVENTION)
+            pos = out.find(b'\x00\x00', pos + 3)
+        else:
+            pos = out.find(b'\x00\x00', pos + 1)
+    if out.endswith(b'\x00'):
+        out.append(EMULATION_PREVENTION)
+    return bytes(out)
+
+
+class NALIndex:
+    """Start-code index of an Annex-B file, NAL units served as memoryviews
+
+    The file is scanned in CHUNK_BYTES pieces overlapping by 2 bytes, so a
+    start code split across chunks is still found. A 00 00 01 preceded by a
+    zero byte is the 4-byte form; trailing zero bytes before the next start
+    code are not part of the unit.
+    """
+
+    def __init__(self, path, chunk_bytes=CHUNK_BYTES):
+        self.path = path
+        self._file = open(path, 'rb')
+        size = os.fstat(self._file.fileno()).st_size
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if size else b''
+        self._view = memoryview(self._map)
+        self.size = size
+        self._index(chunk_bytes)
+
+    def _index(self, chunk_bytes):
+        starts, epbs = [], []
+        for lo in range(0, self.size, chunk_bytes):
+            hi = min(lo + chunk_bytes + 2, self.size)
+            s, e = scan_buffer(self._view[lo:hi], base=lo)
+            # Matches starting in the 2-byte overlap belong to the next chunk
+            limit = lo + chunk_bytes
+            starts.append(s[s < limit])
+            epbs.append(e[e - 2 < limit])
+        start_codes = np.concatenate(starts) if starts else np.empty(0, dtype=np.int64)
+        self.epb = np.concatenate(epbs) if epbs else np.empty(0, dtype=np.int64)
+
+        arr = np.frombuffer(self._map, dtype=np.uint8)
+        self.offsets = start_codes + 3
+        # Unit ends at the next start code, minus the zero_byte of a 4-byte code and trailing zeros
+        ends = np.append(start_codes[1:], self.size)[:len(start_codes)].astype(np.int64)
+        trailing = (ends > self.offsets) & (arr[np.maximum(ends - 1, 0)] == 0)
+        while trailing.any():
+            ends -= trailing
+            trailing &= (ends > self.offsets) & (arr[np.maximum(ends - 1, 0)] == 0)
+        self.ends = ends
+        self.long_start_code = (start_codes > 0) & (arr[np.maximum(start_codes - 1, 0)] == 0)
+        self._arr = arr
+
+    def __len__(self):
+        return len(self.offsets)
+
+    def __getitem__(self, i):
+        """Escaped NAL unit i (header + EBSP payload) as a zero-copy memoryview"""
+        return self._view[self.offsets[i]:self.ends[i]]
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    @property
+    def sizes(self):
+        return self.ends - self.offsets
+
+    @property
+    def header_bytes(self):
+        """First byte of every unit (what NALUnitExtractor reports as nal_type)"""
+        valid = self.sizes > 0
+        headers = np.zeros(len(self), dtype=np.uint8)
+        headers[valid] = self._arr[self.offsets[valid]]
+        return headers
+
+    @property
+    def types(self):
+        """H.265 nal_unit_type: bits [6:1] of the first header byte"""
+        return (self.header_bytes >> 1) & 0x3F
+
+    def epb_count(self, i):
+        """Emulation-prevention bytes inside unit i"""
+        lo, hi = np.searchsorted(self.epb, [self.offsets[i], self.ends[i]])
+        return int(hi - lo)
+
+    def rbsp(self, i):
+        """Unescaped unit i: the memoryview itself when it has no EPBs, else one bulk delete"""
+        lo, hi = np.searchsorted(self.epb, [self.offsets[i], self.ends[i]])
+        if lo == hi:
+            return self[i]
+        return remove_emulation_prevention(self[i], self.epb[lo:hi], base=self.offsets[i])
+
+    def units(self, types=None):
+        """Yield (index, nal_unit_type, view), optionally only the given types"""
+        unit_types = self.types
+        select = np.arange(len(self)) if types is None else np.flatnonzero(np.isin(unit_types, list(types)))
+        for i in select:
+            yield int(i), int(unit_types[i]), self[i]
+
+    def close(self):
+        """Unmap the file (fails while unit views are still referenced)"""
+        self._arr = None
+        self._view.release()
+        if self.size:
+            self._map.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def write_synthetic_stream(path, n_units, payload_bytes=1500, seed=0):
+    """Annex-B file of random escaped units (VPS/SPS/PPS then slices), for benchmarks
+
+    Payloads are non-zero except for a few 00 00 0x (x <= 3) runs, which are
+    escaped to 00 00 03 0x as an encoder would.
+    """
+    rng = np.random.default_rng(seed)
+    types = np.where(np.arange(n_units) < 3, 32 + np.arange(n_units), rng.choice([1, 19], size=n_units))
+    with open(path, 'wb') as f:
+        for i, nal_type in enumerate(types):
+            payload = rng.integers(1, 256, size=payload_bytes, dtype=np.uint8)
+            for pos in rng.choice(np.arange(4, payload_bytes - 4, 4), size=4, replace=False):
+                payload[pos:pos + 3] = (0, 0, rng.integers(0, 4))
+            rbsp = bytes([int(nal_type) << 1, 1]) + payload.tobytes()
+            for x in (3, 2, 1, 0):          # 03 first, so inserted EPBs are not escaped again
+                rbsp = rbsp.replace(bytes([0, 0, x]), bytes([0, 0, EMULATION_PREVENTION, x]))
+            f.write((LONG_START_CODE if i < 3 or i % 8 == 0 else START_CODE) + rbsp)
+
+
+if __name__ == "__main__":
+    print("📡 NAL Unit Scanner Demo")
+    print("=" * 50)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'capture.h265')
+        write_synthetic_stream(path, 20000)
+        size_mb = os.path.getsize(path) / 1e6
+
+        start = time.perf_counter()
+        with NALIndex(path) as index:
+            elapsed = time.perf_counter() - start
+            counts = np.bincount(index.types, minlength=64)
+            rbsp_bytes = sum(len(index.rbsp(i)) for i in range(len(index)))
+
+            print(f"  File: {size_mb:.1f} MB, {len(index)} NAL units, {len(index.epb)} emulation-prevention bytes")
+            print(f"  Types: " + ", ".join(f"{t}: {c}" for t, c in enumerate(counts) if c))
+            print(f"  RBSP bytes: {rbsp_bytes}")
+            print(f"  Index time: {elapsed * 1000:.1f} ms ({size_mb / elapsed:.0f} MB/s)")
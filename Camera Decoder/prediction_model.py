@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+"""
+Block-Parallel Golden Model of PredictionModule
+IntraPrediction evaluated for every block of an anti-diagonal wavefront at once,
+InterPrediction as gathers on the reference frame, ModeSelector per block
+"""
+
+import time
+import numpy as np
+
+from reconstruction_model import block_combine
+
+# PredictionModule / camera_decoder parameters
+BLOCK_SIZE = 8
+WIDTH = 640
+HEIGHT = 480
+
+# ModeSelector pred_mode / IntraPrediction intra_mode encodings
+PRED_INTRA = 0x00
+PRED_INTER = 0x01
+INTRA_DC = 0x00
+INTRA_PLANAR = 0x01
+DEFAULT_VAL = 128
+
+# RTL register widths that wrap
+SUM_BITS = 9          # DC sum, planar hor/ver terms
+COUNT_BITS = 3        # DC neighbour count
+RTL_NEIGHBOURS = 4    # IntraPrediction sums 4 top / 4 left neighbours
+INTERP_BITS = 11      # interpolate() weighted terms
+LEFT_PORT_BITS = 2    # PredictionModule left_pixels is declared [7:8]
+MV_BITS = 9
+BASE_BITS = 11        # InterPrediction base_x / base_y
+
+
+def mode_selector(pred_mode):
+    """ModeSelector: (prediction_mode, mode_valid); unknown modes fall back to intra"""
+    pred_mode = np.asarray(pred_mode)
+    mode_valid = (pred_mode == PRED_INTRA) | (pred_mode == PRED_INTER)
+    return (pred_mode == PRED_INTER).astype(np.uint8), mode_valid
+
+
+def _wrap_signed(values, bits):
+    half = 1 << (bits - 1)
+    return ((np.asarray(values, dtype=np.int64) + half) & ((1 << bits) - 1)) - half
+
+
+def intra_predict(intra_mode, top, left, top_available, left_available, rtl_arithmetic=True):
+    """IntraPrediction for a batch: (K, S) neighbours -> (K, S, S) uint8
+
+    DC and planar are both evaluated for every block, then selected by
+    intra_mode; any other mode predicts DEFAULT_VAL. With rtl_arithmetic DC
+    averages the first 4 neighbours of each side like the 4x4 RTL, with its
+    9-bit sum and 3-bit count wrapping (both sides count 8 -> 0 and fall back
+    to DEFAULT_VAL, one side is the mean of 4), and the left neighbours arrive
+    through the 2-bit port.
+    """
+    top = np.asarray(top, dtype=np.int64)
+    left = np.asarray(left, dtype=np.int64)
+    size = top.shape[-1]
+    top_available = np.asarray(top_available, dtype=bool)[:, None]
+    left_available = np.asarray(left_available, dtype=bool)[:, None]
+    if rtl_arithmetic:
+        left = left & ((1 << LEFT_PORT_BITS) - 1)
+
+    # DC: mean of the available neighbours
+    span = min(size, RTL_NEIGHBOURS) if rtl_arithmetic else size
+    total = (top[:, :span] * top_available).sum(axis=1) + (left[:, :span] * left_available).sum(axis=1)
+    count = span * (top_available[:, 0].astype(np.int64) + left_available[:, 0])
+    if rtl_arithmetic:
+        total &= (1 << SUM_BITS) - 1
+        count &= (1 << COUNT_BITS) - 1
+    dc = np.where(count > 0, total // np.maximum(count, 1), DEFAULT_VAL) & 0xFF
+
+    # Planar: hor/ver ramps towards top[S-1] and left[S-1]
+    pos = np.arange(size)
+    hor = (size - 1 - pos)[None, None, :] * left[:, :, None] + (pos + 1)[None, None, :] * top[:, None, -1:]
+    ver = (size - 1 - pos)[None, :, None] * top[:, None, :] + (pos + 1)[None, :, None] * left[:, None, -1:]
+    if rtl_arithmetic:
+        hor &= (1 << SUM_BITS) - 1
+        ver &= (1 << SUM_BITS) - 1
+    planar = ((hor + ver + size) >> (size.bit_length())) & 0xFF
+    both = (top_available & left_available)[:, :, None]
+    planar = np.where(both, planar, dc[:, None, None])
+
+    intra_mode = np.asarray(intra_mode)[:, None, None]
+    block = np.select([intra_mode == INTRA_DC, intra_mode == INTRA_PLANAR],
+                      [np.broadcast_to(dc[:, None, None], planar.shape), planar], default=DEFAULT_VAL)
+    return block.astype(np.uint8)
+
+
+def interpolate(p00, p01, p10, p11, frac_x, frac_y, rtl_arithmetic=True):
+    """InterPrediction interpolate(): quarter-pel bilinear, (a + b + c + d + 8) >> 4"""
+    fx = np.asarray(frac_x, dtype=np.int64)
+    fy = np.asarray(frac_y, dtype=np.int64)
+    terms = [(4 - fx) * (4 - fy) * p00, fx * (4 - fy) * p01, (4 - fx) * fy * p10, fx * fy * p11]
+    if rtl_arithmetic:
+        terms = [t & ((1 << INTERP_BITS) - 1) for t in terms]
+    return ((terms[0] + terms[1] + terms[2] + terms[3] + 8) >> 4) & 0xFF
+
+
+def inter_predict(ref_frame, pos_x, pos_y, mv_x, mv_y, block_size=BLOCK_SIZE, rtl_arithmetic=True):
+    """InterPrediction for K blocks at (pos_x, pos_y) as gathers on a full reference frame
+
+    The RTL clamps the integer sample position so that idx + 1 stays inside its
+    reference window; on a whole frame that is [0, W - 2] x [0, H - 2]. Its
+    base_x = pos_x + x + (mv_x >> 2) is an unsigned expression (pos_x is), so
+    with rtl_arithmetic the MV is zero-extended before the shift (-4 moves
+    +127) and the sum wraps to 11 bits signed; otherwise the shift is
+    arithmetic.
+    """
+    ref = np.asarray(ref_frame, dtype=np.int64)
+    height, width = ref.shape
+    mv_x = _wrap_signed(mv_x, MV_BITS)
+    mv_y = _wrap_signed(mv_y, MV_BITS)
+    offsets = np.arange(block_size)
+    if rtl_arithmetic:
+        step_x = (mv_x & ((1 << MV_BITS) - 1)) >> 2
+        step_y = (mv_y & ((1 << MV_BITS) - 1)) >> 2
+    else:
+        step_x, step_y = mv_x >> 2, mv_y >> 2
+
+    base_x = np.asarray(pos_x)[:, None] + offsets + step_x[:, None]
+    base_y = np.asarray(pos_y)[:, None] + offsets + step_y[:, None]
+    if rtl_arithmetic:
+        base_x = _wrap_signed(base_x, BASE_BITS)
+        base_y = _wrap_signed(base_y, BASE_BITS)
+    xs = np.clip(base_x, 0, width - 2)
+    ys = np.clip(base_y, 0, height - 2)
+    flat = (ys[:, :, None] * width + xs[:, None, :])            # (K, S, S) top-left samples
+    ref_flat = ref.reshape(-1)
+    frac_x = (mv_x & 3)[:, None, None]
+    frac_y = (mv_y & 3)[:, None, None]
+    block = interpolate(ref_flat[flat], ref_flat[flat + 1], ref_flat[flat + width], ref_flat[flat + width + 1],
+                        frac_x, frac_y, rtl_arithmetic)
+    return block.astype(np.uint8)
+
+
+def wavefronts(blocks_x, blocks_y):
+    """Block indices grouped by anti-diagonal bx + by (top/left dependencies only)"""
+    by, bx = np.divmod(np.arange(blocks_x * blocks_y), blocks_x)
+    diagonal = bx + by
+    order = np.argsort(diagonal, kind='stable')
+    bounds = np.cumsum(np.bincount(diagonal, minlength=blocks_x + blocks_y - 1))[:-1]
+    return np.split(order, bounds)
+
+
+class PredictionModel:
+    """PredictionModule over whole frames
+
+    Inter blocks only read the reference frame, so they are predicted and
+    reconstructed in one gather. Intra blocks read the reconstructed row above
+    and column to the left, so blocks on the same anti-diagonal are
+    independent: each wavefront is one vectorized intra_predict call.
+    Reconstruction is block_combiner's clip(P + R, 0, 255).
+    """
+
+    def __init__(self, width=WIDTH, height=HEIGHT, block_size=BLOCK_SIZE, rtl_arithmetic=True):
+        if width % block_size or height % block_size:
+            raise ValueError(f"Frame {width}x{height} is not a multiple of the {block_size}x{block_size} block")
+        self.width = width
+        self.height = height
+        self.block_size = block_size
+        self.rtl_arithmetic = rtl_arithmetic
+        self.blocks_x = width // block_size
+        self.blocks_y = height // block_size
+        self.wavefronts = wavefronts(self.blocks_x, self.blocks_y)
+
+    def _blocks(self, frame):
+        """(H, W) view as (blocks, S, S) in raster block order"""
+        s = self.block_size
+        return frame.reshape(self.blocks_y, s, self.blocks_x, s).swapaxes(1, 2).reshape(-1, s, s)
+
+    def _store(self, frame, index, blocks):
+        """Write (K, S, S) blocks back at raster block indices"""
+        s = self.block_size
+        view = frame.reshape(self.blocks_y, s, self.blocks_x, s).swapaxes(1, 2)
+        by, bx = np.divmod(index, self.blocks_x)
+        view[by, bx] = blocks
+
+    def decode_frame(self, pred_mode, intra_mode, mv_x, mv_y, residual=None, ref_frame=None, y_offset=0):
+        """Predict and reconstruct one frame
+
+        pred_mode, intra_mode, mv_x, mv_y are per block (blocks_y, blocks_x);
+        residual is (H, W) signed. Returns (reconstructed, predicted,
+        error_flag) with error_flag per block. A model sized to a slice band
+        passes the band's first row as y_offset, so inter blocks address the
+        full reference frame.
+        """
+        s = self.block_size
+        nblocks = self.blocks_x * self.blocks_y
+        prediction_mode, mode_valid = mode_selector(np.asarray(pred_mode).reshape(nblocks))
+        intra_mode = np.asarray(intra_mode).reshape(nblocks)
+        residual = np.zeros((self.height, self.width), dtype=np.int16) if residual is None else residual
+        residual_blocks = self._blocks(np.asarray(residual, dtype=np.int16))
+
+        recon = np.zeros((self.height, self.width), dtype=np.uint8)
+        predicted = np.zeros((self.height, self.width), dtype=np.uint8)
+        by, bx = np.divmod(np.arange(nblocks), self.blocks_x)
+
+        inter = np.flatnonzero(prediction_mode == 1)
+        if len(inter):
+            if ref_frame is None:
+                raise ValueError("Inter blocks need a reference frame")
+            blocks = inter_predict(ref_frame, bx[inter] * s, by[inter] * s + y_offset,
+                                   np.asarray(mv_x).reshape(nblocks)[inter],
+                                   np.asarray(mv_y).reshape(nblocks)[inter], s, self.rtl_arithmetic)
+            self._store(predicted, inter, blocks)
+            self._store(recon, inter, self._combine(blocks, residual_blocks[inter]))
+
+        is_intra = prediction_mode == 0
+        offsets = np.arange(s)
+        for front in self.wavefronts:
+            front = front[is_intra[front]]
+            if len(front) == 0:
+                continue
+            fy, fx = by[front] * s, bx[front] * s
+            # Neighbours from the reconstructed frame (clamped reads, masked by availability)
+            top = recon[np.maximum(fy - 1, 0)[:, None], fx[:, None] + offsets]
+            left = recon[fy[:, None] + offsets, np.maximum(fx - 1, 0)[:, None]]
+            blocks = intra_predict(intra_mode[front], top, left, by[front] > 0, bx[front] > 0, self.rtl_arithmetic)
+            self._store(predicted, front, blocks)
+            self._store(recon, front, self._combine(blocks, residual_blocks[front]))
+
+        return recon, predicted, ~mode_valid.reshape(self.blocks_y, self.blocks_x)
+
+    __call__ = decode_frame
+
+    @staticmethod
+    def _combine(blocks, residual):
+        """block_combiner: clip(P + R, 0, 255)"""
+        return block_combine(blocks, residual, rtl_arithmetic=False)
+
+
+if __name__ == "__main__":
+    print("🧭 PredictionModule Wavefront Model Demo")
+    print("=" * 50)
+
+    rng = np.random.default_rng(0)
+    model = PredictionModel()
+    shape = (model.blocks_y, model.blocks_x)
+    ref_frame = rng.integers(0, 256, size=(HEIGHT, WIDTH), dtype=np.uint8)
+    pred_mode = rng.choice([PRED_INTRA, PRED_INTER], size=shape, p=[0.3, 0.7])
+    intra_mode = rng.integers(0, 3, size=shape)
+    mv_x = rng.integers(-64, 64, size=shape)
+    mv_y = rng.integers(-64, 64, size=shape)
+    residual = rng.integers(-8, 9, size=(HEIGHT, WIDTH), dtype=np.int16)
+
+    start = time.perf_counter()
+    recon, predicted, errors = model.decode_frame(pred_mode, intra_mode, mv_x, mv_y, residual, ref_frame)
+    elapsed = time.perf_counter() - start
+
+    print(f"  Frame: {WIDTH}x{HEIGHT}, {shape[0] * shape[1]} blocks in {len(model.wavefronts)} wavefronts")
+    print(f"  Intra blocks: {int((pred_mode == PRED_INTRA).sum())}, inter blocks: {int((pred_mode == PRED_INTER).sum())}")
+    print(f"  Time: {elapsed * 1000:.1f} ms/frame")
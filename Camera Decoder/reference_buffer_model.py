@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+"""
+Reference-Picture Buffer Model of frame_buffer_manager
+NUM_FRAMES slots with pluggable eviction (FIFO, LRU or a callable), long-term
+pinning and per-GOP reference/miss counts, for buffer-depth sizing
+"""
+
+import time
+import numpy as np
+
+# frame_buffer_manager / camera_decoder parameters
+WIDTH = 640
+HEIGHT = 480
+NUM_FRAMES = 4
+
+EVICTION_POLICIES = ('fifo', 'lru')
+SLICE_TYPES = ('I', 'P', 'B')
+
+
+def frame_bytes(width=WIDTH, height=HEIGHT):
+    """On-chip bytes per reference picture: dpb_Y plus the 4:2:0 dpb_U/dpb_V planes"""
+    return width * height + 2 * (width // 2) * (height // 2)
+
+
+class ReferenceBuffer:
+    """frame_buffer_manager as a reference-picture buffer
+
+    insert() fills free slots in index order, then evicts: 'fifo' replaces
+    the oldest insertion (frame_buffer_manager's circular write_ptr), 'lru'
+    the least recently referenced picture. A callable policy gets
+    (buffer, candidate_slots) and returns the slot to evict. Long-term
+    pictures are pinned and only evicted (oldest first) when every slot is
+    pinned; beyond max_long_term the oldest one is demoted to short-term.
+
+    reference() records a hit or miss in the current GOP; start_gop() opens
+    the next one. With width/height set, slots also hold the pixels.
+    """
+
+    def __init__(self, depth=NUM_FRAMES, policy='fifo', max_long_term=1, width=None, height=None):
+        if depth < 1:
+            raise ValueError(f"Buffer depth must be >= 1, got {depth}")
+        if max_long_term < 0:
+            raise ValueError(f"max_long_term must be >= 0, got {max_long_term}")
+        if not callable(policy) and policy not in EVICTION_POLICIES:
+            raise ValueError(f"Unknown eviction policy '{policy}' (expected one of {EVICTION_POLICIES} or a callable)")
+        self.depth = depth
+        self.policy = policy
+        self.max_long_term = max_long_term
+        self.frames = np.zeros((depth, height, width), dtype=np.uint8) if width and height else None
+        self.reset()
+
+    def reset(self):
+        """reset_n: empty every slot and clear the statistics"""
+        self.poc = [None] * self.depth
+        self.inserted = [0] * self.depth
+        self.last_used = [0] * self.depth
+        self.long_term = [False] * self.depth
+        self._slot_of = {}
+        self._clock = 0
+        self.evictions = 0
+        self.gops = []
+        if self.frames is not None:
+            self.frames[...] = 0
+
+    def __contains__(self, poc):
+        return poc in self._slot_of
+
+    def __len__(self):
+        return len(self._slot_of)
+
+    def _victim(self):
+        candidates = [i for i in range(self.depth) if not self.long_term[i]]
+        if not candidates:
+            return min(range(self.depth), key=self.inserted.__getitem__)
+        if callable(self.policy):
+            return self.policy(self, candidates)
+        key = self.inserted if self.policy == 'fifo' else self.last_used
+        return min(candidates, key=key.__getitem__)
+
+    def insert(self, poc, frame=None, long_term=False):
+        """Store a decoded picture; returns the slot it went to"""
+        self._clock += 1
+        if poc in self._slot_of:
+            slot = self._slot_of[poc]
+        elif len(self._slot_of) < self.depth:
+            slot = self.poc.index(None)
+        else:
+            slot = self._victim()
+            del self._slot_of[self.poc[slot]]
+            self.evictions += 1
+        self.poc[slot] = poc
+        self.inserted[slot] = self.last_used[slot] = self._clock
+        self.long_term[slot] = False
+        self._slot_of[poc] = slot
+        if long_term:
+            self.pin(poc)
+        if self.frames is not None and frame is not None:
+            self.frames[slot] = frame
+        return slot
+
+    def pin(self, poc):
+        """Mark a picture long-term; the oldest long-term picture past max_long_term is demoted
+
+        With max_long_term=0 nothing stays pinned: the picture itself is demoted.
+        """
+        slot = self._slot_of[poc]
+        self.long_term[slot] = True
+        pinned = [i for i in range(self.depth) if self.long_term[i]]
+        while len(pinned) > self.max_long_term:
+            others = [i for i in pinned if i != slot]
+            oldest = min(others, key=self.inserted.__getitem__) if others else slot
+            self.long_term[oldest] = False
+            pinned.remove(oldest)
+
+    def unpin(self, poc):
+        self.long_term[self._slot_of[poc]] = False
+
+    def start_gop(self):
+        self.gops.append({'frames': 0, 'references': 0, 'misses': 0})
+
+    def reference(self, poc):
+        """Inter prediction from picture poc; returns its slot, or None on a miss"""
+        if not self.gops:
+            self.start_gop()
+        gop = self.gops[-1]
+        gop['references'] += 1
+        self._clock += 1
+        slot = self._slot_of.get(poc)
+        if slot is None:
+            gop['misses'] += 1
+            return None
+        self.last_used[slot] = self._clock
+        return slot
+
+    def replay(self, trace):
+        """Run a decode-order trace of (poc, slice_type, ref_pocs, long_term); returns the report"""
+        for poc, slice_type, refs, long_term in trace:
+            if slice_type == 'I' or not self.gops:
+                self.start_gop()
+            for ref in refs:
+                self.reference(ref)
+            self.gops[-1]['frames'] += 1
+            self.insert(poc, long_term=long_term)
+        return self.report()
+
+    def report(self):
+        references = sum(g['references'] for g in self.gops)
+        misses = sum(g['misses'] for g in self.gops)
+        return {
+            'policy': self.policy if isinstance(self.policy, str) else getattr(self.policy, '__name__', 'custom'),
+            'depth': self.depth,
+            'references': references,
+            'misses': misses,
+            'hit_rate': 1.0 - misses / references if references else 1.0,
+            'evictions': self.evictions,
+            'gop_misses': [g['misses'] for g in self.gops],
+            'memory_bytes': self.depth * frame_bytes(*(self.frames.shape[:0:-1] if self.frames is not None
+                                                       else (WIDTH, HEIGHT)))
+        }
+
+
+def _hierarchical(lo, hi):
+    """B pictures between two anchors in decode order, each referencing its enclosing pair"""
+    if hi - lo < 2:
+        return []
+    mid = (lo + hi) // 2
+    return [(mid, [lo, hi])] + _hierarchical(lo, mid) + _hierarchical(mid, hi)
+
+
+def gop_trace(frames, structure='ipp', gop=8, intra_period=32, num_refs=2, long_term_interval=0):
+    """Synthetic decode-order trace of (poc, slice_type, ref_pocs, long_term)
+
+    'ipp': P pictures reference the num_refs previous pictures.
+    'hierarchical': anchors every gop pictures (P from the previous anchor),
+    with dyadic B pictures in between. Pictures at poc % intra_period == 0
+    are I. With long_term_interval, those I pictures become long-term and
+    every later P/B picture also references the current long-term picture
+    (a static background reference).
+    """
+    if structure not in ('ipp', 'hierarchical'):
+        raise ValueError(f"Unknown GOP structure '{structure}' (expected 'ipp' or 'hierarchical')")
+    if structure == 'ipp':
+        order = [(poc, list(range(max(poc - num_refs, 0), poc))[::-1]) for poc in range(frames)]
+    else:
+        order, prev = [(0, [])], 0
+        for anchor in range(gop, frames - 1 + gop, gop):
+            anchor = min(anchor, frames - 1)
+            order.append((anchor, [prev]))
+            order.extend(_hierarchical(prev, anchor))
+            prev = anchor
+
+    trace, long_term_poc = [], None
+    for poc, refs in order:
+        if poc % intra_period == 0:
+            is_long_term = bool(long_term_interval) and poc % long_term_interval == 0
+            trace.append((poc, 'I', [], is_long_term))
+            if is_long_term:
+                long_term_poc = poc
+            continue
+        refs = list(refs)
+        if long_term_poc is not None and long_term_poc not in refs:
+            refs.append(long_term_poc)
+        trace.append((poc, 'B' if structure == 'hierarchical' and poc % gop else 'P', refs, False))
+    return trace
+
+
+def read_trace(path):
+    """Trace from a text file: one picture per line, `poc type [ref ...] [L]`, in decode order
+
+    Lines starting with # are ignored; a trailing L marks a long-term picture.
+    """
+    trace = []
+    with open(path) as f:
+        for line in f:
+            fields = line.split('#', 1)[0].split()
+            if not fields:
+                continue
+            long_term = fields[-1] == 'L'
+            if long_term:
+                fields = fields[:-1]
+            if fields[1] not in SLICE_TYPES:
+                raise ValueError(f"Unknown slice type '{fields[1]}' in trace line: {line.strip()}")
+            trace.append((int(fields[0]), fields[1], [int(r) for r in fields[2:]], long_term))
+    return trace
+
+
+def depth_sweep(trace, depths=range(1, 9), policies=EVICTION_POLICIES, **kwargs):
+    """Replay a trace at each buffer depth and policy; one report per combination"""
+    return [ReferenceBuffer(depth, policy, **kwargs).replay(trace) for policy in policies for depth in depths]
+
+
+if __name__ == "__main__":
+    print("🗂️ Reference-Picture Buffer Model Demo")
+    print("=" * 50)
+
+    traces = {
+        'IPP, 2 refs': gop_trace(960, 'ipp', num_refs=2),
+        'IPP + long-term': gop_trace(960, 'ipp', num_refs=2, intra_period=64, long_term_interval=64),
+        'Hierarchical-B GOP 8': gop_trace(960, 'hierarchical', gop=8),
+    }
+    for name, trace in traces.items():
+        start = time.perf_counter()
+        reports = depth_sweep(trace)
+        elapsed = time.perf_counter() - start
+        print(f"  {name} ({len(trace)} pictures, {elapsed * 1000:.0f} ms):")
+        for policy in EVICTION_POLICIES:
+            rates = " ".join(f"{r['hit_rate'] * 100:5.1f}" for r in reports if r['policy'] == policy)
+            print(f"    {policy:4s} hit % at depth 1-8: {rates}")
+    print(f"  Memory per picture: {frame_bytes() / 1024:.0f} KiB ({WIDTH}x{HEIGHT} 4:2:0)")
@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+Full-Frame Golden Model of HW-Accelerated YUV2RGB
+matrix_multiplier (Q8.8 BT.601) -> hardware_optimizer -> output_formatter,
+with a per-channel lookup-table fast path and 4:2:0 chroma upsampling
+"""
+
+import time
+import numpy as np
+
+# camera_decoder frame size
+WIDTH = 640
+HEIGHT = 480
+
+# matrix_multiplier parameters (parameter int, so 16'hFF58 is +65368, not -168)
+C13 = 0x0166   # ~1.402
+C22 = 0xFF58   # ~-0.344 intended
+C23 = 0xFF49   # ~-0.714 intended
+C32 = 0x01C5   # ~1.772
+
+PIXELS_PER_PACKET = 128   # output_formatter pixel_buffer depth (128 x 24 bits = 3072)
+
+PROD_MASK = (1 << 25) - 1
+TEMP_MASK = (1 << 24) - 1
+
+
+def _term(diff, coeff):
+    """(prod >>> 8) as evaluated in the RTL: 25-bit product, shifted in an unsigned context"""
+    prod = diff * np.int32(coeff - (1 << 32) if coeff >= (1 << 31) else coeff)
+    return (prod & PROD_MASK) >> 8
+
+
+def _saturate(temp):
+    """R/G/B = temp[23] ? 0 : temp[15:8] (the > 255 compare is on 8 bits and never fires)"""
+    temp &= TEMP_MASK
+    return np.where(temp >> 23, 0, (temp >> 8) & 0xFF).astype(np.uint8)
+
+
+def matrix_multiply(Y, U, V, c13=C13, c22=C22, c23=C23, c32=C32):
+    """Per-pixel matrix_multiplier arithmetic, returns (R, G, B) uint8 arrays
+
+    Y << 8 is unsigned, so every sum is unsigned and `>>>` on the signed
+    products is a logical shift. The shifted terms are below 2^17, temp[23]
+    never sets, and the channels wrap modulo 256 instead of clamping.
+    """
+    Y = np.asarray(Y, dtype=np.int32)
+    u_diff = np.asarray(U, dtype=np.int32) - 128
+    v_diff = np.asarray(V, dtype=np.int32) - 128
+    y = Y << 8
+
+    R = _saturate(y + _term(v_diff, c13))
+    G = _saturate(y + _term(u_diff, c22) + _term(v_diff, c23))
+    B = _saturate(y + _term(u_diff, c32))
+    return R, G, B
+
+
+def pack_packets(pixels, rtl_timing=True):
+    """Stream of (N, 3) RGB pixels -> output_formatter 3072-bit data_out ints
+
+    Pixel i of a packet sits at data_out[i*24 +: 24] as {R, G, B}. With
+    rtl_timing the stream is delayed one cycle by hardware_optimizer (the
+    first pixel is its reset value 0) and slot 127 holds the previous
+    packet's last pixel, because data_out reads pixel_buffer before the
+    non-blocking write of that slot lands.
+    """
+    pixels = np.asarray(pixels, dtype=np.uint8).reshape(-1, 3)
+    if rtl_timing:
+        pixels = np.concatenate([np.zeros((1, 3), dtype=np.uint8), pixels[:-1]])
+
+    packets = len(pixels) // PIXELS_PER_PACKET
+    slots = pixels[:packets * PIXELS_PER_PACKET].reshape(packets, PIXELS_PER_PACKET, 3).copy()
+    if rtl_timing and packets:
+        slots[:, -1] = np.concatenate([np.zeros((1, 3), dtype=np.uint8), slots[:-1, -1]])
+
+    raw = slots[..., ::-1].reshape(packets, -1)   # {R, G, B} -> little-endian B, G, R bytes
+    return [int.from_bytes(row.tobytes(), 'little') for row in raw]
+
+
+class YUV2RGBModel:
+    """hw_accelerated_yuv2rgb over whole frames
+
+    Because the RTL channels reduce to (Y + d) mod 256 with d depending only
+    on chroma, the LUT path precomputes d once per channel (R from V, B from
+    U, G from the (U, V) pair) and converts a frame with gathers and uint8
+    adds only. Tables are evaluated with the arithmetic path at Y = 0.
+    """
+
+    def __init__(self, c13=C13, c22=C22, c23=C23, c32=C32, use_lut=True):
+        self.coeffs = (c13, c22, c23, c32)
+        self.use_lut = use_lut
+
+        chroma = np.arange(256, dtype=np.int32)
+        u_grid, v_grid = np.meshgrid(chroma, chroma, indexing='ij')
+        zeros = np.zeros((256, 256), dtype=np.int32)
+        R, G, B = matrix_multiply(zeros, u_grid, v_grid, *self.coeffs)
+
+        self.lut_r = R[0].copy()          # indexed by V
+        self.lut_g = G.reshape(-1)        # indexed by (U << 8) | V
+        self.lut_b = B[:, 0].copy()       # indexed by U
+        # Same tables with each entry in both bytes of a uint16, so a 4:2:0
+        # chroma row gathers straight into a horizontally upsampled row
+        self._lut16 = [t.astype(np.uint16) * np.uint16(0x0101) for t in (self.lut_r, self.lut_g, self.lut_b)]
+        self._buffers = {}
+
+    def _scratch(self, shape, dtype):
+        key = (shape, np.dtype(dtype).str)
+        if key not in self._buffers:
+            self._buffers[key] = np.empty(shape, dtype=dtype)
+        return self._buffers[key]
+
+    def convert(self, Y, U, V, out=None, interleaved=False):
+        """YUV planes -> RGB; U/V are full size (4:4:4) or half size (4:2:0)
+
+        Returns (3, H, W) uint8 planes, or (H, W, 3) with interleaved=True.
+        """
+        Y = np.asarray(Y, dtype=np.uint8)
+        U = np.asarray(U, dtype=np.uint8)
+        V = np.asarray(V, dtype=np.uint8)
+        h, w = Y.shape
+        subsampled = U.shape != Y.shape
+        if subsampled and (h % 2 or w % 2 or U.shape != (h // 2, w // 2) or V.shape != U.shape):
+            raise ValueError(f"Chroma planes {U.shape}/{V.shape} do not match 4:2:0 luma {Y.shape}")
+
+        planes = out if out is not None and not interleaved else self._scratch((3, h, w), np.uint8)
+
+        if not self.use_lut:
+            if subsampled:
+                U = U.repeat(2, axis=0).repeat(2, axis=1)
+                V = V.repeat(2, axis=0).repeat(2, axis=1)
+            planes[0], planes[1], planes[2] = matrix_multiply(Y, U, V, *self.coeffs)
+        elif subsampled:
+            # camera_decoder reads U/V at [rgb_y/2][rgb_x/2]: nearest-neighbour upsampling
+            ch, cw = U.shape
+            index = self._scratch((ch, cw), np.intp)
+            np.left_shift(U, 8, out=index, dtype=np.intp)
+            np.bitwise_or(index, V, out=index)
+            delta = self._scratch((ch, cw), np.uint16)
+            rows = delta.view(np.uint8)[:, None, :]              # (ch, 1, w)
+            luma = Y.reshape(ch, 2, w)
+            for plane, table, idx in zip(planes, self._lut16, (V, index, U)):
+                np.take(table, idx, out=delta)
+                np.add(luma, rows, out=plane.reshape(ch, 2, w))
+        else:
+            np.add(Y, self.lut_r[V], out=planes[0])
+            np.add(Y, self.lut_g[(U.astype(np.intp) << 8) | V], out=planes[1])
+            np.add(Y, self.lut_b[U], out=planes[2])
+
+        if interleaved:
+            rgb = out if out is not None else np.empty((h, w, 3), dtype=np.uint8)
+            np.copyto(rgb, planes.transpose(1, 2, 0))
+            return rgb
+        return planes if out is not None else planes.copy()
+
+    __call__ = convert
+
+    def convert_to_packets(self, Y, U, V, rtl_timing=True):
+        """Full frame through output_formatter, raster order as in CONVERT_RGB"""
+        rgb = self.convert(Y, U, V, interleaved=True)
+        return pack_packets(rgb.reshape(-1, 3), rtl_timing=rtl_timing)
+
+
+if __name__ == "__main__":
+    print("🎨 HW-Accelerated YUV2RGB Golden Model Demo")
+    print("=" * 50)
+
+    rng = np.random.default_rng(0)
+    Y = rng.integers(0, 256, size=(HEIGHT, WIDTH), dtype=np.uint8)
+    U = rng.integers(0, 256, size=(HEIGHT // 2, WIDTH // 2), dtype=np.uint8)
+    V = rng.integers(0, 256, size=(HEIGHT // 2, WIDTH // 2), dtype=np.uint8)
+
+    model = YUV2RGBModel()
+    planes = np.empty((3, HEIGHT, WIDTH), dtype=np.uint8)
+    model.convert(Y, U, V, out=planes)
+
+    runs = 200
+    start = time.perf_counter()
+    for _ in range(runs):
+        model.convert(Y, U, V, out=planes)
+    lut_time = (time.perf_counter() - start) / runs
+
+    start = time.perf_counter()
+    reference = YUV2RGBModel(use_lut=False).convert(Y, U, V)
+    direct_time = time.perf_counter() - start
+
+    print(f"  Frame: {WIDTH}x{HEIGHT} 4:2:0")
+    print(f"  LUT path:        {lut_time * 1000:.3f} ms/frame")
+    print(f"  Arithmetic path: {direct_time * 1000:.3f} ms/frame")
+    print(f"  Match: {np.array_equal(planes, reference)}")
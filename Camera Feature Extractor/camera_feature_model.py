@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+End-to-End Camera_Feature_Extractor Pipeline Model
+Convolutional_Layer -> ReLU/quantize -> MaxPoolingModule -> fixed-point BatchNorm,
+batched over frames with preallocated intermediate buffers
+"""
+
+import time
+import numpy as np
+
+from conv_layer_model import ConvLayerModel, H, W, C, F, K
+
+# MaxPoolingModule defaults (H = W = 4, 32 channels of INT8)
+POOL_H = 4
+POOL_W = 4
+CHANNELS = 32
+
+# BatchNorm parameters as initialised in MultiSensorFusionSystem.v
+BN_GAMMA = 1
+BN_BETA = 0
+BN_MEAN = 0
+BN_VARIANCE = 1
+BN_EPSILON = 1
+BN_INV_STD = 64          # Camera_Feature_Extractor uses a constant inv_std (LUT placeholder)
+
+
+def prepare_images(frames):
+    """Block-average (N, h, w[, 3]) uint8 frames down to (N, 16, 8, 3) int8 input images"""
+    frames = np.asarray(frames)
+    if frames.ndim == 3:
+        frames = np.repeat(frames[..., None], C, axis=-1)
+    n, h, w = frames.shape[:3]
+    bh, bw = h // H, w // W
+    cropped = frames[:, :bh * H, :bw * W, :C].astype(np.float32)
+    blocks = cropped.reshape(n, H, bh, W, bw, C).mean(axis=(2, 4))
+    return (np.rint(blocks) - 128).astype(np.int8)
+
+
+def pack_features(features):
+    """(B, 32) int8 -> 256-bit feature_vector ints (channel 0 = LSBs)"""
+    raw = np.ascontiguousarray(features, dtype=np.int8)
+    return [int.from_bytes(row.tobytes(), 'little') for row in raw]
+
+
+class CameraFeaturePipeline:
+    """Camera_Feature_Extractor model: conv -> ReLU/quant -> max pool -> BatchNorm
+
+    The stages follow the RTL bit layout: conv outputs are flattened in
+    output_feature_map order, ReLU keeps the low byte and quantization clamps
+    it to 127, and MaxPoolingModule reads the first POOL_H * POOL_W pixels
+    of 32 bytes from that stream. BatchNorm uses the 16-bit wrapping
+    (x - mean) * inv_std * gamma, bits [13:6], + beta.
+
+    rtl_arithmetic=True keeps the RTL's ReLU test: conv_output[i*16 +: 16]
+    is an unsigned part-select, so `> 0` holds for every nonzero value and
+    negative accumulators pass their low byte too. rtl_arithmetic=False is
+    the intended signed ReLU.
+    """
+
+    def __init__(self, conv=None, pool_h=POOL_H, pool_w=POOL_W,
+                 gamma=BN_GAMMA, beta=BN_BETA, mean=BN_MEAN,
+                 variance=BN_VARIANCE, epsilon=BN_EPSILON, batch_size=1024, rtl_arithmetic=True):
+        self.conv = conv if conv is not None else ConvLayerModel()
+        self.pool_h = pool_h
+        self.pool_w = pool_w
+        if pool_h * pool_w * CHANNELS > H * W * F:
+            raise ValueError(f"MaxPoolingModule {pool_h}x{pool_w} needs more bytes than the conv map provides")
+
+        self.gamma = np.broadcast_to(np.asarray(gamma, dtype=np.int32), (CHANNELS,))
+        self.beta = np.broadcast_to(np.asarray(beta, dtype=np.int32), (CHANNELS,))
+        self.mean = np.broadcast_to(np.asarray(mean, dtype=np.int32), (CHANNELS,))
+        self.variance = np.broadcast_to(np.asarray(variance, dtype=np.int32), (CHANNELS,))
+        self.epsilon = epsilon
+        self.inv_std = BN_INV_STD
+        self.batch_size = batch_size
+        self.rtl_arithmetic = rtl_arithmetic
+        self._alloc(batch_size)
+
+    def _alloc(self, batch):
+        """Intermediate buffers, reused for every batch of this size"""
+        self._batch = batch
+        self._patches = np.empty((batch * H * W, C * K * K), dtype=np.float32)
+        self._sums = np.empty((batch * H * W, F), dtype=np.float32)
+        self._acc = np.empty((batch * H * W, F), dtype=np.int32)
+        self._act = np.empty((batch * H * W, F), dtype=np.int32)
+        self._pos = np.empty((batch * H * W, F), dtype=bool)
+        self._pooled = np.empty((batch, CHANNELS), dtype=np.int32)
+        self._bn = np.empty((batch, CHANNELS), dtype=np.int32)
+
+    def run(self, images, out=None):
+        """(B, 16, 8, 3) int8 images -> (B, 32) int8 feature vectors"""
+        images = np.asarray(images).reshape(-1, H, W, C)
+        batch = len(images)
+        if batch != self._batch:
+            self._alloc(batch)
+        if out is None:
+            out = np.empty((batch, CHANNELS), dtype=np.int8)
+
+        # Convolution: im2col + matmul, 16-bit wraparound, bias and int16 saturation
+        self.conv.im2col(images, out=self._patches)
+        np.matmul(self._patches, self.conv.kernel, out=self._sums)
+        acc = self._acc
+        acc[...] = self._sums                          # exact integers, cast in place
+        acc += 32768
+        acc &= 0xFFFF
+        acc -= 32768
+        acc += self.conv.biases.astype(np.int32)
+        np.clip(acc, -32768, 32767, out=acc)
+
+        # ReLU keeps conv[7:0] (of nonzero values as written, of positive ones as intended),
+        # quantization clamps to 127
+        act = self._act
+        np.bitwise_and(acc, 0xFF, out=act)
+        np.minimum(act, 127, out=act)
+        if not self.rtl_arithmetic:
+            np.greater(acc, 0, out=self._pos)
+            act *= self._pos
+
+        # MaxPoolingModule: first pool_h * pool_w pixels of 32 channels in the flat byte stream
+        flat = act.reshape(batch, H * W * F)
+        window = flat[:, :self.pool_h * self.pool_w * CHANNELS].reshape(batch, self.pool_h * self.pool_w, CHANNELS)
+        np.max(window, axis=1, out=self._pooled)
+
+        # BatchNorm in the RTL's 16-bit fixed point
+        bn = self._bn
+        np.subtract(self._pooled, self.mean, out=bn)
+        bn *= self.inv_std
+        bn &= 0xFFFF
+        bn *= self.gamma
+        bn >>= 6
+        bn &= 0xFF
+        bn += self.beta
+        bn &= 0xFF
+        np.copyto(out.view(np.uint8), bn, casting='unsafe')
+        return out
+
+    __call__ = run
+
+    def run_sequence(self, images):
+        """Feature vectors for every frame of a sequence, (N, 32) int8"""
+        images = np.asarray(images).reshape(-1, H, W, C)
+        features = np.empty((len(images), CHANNELS), dtype=np.int8)
+        for lo in range(0, len(images), self.batch_size):
+            chunk = images[lo:lo + self.batch_size]
+            self.run(chunk, out=features[lo:lo + len(chunk)])
+        return features
+
+
+if __name__ == "__main__":
+    print("📷 Camera_Feature_Extractor Pipeline Demo")
+    print("=" * 50)
+
+    rng = np.random.default_rng(0)
+    conv = ConvLayerModel(weights=rng.integers(-4, 5, size=(F, C, K, K)),
+                          biases=rng.integers(-64, 64, size=F))
+    pipeline = CameraFeaturePipeline(conv)
+
+    # KITTI-sized sequence (sequence 01 has 1101 frames of 1242x375, here at 1/8 scale)
+    frames = rng.integers(0, 256, size=(1101, 375 // 8, 1242 // 8), dtype=np.uint8)
+    images = prepare_images(frames)
+
+    start = time.perf_counter()
+    features = pipeline.run_sequence(images)
+    elapsed = time.perf_counter() - start
+
+    print(f"  Frames: {len(images)} -> features {features.shape}")
+    print(f"  Time: {elapsed * 1000:.1f} ms ({len(images) / elapsed:.0f} frames/s)")
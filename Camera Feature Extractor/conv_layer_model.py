@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Batched Golden Model of Convolutional_Layer
+im2col (sliding_window_view) + one integer matmul over B images,
+bit-exact with the 16-bit partial sums and bias saturation of the RTL
+"""
+
+import time
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+# Convolutional_Layer localparams
+H = 16   # Image height
+W = 8    # Image width
+C = 3    # Input channels
+F = 16   # Filters
+K = 3    # Kernel size
+P = 1    # Padding
+
+INT16_MIN, INT16_MAX = -(1 << 15), (1 << 15) - 1
+
+
+def unpack_images(words):
+    """3072-bit input_image ints -> (B, H, W, C) int8 (byte (i*W*C + j*C + k) = pixel)"""
+    nbytes = H * W * C
+    blob = b''.join(int(w).to_bytes(nbytes, 'little') for w in words)
+    return np.frombuffer(blob, dtype=np.int8).reshape(-1, H, W, C)
+
+
+def pack_feature_maps(fmap):
+    """(B, H, W, F) int16 -> 32768-bit output_feature_map ints"""
+    raw = np.ascontiguousarray(fmap, dtype='<i2').reshape(len(fmap), -1)
+    return [int.from_bytes(row.tobytes(), 'little') for row in raw]
+
+
+def wrap16(values):
+    """Two's complement wraparound to int16"""
+    return ((np.asarray(values, dtype=np.int64) + 32768) & 0xFFFF) - 32768
+
+
+class ConvLayerModel:
+    """Convolutional_Layer: 3x3 kernel, padding 1, INT8 x INT8 products, INT16 partial sums
+
+    rtl_schedule=True reproduces the RTL FSM as written: the accumulator is
+    restarted per filter iteration and only sees channel `filter % C`, the bias
+    stage samples it one tap early (tap (2,2) is dropped), and feature_map keeps
+    the final_sum of the last-but-one iteration, so every output comes from
+    channel (F-2) % C. rtl_schedule=False is the intended 3-channel convolution
+    with the same 16-bit wraparound and bias saturation.
+    """
+
+    def __init__(self, weights=None, biases=None, rtl_schedule=True):
+        # RTL initial block: all weights 8'h01, biases 0
+        weights = np.ones((F, C, K, K), dtype=np.int64) if weights is None else weights
+        biases = np.zeros(F, dtype=np.int64) if biases is None else biases
+        self.weights = np.asarray(weights, dtype=np.int64).reshape(F, C, K, K)
+        self.biases = np.asarray(biases, dtype=np.int64).reshape(F)
+        self.rtl_schedule = rtl_schedule
+
+        taps = np.ones((C, K, K), dtype=bool)
+        if rtl_schedule:
+            taps[:] = False
+            taps[(F - 2) % C] = True
+            taps[:, K - 1, K - 1] = False
+        # Kernel laid out to match the (C, K, K) order of the im2col windows, masked taps zeroed
+        # Products are <= 2^14 and at most 27 are summed, so float32 is exact
+        self.kernel = (self.weights * taps).reshape(F, C * K * K).T.astype(np.float32)
+        self._scratch = None
+
+    def im2col(self, images, out=None):
+        """(B, H, W, C) int8 -> (B*H*W, C*K*K) float32 patches (zero padding)"""
+        images = np.asarray(images).reshape(-1, H, W, C)
+        batch = len(images)
+        if self._scratch is None or self._scratch.shape[0] != batch:
+            self._scratch = np.zeros((batch, H + 2 * P, W + 2 * P, C), dtype=np.float32)
+        self._scratch[:, P:P + H, P:P + W, :] = images
+        # windows: (B, H, W, C, K, K) view into the padded buffer
+        windows = sliding_window_view(self._scratch, (K, K), axis=(1, 2))
+        if out is None:
+            return windows.reshape(batch * H * W, C * K * K)
+        np.copyto(out.reshape(windows.shape), windows)
+        return out
+
+    def accumulate(self, images):
+        """16-bit partial sums before the bias stage, (B, H, W, F)"""
+        patches = self.im2col(images)
+        sums = np.rint(patches @ self.kernel).astype(np.int64)
+        return wrap16(sums).reshape(-1, H, W, F)
+
+    def run(self, images):
+        """(B, H, W, C) int8 images -> (B, H, W, F) int16 feature maps"""
+        biased = self.accumulate(images) + self.biases
+        return np.clip(biased, INT16_MIN, INT16_MAX).astype(np.int16)
+
+    __call__ = run
+
+    def run_words(self, image_words):
+        """Same as run() on 3072-bit input_image ints; returns output_feature_map ints"""
+        return pack_feature_maps(self.run(unpack_images(image_words)))
+
+
+if __name__ == "__main__":
+    print("📷 Convolutional_Layer Golden Model Demo")
+    print("=" * 50)
+
+    rng = np.random.default_rng(0)
+    model = ConvLayerModel(
+        weights=rng.integers(-128, 128, size=(F, C, K, K)),
+        biases=rng.integers(-2000, 2000, size=F)
+    )
+    batch = 10000
+    images = rng.integers(-128, 128, size=(batch, H, W, C), dtype=np.int8)
+
+    start = time.perf_counter()
+    fmap = model.run(images)
+    elapsed = time.perf_counter() - start
+
+    print(f"  Batch: {batch} images -> feature maps {fmap.shape}")
+    print(f"  Time: {elapsed * 1000:.1f} ms ({batch / elapsed:.0f} images/s)")
@@ -0,0 +1,566 @@
+#!/usr/bin/env python3
+"""
+Bit-accurate Golden Model of FusionCore (FusionCoreFull.v)
+Batched NumPy model of Sensor_Preprocessor -> QKV_Generator -> TMR_Voter ->
+AttentionCalculator -> FeatureFusion -> Concatenator -> fusion_compressor
+"""
+
+import re
+import time
+import hashlib
+from pathlib import Path
+import numpy as np
+
+# FusionCore parameters (defaults of FusionCoreFull.v)
+MIN_VAL = -16384
+MAX_VAL = 16383
+SHIFT_AMOUNT = 2
+LINEAR_NORM = 0
+INPUT_SIZE = 96
+OUTPUT_SIZE = 128
+BIT_WIDTH = 16
+
+# .npy caches of $readmemh parameters live with the other build products (`make clean` drops them)
+MEMH_CACHE_DIR = Path(__file__).resolve().parent.parent / "build" / "memh_cache"
+
+NUM_SENSORS = 3
+SENSOR_LANES = 16        # 256-bit sensor word = 16 x int16
+QKV_LANES = 12           # 192-bit Q/K/V = 12 x int16 from QKV_Generator ...
+ATTN_LANES = 6           # ... read back as 6 x int32 by AttentionCalculator/FeatureFusion
+FEATURE_WORDS = 32       # 512-bit fused_feature = 32 x 16-bit compressor inputs
+
+INT16_MIN, INT16_MAX = -(1 << 15), (1 << 15) - 1
+INT32_MIN, INT32_MAX = -(1 << 31), (1 << 31) - 1
+INT64_MIN, INT64_MAX = -(1 << 63), (1 << 63) - 1
+
+
+def to_signed(values, width):
+    """Reinterpret the low `width` bits of an integer array as two's complement"""
+    values = np.asarray(values, dtype=np.int64)
+    if width >= 64:
+        return values
+    mask = (1 << width) - 1
+    sign = 1 << (width - 1)
+    return ((values & mask) ^ sign) - sign
+
+
+def signed_param(value, width=64):
+    """Two's complement value of a Verilog parameter given signed or unsigned"""
+    value = int(value) & ((1 << width) - 1)
+    return value - (1 << width) if value >> (width - 1) else value
+
+
+def unpack_lanes(words, lanes, width=16):
+    """Split Python ints (bus values) into (B, lanes) signed lane arrays, lane 0 = LSBs"""
+    nbytes = lanes * width // 8
+    blob = b''.join(int(w).to_bytes(nbytes, 'little') for w in words)
+    dtype = {8: '<i1', 16: '<i2', 32: '<i4', 64: '<i8'}[width]
+    return np.frombuffer(blob, dtype=dtype).reshape(-1, lanes).astype(np.int64)
+
+
+def pack_lanes(lanes, width=16):
+    """Join (B, lanes) lane arrays back into Python ints (bus values), lane 0 = LSBs"""
+    lanes = np.asarray(lanes, dtype=np.int64)
+    dtype = {8: '<u1', 16: '<u2', 32: '<u4', 64: '<u8'}[width]
+    raw = (lanes & ((1 << width) - 1) if width < 64 else lanes).astype(dtype)
+    row_bytes = raw.shape[1] * width // 8
+    blob = raw.tobytes()
+    return [int.from_bytes(blob[i:i + row_bytes], 'little') for i in range(0, len(blob), row_bytes)]
+
+
+def lanes16_to_32(lanes16):
+    """View a bus of int16 lanes as int32 lanes ({lane[2i+1], lane[2i]})"""
+    lanes16 = np.asarray(lanes16, dtype=np.int64)
+    return lanes16[..., 1::2] * 65536 + (lanes16[..., 0::2] & 0xFFFF)
+
+
+def lanes32_to_16(lanes32):
+    """View a bus of int32 lanes as signed int16 lanes (low half first)"""
+    lanes32 = np.asarray(lanes32, dtype=np.int64)
+    out = np.empty(lanes32.shape[:-1] + (2 * lanes32.shape[-1],), dtype=np.int64)
+    out[..., 0::2] = to_signed(lanes32, 16)
+    out[..., 1::2] = to_signed(lanes32 >> 16, 16)
+    return out
+
+
+def sensor_preprocess(raw, min_val=MIN_VAL, max_val=MAX_VAL):
+    """Sensor_Preprocessor: clamp each int16 lane, flag out-of-range lanes"""
+    raw = to_signed(raw, 16)
+    normalized = np.clip(raw, min_val, max_val)
+    out_of_range = (raw < min_val) | (raw > max_val)
+    error_flags = out_of_range.astype(np.int64) @ (np.int64(1) << np.arange(raw.shape[-1], dtype=np.int64))
+    return normalized, error_flags
+
+
+class QKVGeneratorModel:
+    """Batched QKV_Generator: W_q/W_k/W_v stacked into one (16, 36) matmul"""
+
+    NAMES = ('Q', 'K', 'V')
+
+    def __init__(self, W_q, W_k, W_v):
+        self.W_q = to_signed(W_q, 16).reshape(QKV_LANES, SENSOR_LANES)
+        self.W_k = to_signed(W_k, 16).reshape(QKV_LANES, SENSOR_LANES)
+        self.W_v = to_signed(W_v, 16).reshape(QKV_LANES, SENSOR_LANES)
+        # |accum| <= 16 * 2^30 < 2^53, so a float64 (BLAS) matmul is exact
+        self._W_stack = np.concatenate([self.W_q, self.W_k, self.W_v]).T.astype(np.float64)
+
+    def accumulate(self, x):
+        """Raw 40-bit accumulators, (B, 3, 12) for Q/K/V"""
+        x = to_signed(x, 16).reshape(-1, SENSOR_LANES)
+        accum = np.rint(x.astype(np.float64) @ self._W_stack).astype(np.int64)
+        return accum.reshape(-1, 3, QKV_LANES)
+
+    def run(self, x):
+        """(B, 16) inputs -> Q, K, V (B, 12), overflow (B,) 3-bit, lane masks (B, 3, 12)"""
+        accum = self.accumulate(x)
+        lane_overflow = (accum > INT16_MAX) | (accum < INT16_MIN)
+        overflow = lane_overflow.any(axis=2).astype(np.int64) @ np.array([1, 2, 4], dtype=np.int64)
+        qkv = np.clip(accum, INT16_MIN, INT16_MAX)
+        return qkv[:, 0], qkv[:, 1], qkv[:, 2], overflow, lane_overflow
+
+    __call__ = run
+
+    def saturation_stats(self, x, chunk=1 << 18):
+        """How often saturation fires over a dataset, streamed in chunks"""
+        x = to_signed(x, 16).reshape(-1, SENSOR_LANES)
+        lane_hits = np.zeros((3, QKV_LANES), dtype=np.int64)
+        flag_hits = np.zeros(3, dtype=np.int64)
+        any_hits = 0
+        for lo in range(0, len(x), chunk):
+            lane_overflow = self.run(x[lo:lo + chunk])[-1]
+            lane_hits += lane_overflow.sum(axis=0)
+            flag_hits += lane_overflow.any(axis=2).sum(axis=0)
+            any_hits += int(lane_overflow.any(axis=(1, 2)).sum())
+        rows = max(len(x), 1)
+        return {
+            'vectors': len(x),
+            'flag_rate': {n: flag_hits[i] / rows for i, n in enumerate(self.NAMES)},
+            'any_flag_rate': any_hits / rows,
+            'lane_rate': lane_hits / rows
+        }
+
+
+def quantize_weights(W, frac_bits):
+    """Round real-valued weights to int16 with `frac_bits` fractional bits (saturating)"""
+    return np.clip(np.rint(np.asarray(W, dtype=np.float64) * (1 << frac_bits)), INT16_MIN, INT16_MAX).astype(np.int64)
+
+
+def qkv_quantization_sweep(x, W_q, W_k, W_v, frac_bits_range):
+    """Saturation statistics of QKV_Generator for each weight quantization"""
+    return {
+        frac_bits: QKVGeneratorModel(*(quantize_weights(W, frac_bits) for W in (W_q, W_k, W_v))).saturation_stats(x)
+        for frac_bits in frac_bits_range
+    }
+
+
+def tmr_vote(copy1, copy2, copy3):
+    """TMR_Voter on (..., 12) words: 2-of-3 majority, copy1 + error flag when all differ"""
+    c12 = copy1 == copy2
+    c13 = copy1 == copy3
+    c23 = copy2 == copy3
+    voted = np.where(c12 | c13 | ~c23, copy1, copy2)
+    error = ~(c12 | c13 | c23)
+    return voted, error
+
+
+# --- Wide integer emulation ------------------------------------------------------
+# Signed wide values are held as two int64 limbs: value = hi * 2^64 + lo, with lo
+# read as unsigned. This covers the 96-bit datapaths without Python big ints.
+
+def _wide_from_int64(value):
+    """Sign-extend int64 values to (hi, lo) limbs"""
+    value = np.asarray(value, dtype=np.int64)
+    return value >> 63, value.view(np.uint64)
+
+
+def _wide_add(a, b):
+    """(hi, lo) + (hi, lo) with carry from the low limb"""
+    lo = a[1] + b[1]
+    carry = (lo < a[1]).astype(np.int64)
+    return a[0] + b[0] + carry, lo
+
+
+def _wide_shift_right(a, shift):
+    """Arithmetic shift right (>>>) of (hi, lo) limbs"""
+    hi, lo = a
+    if shift == 0:
+        return hi, lo
+    if shift >= 64:
+        return hi >> 63, (hi >> min(shift - 64, 63)).view(np.uint64)
+    lo = (lo >> np.uint64(shift)) | (hi.view(np.uint64) << np.uint64(64 - shift))
+    return hi >> shift, lo
+
+
+def _wide_wrap(a, width):
+    """Keep the low `width` bits (64 < width <= 128) as a signed value"""
+    hi, lo = a
+    unused = 128 - width
+    return (hi << unused) >> unused, lo
+
+
+def _wide_mul_64x32(a, b):
+    """Exact int64 x int32 product as (hi, lo) limbs"""
+    a = np.asarray(a, dtype=np.int64)
+    b = np.asarray(b, dtype=np.int64)
+    upper = (a >> 32) * b                       # |.| <= 2^62
+    lower = (a & 0xFFFFFFFF) * b                # |.| <  2^63
+    # upper * 2^32 as limbs, then add the sign-extended lower partial product
+    shifted = (upper >> 32, (upper << 32).view(np.uint64))
+    return _wide_add(shifted, _wide_from_int64(lower))
+
+
+def _wide_saturate_quirk(a, width):
+    """RTL saturation of a wide value to `width` <= 64 bits (MIN/MAX picked by bit width-1)"""
+    hi, lo = a
+    lo_signed = lo.view(np.int64)
+    fits_64 = hi == (lo_signed >> 63)
+    if width == 64:
+        in_range = fits_64
+        value = lo_signed
+    else:
+        value = to_signed(lo_signed, width)
+        in_range = fits_64 & (value == lo_signed)
+    lo_sat, hi_sat = -(1 << (width - 1)), (1 << (width - 1)) - 1
+    bit = (lo_signed >> (width - 1)) & 1
+    return np.where(in_range, value, np.where(bit == 1, lo_sat, hi_sat))
+
+
+class AttentionCalculatorModel:
+    """AttentionCalculator on int64 limbs: 96-bit Q.K, >>> SHIFT_AMOUNT, + LINEAR_NORM, saturate"""
+
+    ACC_WIDTH = 96
+
+    def __init__(self, shift_amount=SHIFT_AMOUNT, linear_norm=LINEAR_NORM):
+        self.shift_amount = int(shift_amount)
+        self.linear_norm = signed_param(linear_norm, 64)
+
+    def dot_product(self, Q, K):
+        """96-bit accumulator of the six int32 lane products, as (hi, lo) limbs"""
+        q32 = lanes16_to_32(Q)
+        k32 = lanes16_to_32(K)
+        products = q32 * k32                    # int32 x int32 fits int64
+        acc = _wide_from_int64(products[..., 0])
+        for i in range(1, ATTN_LANES):
+            acc = _wide_wrap(_wide_add(acc, _wide_from_int64(products[..., i])), self.ACC_WIDTH)
+        return acc
+
+    def run(self, Q, K):
+        """Q, K as (..., 12) int16 lanes -> attention_weight (...) int64"""
+        shifted = _wide_shift_right(self.dot_product(Q, K), self.shift_amount)
+        norm = _wide_from_int64(np.full(shifted[0].shape, self.linear_norm, dtype=np.int64))
+        normalized = _wide_wrap(_wide_add(shifted, norm), self.ACC_WIDTH)
+        return _wide_saturate_quirk(normalized, 64)
+
+    __call__ = run
+
+
+def attention(Q, K, shift_amount=SHIFT_AMOUNT, linear_norm=LINEAR_NORM):
+    """AttentionCalculator: 96-bit Q.K, >>> shift, + LINEAR_NORM, 64-bit saturate"""
+    return AttentionCalculatorModel(shift_amount, linear_norm).run(Q, K)
+
+
+def feature_fusion(attention_weight, V):
+    """FeatureFusion: (attention x V_i) >>> 16 per int32 lane with 32-bit saturation"""
+    v32 = lanes16_to_32(V)
+    weight = np.asarray(attention_weight, dtype=np.int64)[..., None]
+    shifted = _wide_shift_right(_wide_mul_64x32(weight, v32), 16)   # 64 x 32 -> 96-bit product
+    return _wide_saturate_quirk(shifted, 32)
+
+
+def concatenate(scaled_V):
+    """Concatenator + compressor input view: (B, 3, 6) int32 lanes -> (B, 96) int16 words"""
+    batch = scaled_V.shape[0]
+    raw_tensor = np.zeros((batch, NUM_SENSORS, FEATURE_WORDS), dtype=np.int64)
+    raw_tensor[:, :, :2 * ATTN_LANES] = lanes32_to_16(scaled_V)   # 320-bit zero padding above
+    return raw_tensor.reshape(batch, NUM_SENSORS * FEATURE_WORDS)
+
+
+def read_memh(path, width=BIT_WIDTH):
+    """Parse a $readmemh file (whitespace-separated hex, // and /* */ comments, @addr)
+
+    Same syntax as LiDAR Decoder/memh.py's load_mem (keep the two in step);
+    this one sizes the memory from the file and sign-extends to `width`.
+    """
+    text = Path(path).read_text()
+    text = re.sub(r'//[^\n]*|/\*.*?\*/', ' ', text, flags=re.S)
+    tokens = text.split()
+
+    if not any(t.startswith('@') for t in tokens):
+        values = [int(t.replace('_', ''), 16) for t in tokens]
+    else:
+        memory = {}
+        address = 0
+        for token in tokens:
+            if token.startswith('@'):
+                address = int(token[1:], 16)
+            else:
+                memory[address] = int(token.replace('_', ''), 16)
+                address += 1
+        values = [memory.get(a, 0) for a in range(max(memory) + 1 if memory else 0)]
+
+    return to_signed(np.array(values, dtype=np.int64), width)
+
+
+def write_memh(path, values, width=BIT_WIDTH):
+    """Write values as a $readmemh file, one word per line"""
+    digits = (width + 3) // 4
+    words = np.asarray(values, dtype=np.int64).ravel() & ((1 << width) - 1)
+    Path(path).write_text(''.join(f"{int(w):0{digits}x}\n" for w in words))
+
+
+def load_memh_cached(path, shape, width=BIT_WIDTH, cache_dir=None):
+    """Load a $readmemh file once; later calls memory-map a .npy cache of it
+
+    The cache goes to cache_dir (default MEMH_CACHE_DIR), keyed by the source
+    file's absolute path, so the source tree is never written to.
+    """
+    path = Path(path)
+    cache_dir = Path(cache_dir) if cache_dir is not None else MEMH_CACHE_DIR
+    key = hashlib.sha1(str(path.resolve()).encode()).hexdigest()[:12]
+    cache = cache_dir / f"{path.name}.{key}.npy"
+
+    if not cache.exists() or cache.stat().st_mtime_ns < path.stat().st_mtime_ns:
+        values = read_memh(path, width)
+        if values.size != int(np.prod(shape)):
+            raise ValueError(f"{path}: expected {int(np.prod(shape))} words, found {values.size}")
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        np.save(cache, values.astype(np.int16 if width <= 16 else np.int64).reshape(shape))
+
+    array = np.load(cache, mmap_mode='r')
+    if array.shape != tuple(shape):
+        raise ValueError(f"{cache}: cached shape {array.shape} does not match {tuple(shape)}")
+    return array
+
+
+class FusionCompressorModel:
+    """fusion_compressor: bias + W . x (38-bit accumulator), ReLU and 16-bit saturation"""
+
+    def __init__(self, weights, bias, chunk=1 << 16):
+        self.weights = np.asarray(weights).reshape(OUTPUT_SIZE, INPUT_SIZE)
+        self.bias = np.asarray(bias).reshape(OUTPUT_SIZE)
+        self.chunk = chunk
+        # |accum| <= 96 * 2^30 + 2^15 < 2^53, so a float64 (BLAS) matmul is exact
+        self._W_t = to_signed(self.weights, BIT_WIDTH).T.astype(np.float64)
+        self._b = to_signed(self.bias, BIT_WIDTH)
+
+    @classmethod
+    def from_memh(cls, weights_path, bias_path, cache_dir=None, **kwargs):
+        """Load weights[128][96] and bias[128] from $readmemh files (row-major, cached)"""
+        weights = load_memh_cached(weights_path, (OUTPUT_SIZE, INPUT_SIZE), BIT_WIDTH, cache_dir)
+        bias = load_memh_cached(bias_path, (OUTPUT_SIZE,), BIT_WIDTH, cache_dir)
+        return cls(weights, bias, **kwargs)
+
+    def to_memh(self, weights_path, bias_path):
+        """Export the parameters in $readmemh form for the RTL"""
+        write_memh(weights_path, self.weights)
+        write_memh(bias_path, self.bias)
+
+    def accumulate(self, raw_tensor):
+        """Integer accumulators (B, 128) for (B, 96) int16 inputs"""
+        x = to_signed(raw_tensor, BIT_WIDTH).reshape(-1, INPUT_SIZE)
+        accum = np.empty((len(x), OUTPUT_SIZE), dtype=np.int64)
+        for lo in range(0, len(x), self.chunk):
+            block = x[lo:lo + self.chunk].astype(np.float64) @ self._W_t
+            accum[lo:lo + self.chunk] = np.rint(block).astype(np.int64)
+        accum += self._b
+        return accum
+
+    def run(self, raw_tensor):
+        """(B, 96) int16 inputs -> (B, 128) fused_tensor lanes in [0, 32767]"""
+        return np.clip(self.accumulate(raw_tensor), 0, (1 << (BIT_WIDTH - 1)) - 1)
+
+    __call__ = run
+
+
+# fault_monitor parameters
+FM_NUM_WORDS = 15            # data words per 256-bit sensor word; word 15 is the checksum
+FM_RANGE_LIMIT = 10000
+FM_SHREG_DEPTH = 3
+
+
+def load_sensor_stream(path):
+    """Memory-map a recorded stream of {sensor1, sensor2, sensor3} 256-bit words as (T, 3, 16) lanes"""
+    return np.memmap(path, dtype='<u2', mode='r').reshape(-1, NUM_SENSORS, SENSOR_LANES)
+
+
+class FaultMonitorModel:
+    """fault_monitor over whole streams: vectorized checksums and 3-cycle shift registers
+
+    error_code[t] is the combinational output while word t is on the inputs, so the
+    shift registers hold the flags of words t-3..t-1 (all ones straight after reset).
+    Consecutive process() calls continue the same stream.
+    """
+
+    def __init__(self, range_limit=FM_RANGE_LIMIT, depth=FM_SHREG_DEPTH):
+        self.range_limit = range_limit
+        self.depth = depth
+        self.reset()
+
+    def reset(self):
+        """rst_n: shift registers back to 3'b111"""
+        self._loss_hist = np.ones((self.depth, NUM_SENSORS), dtype=bool)
+        self._range_hist = np.ones((self.depth, NUM_SENSORS), dtype=bool)
+
+    @staticmethod
+    def _lanes(stream):
+        lanes = np.asarray(stream)
+        if lanes.shape[-2:] != (NUM_SENSORS, SENSOR_LANES):
+            raise ValueError(f"Expected (T, {NUM_SENSORS}, {SENSOR_LANES}) lanes, got {lanes.shape}")
+        return lanes.astype(np.uint16, copy=False)
+
+    def flags(self, stream):
+        """Per-word checksum, range and signal-loss flags, each (T, 3)"""
+        lanes = self._lanes(stream)
+        data = lanes[..., :FM_NUM_WORDS]
+        checksum = data.sum(axis=-1, dtype=np.uint32) & 0xFFFF     # compute_checksum: 16-bit wraparound sum
+        checksum_err = checksum != lanes[..., FM_NUM_WORDS]
+        signed = data.view(np.int16)
+        range_err = ((signed < -self.range_limit) | (signed > self.range_limit)).any(axis=-1)
+        loss = ~lanes.any(axis=-1)
+        return checksum_err, range_err, loss
+
+    def _window_all(self, history, current):
+        """all() over the `depth` previous cycles for every cycle of the chunk"""
+        padded = np.concatenate([history, current])
+        # Running count of set flags; a window is all ones when it counts `depth`
+        counts = np.concatenate([np.zeros((1, NUM_SENSORS), dtype=np.int64), np.cumsum(padded, axis=0)])
+        window = counts[self.depth:-1] - counts[:-self.depth - 1]
+        return window == self.depth, padded[-self.depth:]
+
+    def process(self, stream):
+        """(T, 3, 16) sensor lanes -> (T,) 4-bit error_code timeline"""
+        checksum_err, range_err, loss = self.flags(stream)
+
+        range_full, self._range_hist = self._window_all(self._range_hist, range_err)
+        loss_full, self._loss_hist = self._window_all(self._loss_hist, loss)
+
+        error_code = checksum_err.any(axis=1).astype(np.uint8)
+        error_code |= range_full.any(axis=1).astype(np.uint8) << 1
+        error_code |= loss_full.any(axis=1).astype(np.uint8) << 2
+        return error_code
+
+    __call__ = process
+
+    def process_file(self, path, chunk=1 << 20):
+        """error_code timeline of a recorded stream file, read in chunks"""
+        stream = load_sensor_stream(path)
+        self.reset()
+        return np.concatenate([self.process(stream[lo:lo + chunk]) for lo in range(0, len(stream), chunk)]
+                              or [np.empty(0, dtype=np.uint8)])
+
+    @staticmethod
+    def events(error_code):
+        """Compact timeline: cycles where error_code changes, with the new code"""
+        error_code = np.asarray(error_code)
+        change = np.flatnonzero(np.diff(error_code, prepend=np.uint8(0xFF)))
+        return change, error_code[change]
+
+    @staticmethod
+    def summary(error_code):
+        """Cycles with each error_code bit set"""
+        error_code = np.asarray(error_code)
+        return {
+            'cycles': int(error_code.size),
+            'checksum_error': int(np.count_nonzero(error_code & 1)),
+            'range_error': int(np.count_nonzero(error_code & 2)),
+            'signal_loss': int(np.count_nonzero(error_code & 4)),
+            'any_error': int(np.count_nonzero(error_code))
+        }
+
+
+def with_checksum(lanes):
+    """Fill lane 15 with the fault_monitor checksum of lanes 0..14"""
+    lanes = np.array(lanes, dtype=np.uint16)
+    lanes[..., FM_NUM_WORDS] = lanes[..., :FM_NUM_WORDS].sum(axis=-1, dtype=np.uint32) & 0xFFFF
+    return lanes
+
+
+class FusionCoreModel:
+    """Batched, bit-exact FusionCore golden model"""
+
+    def __init__(self, W_q, W_k, W_v, fc_weights, fc_bias,
+                 min_val=MIN_VAL, max_val=MAX_VAL,
+                 shift_amount=SHIFT_AMOUNT, linear_norm=LINEAR_NORM):
+        # QKV weights are 12x16 as in QKV_Generator (FusionCore's 6x16 port is narrower)
+        self.qkv = QKVGeneratorModel(W_q, W_k, W_v)
+        self.compressor = FusionCompressorModel(fc_weights, fc_bias)
+        self.min_val = min_val
+        self.max_val = max_val
+        self.attention = AttentionCalculatorModel(shift_amount, linear_norm)
+
+    @classmethod
+    def from_memh(cls, W_q, W_k, W_v, fc_weights_path, fc_bias_path, cache_dir=None, **kwargs):
+        """Model whose fusion_compressor parameters come from $readmemh files"""
+        compressor = FusionCompressorModel.from_memh(fc_weights_path, fc_bias_path, cache_dir)
+        return cls(W_q, W_k, W_v, compressor.weights, compressor.bias, **kwargs)
+
+    @classmethod
+    def random(cls, seed=0, weight_range=64):
+        """Model with random small weights (for self-checks and benchmarks)"""
+        rng = np.random.default_rng(seed)
+        qkv = [rng.integers(-weight_range, weight_range, size=(QKV_LANES, SENSOR_LANES)) for _ in range(3)]
+        fc_weights = rng.integers(-weight_range, weight_range, size=(OUTPUT_SIZE, INPUT_SIZE))
+        fc_bias = rng.integers(-1024, 1024, size=OUTPUT_SIZE)
+        return cls(*qkv, fc_weights, fc_bias)
+
+    def run(self, sensor1, sensor2, sensor3, return_intermediates=False):
+        """Evaluate B input vectors; each sensor input is (B, 16) int16 lanes"""
+
+        raw = np.stack([to_signed(s, 16).reshape(-1, SENSOR_LANES) for s in (sensor1, sensor2, sensor3)], axis=1)
+        batch = raw.shape[0]
+
+        # Stage 1: preprocessing (all sensors at once)
+        normalized, error_flags = sensor_preprocess(raw, self.min_val, self.max_val)
+
+        # Stage 2: QKV generation; the three TMR replicas are identical, so the vote is a pass-through
+        Q, K, V, overflow, _ = self.qkv.run(normalized)
+        Q, K, V = (m.reshape(batch, NUM_SENSORS, QKV_LANES) for m in (Q, K, V))
+
+        # Stage 3: attention and feature fusion
+        attention_weight = self.attention(Q, K)
+        scaled_V = feature_fusion(attention_weight, V)
+
+        # Stage 4: concatenation and compression
+        raw_tensor = concatenate(scaled_V)
+        fused_tensor = self.compressor(raw_tensor)
+
+        if not return_intermediates:
+            return fused_tensor
+        return {
+            'normalized': normalized,
+            'error_flags': error_flags,
+            'Q': Q, 'K': K, 'V': V,
+            'qkv_overflow': overflow.reshape(batch, NUM_SENSORS),
+            'attention_weight': attention_weight,
+            'scaled_V': scaled_V,
+            'raw_tensor': raw_tensor,
+            'fused_tensor': fused_tensor
+        }
+
+    __call__ = run
+
+    def run_words(self, sensor1_words, sensor2_words, sensor3_words):
+        """Same as run() on 256-bit bus values; returns 2048-bit fused_tensor ints"""
+        lanes = [unpack_lanes(w, SENSOR_LANES) for w in (sensor1_words, sensor2_words, sensor3_words)]
+        return pack_lanes(self.run(*lanes), BIT_WIDTH)
+
+
+if __name__ == "__main__":
+    print("🧠 FusionCore Golden Model Demo")
+    print("=" * 50)
+
+    model = FusionCoreModel.random(seed=1)
+    rng = np.random.default_rng(2)
+    batch = 100000
+    sensors = [rng.integers(INT16_MIN, INT16_MAX + 1, size=(batch, SENSOR_LANES)) for _ in range(NUM_SENSORS)]
+
+    start = time.perf_counter()
+    fused = model.run(*sensors)
+    elapsed = time.perf_counter() - start
+
+    print(f"  Batch: {batch} vectors -> fused_tensor {fused.shape}")
+    print(f"  Time: {elapsed * 1000:.1f} ms ({batch / elapsed * 60 / 1e6:.1f} M vectors/min)")
+    print(f"  Non-zero outputs: {np.count_nonzero(fused) / fused.size * 100:.1f}%")
+
+    stats = model.qkv.saturation_stats(np.concatenate(sensors))
+    print(f"  QKV saturation rate: " + ", ".join(f"{k}={v * 100:.2f}%" for k, v in stats['flag_rate'].items()))
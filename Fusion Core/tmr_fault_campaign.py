@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+TMR_Voter Fault-Injection Campaign Engine
+Vectorized single-bit, multi-bit and burst upsets in the three QKV replicas,
+scored against the TMR_Voter model and spread over a process pool
+"""
+
+import os
+import json
+import time
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+
+from fusion_core_model import tmr_vote
+
+WORDS = 12                  # TMR_Voter votes 12 x 16-bit words
+WORD_BITS = 16
+BUS_BITS = WORDS * WORD_BITS
+REPLICAS = 3
+
+FAULT_MODELS = ('single', 'multi', 'burst')
+OUTCOMES = ('masked', 'flagged_correct', 'flagged_wrong', 'silent_corruption')
+
+
+def _distinct_bits(rng, trials, num_bits):
+    """(trials, num_bits) distinct bus bit positions per trial (Floyd's sampling, one column per draw)"""
+    if not 0 < num_bits <= BUS_BITS:
+        raise ValueError(f"num_bits must be 1..{BUS_BITS} for same-replica upsets, got {num_bits}")
+    bit = np.empty((trials, num_bits), dtype=np.int64)
+    for col, j in enumerate(range(BUS_BITS - num_bits, BUS_BITS)):
+        draw = rng.integers(0, j + 1, size=trials)
+        taken = (bit[:, :col] == draw[:, None]).any(axis=1)
+        bit[:, col] = np.where(taken, j, draw)
+    return bit
+
+
+def _flip_positions(rng, trials, fault_model, num_bits, burst_length, same_replica):
+    """(trials, flips) replica indices and bus bit positions for one fault model"""
+
+    if fault_model == 'single':
+        replica = rng.integers(0, REPLICAS, size=(trials, 1))
+        bit = rng.integers(0, BUS_BITS, size=(trials, 1))
+    elif fault_model == 'multi':
+        shape = (trials, 1) if same_replica else (trials, num_bits)
+        replica = np.broadcast_to(rng.integers(0, REPLICAS, size=shape), (trials, num_bits))
+        if same_replica:
+            # Distinct bits, so no two flips cancel inside the replica
+            bit = _distinct_bits(rng, trials, num_bits)
+        else:
+            bit = rng.integers(0, BUS_BITS, size=(trials, num_bits))
+    elif fault_model == 'burst':
+        replica = np.broadcast_to(rng.integers(0, REPLICAS, size=(trials, 1)), (trials, burst_length))
+        start = rng.integers(0, BUS_BITS - burst_length + 1, size=(trials, 1))
+        bit = start + np.arange(burst_length)
+    else:
+        raise ValueError(f"Unknown fault model '{fault_model}' (expected one of {FAULT_MODELS})")
+
+    return replica, bit
+
+
+def inject(golden, replica, bit):
+    """Three replicas of `golden` (T, 12) with the given bits flipped (XOR, repeats cancel)"""
+    trials = golden.shape[0]
+    copies = np.repeat(golden[:, None, :], REPLICAS, axis=1).astype(np.uint16)
+    flat = copies.reshape(-1)
+
+    trial_idx = np.broadcast_to(np.arange(trials)[:, None], bit.shape)
+    index = (trial_idx * REPLICAS + replica) * WORDS + bit // WORD_BITS
+    masks = (np.uint16(1) << (bit % WORD_BITS).astype(np.uint16)).astype(np.uint16)
+    np.bitwise_xor.at(flat, index.ravel(), masks.ravel())
+    return copies
+
+
+def run_trials(trials, fault_model='single', num_bits=2, burst_length=4, same_replica=False, seed=0):
+    """Run one chunk of trials; returns outcome counts and per-word flag counts"""
+    rng = np.random.default_rng(seed)
+    golden = rng.integers(0, 1 << WORD_BITS, size=(trials, WORDS), dtype=np.uint16)
+
+    replica, bit = _flip_positions(rng, trials, fault_model, num_bits, burst_length, same_replica)
+    copies = inject(golden, replica, bit)
+    voted, error = tmr_vote(copies[:, 0], copies[:, 1], copies[:, 2])
+
+    correct = (voted == golden).all(axis=1)
+    flagged = error.any(axis=1)
+    outcome = np.select(
+        [correct & ~flagged, correct & flagged, ~correct & flagged],
+        [0, 1, 2], default=3
+    )
+    return {
+        'trials': trials,
+        'outcomes': np.bincount(outcome, minlength=len(OUTCOMES)),
+        'word_flags': error.sum(axis=0),
+        'word_errors': (voted != golden).sum(axis=0)
+    }
+
+
+def _run_chunk(args):
+    return run_trials(**args)
+
+
+class TMRFaultCampaign:
+    """Monte-Carlo fault-injection campaign against TMR_Voter"""
+
+    def __init__(self, fault_model='single', num_bits=2, burst_length=4, same_replica=False,
+                 seed=0, chunk_size=200000, workers=None):
+        if fault_model not in FAULT_MODELS:
+            raise ValueError(f"Unknown fault model '{fault_model}' (expected one of {FAULT_MODELS})")
+        if fault_model == 'multi' and not 1 <= num_bits <= BUS_BITS:
+            raise ValueError(f"num_bits must be 1..{BUS_BITS} for multi-bit upsets, got {num_bits}")
+        if fault_model == 'burst' and not 1 <= burst_length <= BUS_BITS:
+            raise ValueError(f"burst_length must be 1..{BUS_BITS} for burst upsets, got {burst_length}")
+        self.fault_model = fault_model
+        self.num_bits = num_bits
+        self.burst_length = burst_length
+        self.same_replica = same_replica
+        self.seed = seed
+        self.chunk_size = chunk_size
+        self.workers = workers or os.cpu_count() or 1
+
+    def _chunks(self, trials):
+        seeds = np.random.SeedSequence(self.seed).spawn((trials + self.chunk_size - 1) // self.chunk_size)
+        for i, seed in enumerate(seeds):
+            yield {
+                'trials': min(self.chunk_size, trials - i * self.chunk_size),
+                'fault_model': self.fault_model,
+                'num_bits': self.num_bits,
+                'burst_length': self.burst_length,
+                'same_replica': self.same_replica,
+                'seed': seed
+            }
+
+    def run(self, trials):
+        """Run `trials` injections and return the aggregated report"""
+        if trials < 1:
+            raise ValueError(f"A campaign needs at least one trial, got {trials}")
+        start = time.perf_counter()
+        chunks = list(self._chunks(trials))
+
+        if self.workers > 1 and len(chunks) > 1:
+            with ProcessPoolExecutor(max_workers=self.workers) as pool:
+                results = list(pool.map(_run_chunk, chunks))
+        else:
+            results = [_run_chunk(c) for c in chunks]
+
+        outcomes = sum(r['outcomes'] for r in results)
+        word_flags = sum(r['word_flags'] for r in results)
+        word_errors = sum(r['word_errors'] for r in results)
+        elapsed = time.perf_counter() - start
+
+        wrong = outcomes[2] + outcomes[3]
+        return {
+            'fault_model': self.fault_model,
+            'num_bits': self.num_bits if self.fault_model == 'multi' else None,
+            'burst_length': self.burst_length if self.fault_model == 'burst' else None,
+            'trials': trials,
+            'outcomes': {name: int(n) for name, n in zip(OUTCOMES, outcomes)},
+            'output_correct_rate': float(outcomes[0] + outcomes[1]) / trials,
+            'error_flag_rate': float(outcomes[1] + outcomes[2]) / trials,
+            # Share of wrong voter outputs that raised an error flag
+            'error_flag_coverage': float(outcomes[2]) / wrong if wrong else 1.0,
+            'silent_corruption_rate': float(outcomes[3]) / trials,
+            'word_flag_counts': word_flags.tolist(),
+            'word_error_counts': word_errors.tolist(),
+            'elapsed_s': elapsed,
+            'trials_per_s': trials / elapsed if elapsed > 0 else float('inf')
+        }
+
+
+def run_standard_campaign(trials=1000000, workers=None, seed=0):
+    """Single-bit, 2/3-bit multi-bit and 4/8-bit burst campaigns"""
+    configs = [
+        {'fault_model': 'single'},
+        {'fault_model': 'multi', 'num_bits': 2},
+        {'fault_model': 'multi', 'num_bits': 3},
+        {'fault_model': 'burst', 'burst_length': 4},
+        {'fault_model': 'burst', 'burst_length': 8},
+    ]
+    return [TMRFaultCampaign(seed=seed, workers=workers, **cfg).run(trials) for cfg in configs]
+
+
+if __name__ == "__main__":
+    print("🛡️ TMR_Voter Fault-Injection Campaign")
+    print("=" * 70)
+
+    reports = run_standard_campaign(trials=1000000)
+    for r in reports:
+        label = r['fault_model'] + (f"-{r['num_bits']}" if r['num_bits'] else '') + \
+            (f"-{r['burst_length']}" if r['burst_length'] else '')
+        print(f"  {label:10s} correct {r['output_correct_rate'] * 100:7.3f}%  "
+              f"flagged {r['error_flag_rate'] * 100:7.3f}%  "
+              f"SDC {r['silent_corruption_rate'] * 100:7.4f}%  "
+              f"({r['trials_per_s'] / 1e6:.1f} M trials/s)")
+
+    with open('tmr_fault_campaign_results.json', 'w') as f:
+        json.dump(reports, f, indent=2)
+    print("\n📄 Results saved to tmr_fault_campaign_results.json")
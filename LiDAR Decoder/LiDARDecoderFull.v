@@ -172,14 +172,17 @@ module CRCChecker (
     logic [31:0] crc_table [0:255]; // Bảng tra cứu CRC-32
 
     initial begin
-        for (int i = 0; i < 256; i++) crc_table[i] = 32'h0; // Giả lập, cần triển khai thực tế
+        // CRC-32 (32'hEDB88320), generated by crc_model.py; opened relative to the simulator's
+        // working directory (`make compile` copies it into build/)
+        $readmemh("crc_table.mem", crc_table);
     end
 
     always_comb begin
         calculated_crc = 32'hFFFFFFFF;
         if (crc_enable) begin
             for (int i = 0; i < 64; i++) begin
-                logic [7:0] data_byte = bitstream[i*8 +: 8];
+                automatic logic [7:0] data_byte;
+                data_byte = bitstream[i*8 +: 8];
                 calculated_crc = crc_table[(calculated_crc ^ data_byte) & 8'hFF] ^ (calculated_crc >> 8);
             end
             crc_error = (calculated_crc != 32'h0); // Giả định CRC appended là 0
@@ -0,0 +1,316 @@
+#!/usr/bin/env python3
+"""
+Spatial-Index Golden Model of the LiDAR AttributeDecompressor
+K=4 nearest decoded neighbours for every point from one grid index per scan,
+AttributePredictor / AttributeCombiner applied level by level over a Morton LoD
+"""
+
+import time
+import numpy as np
+
+from geometry_model import lidar_scan
+
+# AttributeDecompressor parameters
+ATTR_WIDTH = 8
+K = 4
+MODE_WIDTH = 3
+SYMBOL_WIDTH = 8
+
+ATTR_MAX = (1 << ATTR_WIDTH) - 1
+LOD_LEVELS = 8                 # Morton-order decimation levels
+QUERY_CHUNK = 4096             # Queries per candidate-gather batch
+MORTON_BITS = 21
+
+_NO_NEIGHBOUR = -1
+_FAR = np.iinfo(np.int64).max
+
+
+def _spread_bits(v):
+    """Insert two zero bits between each of the low 21 bits (Morton interleave helper)"""
+    v = v & 0x1FFFFF
+    v = (v | (v << 32)) & 0x1F00000000FFFF
+    v = (v | (v << 16)) & 0x1F0000FF0000FF
+    v = (v | (v << 8)) & 0x100F00F00F00F00F
+    v = (v | (v << 4)) & 0x10C30C30C30C30C3
+    v = (v | (v << 2)) & 0x1249249249249249
+    return v
+
+
+def morton_codes(points):
+    """(N, 3) integer points -> (N,) 63-bit Morton codes (coordinates shifted down to 21 bits)"""
+    p = np.asarray(points, dtype=np.int64).reshape(-1, 3)
+    if len(p) == 0:
+        return np.zeros(0, dtype=np.int64)
+    p = p - p.min(axis=0)
+    shift = max(int(p.max()).bit_length() - MORTON_BITS, 0)
+    p >>= shift
+    return _spread_bits(p[:, 0]) | (_spread_bits(p[:, 1]) << 1) | (_spread_bits(p[:, 2]) << 2)
+
+
+def lod_levels(points, levels=LOD_LEVELS):
+    """Level of detail per point: Morton rank r is level 0 when r % 2^(L-1) == 0, ..., odd ranks are L-1"""
+    rank = np.empty(len(points), dtype=np.int64)
+    rank[np.argsort(morton_codes(points), kind='stable')] = np.arange(len(points))
+    level = np.full(len(points), levels - 1, dtype=np.int64)
+    for j in range(1, levels):
+        level[rank % (1 << j) == 0] = levels - 1 - j
+    return level, rank
+
+
+def _dist2(points, queries, candidates):
+    d = points[candidates] - points[queries]
+    return (d * d).sum(axis=1)
+
+
+def knn(points, k, queries, candidates, key=None, cell=None):
+    """K nearest neighbours of each query among candidates (only c with key[c] < key[q] if key is given)
+
+    The candidates are bucketed into a uniform grid (one sort). Each query
+    gathers the 27 cells around it, so any neighbour within `cell` is seen;
+    queries whose k-th distance exceeds that (or with fewer than k) are
+    repeated on a grid twice as coarse until it covers the scan. Results
+    are exact, ties broken by lower index. Returns (len(queries), k)
+    indices into points, -1 where missing.
+    """
+    points = np.asarray(points, dtype=np.int64)
+    queries = np.asarray(queries, dtype=np.int64)
+    candidates = np.asarray(candidates, dtype=np.int64)
+    neighbours = np.full((len(queries), k), _NO_NEIGHBOUR, dtype=np.int64)
+    if len(queries) == 0 or len(candidates) == 0:
+        return neighbours
+    origin = points.min(axis=0)
+    extent = int((points.max(axis=0) - origin).max()) + 1
+    if cell is None:
+        # Start from the bounding-box density and halve until occupied cells hold about k candidates
+        # (scans are surfaces, so most of the volume is empty)
+        volume = float(np.prod(points.max(axis=0) - origin + 1))
+        cell = max(int(np.cbrt(volume * 2 * k / len(candidates))), 1)
+        while cell > 1 and len(candidates) / len(np.unique((points[candidates] - origin) // cell, axis=0)) > k:
+            cell //= 2
+    pending = np.arange(len(queries))
+    offsets = np.stack(np.meshgrid([-1, 0, 1], [-1, 0, 1], [-1, 0, 1], indexing='ij'), -1).reshape(-1, 3)
+
+    while len(pending):
+        final = cell >= extent
+        dims = (points.max(axis=0) - origin) // cell + 3
+        cand_coords = (points[candidates] - origin) // cell + 1
+        cand_ids = (cand_coords[:, 0] * dims[1] + cand_coords[:, 1]) * dims[2] + cand_coords[:, 2]
+        order = np.argsort(cand_ids, kind='stable')
+        sorted_ids = cand_ids[order]
+        sorted_cands = candidates[order]
+        unresolved = []
+
+        for lo in range(0, len(pending), QUERY_CHUNK):
+            rows = pending[lo:lo + QUERY_CHUNK]
+            query = queries[rows]
+            around = ((points[query] - origin) // cell + 1)[:, None, :] + offsets[None]
+            ids = (around[..., 0] * dims[1] + around[..., 1]) * dims[2] + around[..., 2]
+            starts = np.searchsorted(sorted_ids, ids, side='left').reshape(-1)
+            counts = np.searchsorted(sorted_ids, ids, side='right').reshape(-1) - starts
+
+            # Flatten the candidate lists of the whole chunk
+            slot = np.repeat(np.arange(len(counts)), counts)
+            within = np.arange(len(slot)) - np.repeat(np.cumsum(counts) - counts, counts)
+            cand = sorted_cands[starts[slot] + within]
+            row = slot // len(offsets)
+            q = query[row]
+            allowed = cand != q
+            if key is not None:
+                allowed &= key[cand] < key[q]
+            cand, row, q = cand[allowed], row[allowed], q[allowed]
+            dist = _dist2(points, q, cand)
+
+            # k smallest per query: sort by (query, distance, index) and take each group's head,
+            # packed into one int64 key when it fits (one argsort is ~10x a lexsort)
+            span = (int(dist.max(initial=0)) + 1) * len(points)
+            if span * len(rows) < 1 << 62:
+                by = np.argsort((row * span + dist * len(points)) + cand)
+            else:
+                by = np.lexsort((cand, dist, row))
+            # Trailing sentinel: positions past a query's group read "no neighbour"
+            cand = np.append(cand[by], _NO_NEIGHBOUR)
+            dist = np.append(dist[by], _FAR)
+            row = row[by]
+            group_start = np.searchsorted(row, np.arange(len(rows)))
+            group_size = np.searchsorted(row, np.arange(len(rows)), side='right') - group_start
+            take = np.arange(k)[None, :]
+            valid = take < group_size[:, None]
+            pos = np.where(valid, group_start[:, None] + take, len(row))
+            found = cand[pos]
+            kth = dist[pos[:, -1]]
+
+            # Exact when the k-th neighbour lies within one cell (or the grid spans everything)
+            done = final | (kth <= cell * cell)
+            neighbours[rows[done]] = found[done]
+            unresolved.append(rows[~done])
+
+        pending = np.concatenate(unresolved)
+        cell *= 2
+    return neighbours
+
+
+def brute_force_knn(points, k, queries, candidates, key=None):
+    """O(N^2) reference for knn, same tie-breaking"""
+    points = np.asarray(points, dtype=np.int64)
+    candidates = np.asarray(candidates, dtype=np.int64)
+    neighbours = np.full((len(queries), k), _NO_NEIGHBOUR, dtype=np.int64)
+    for row, q in enumerate(np.asarray(queries).tolist()):
+        cand = candidates[candidates != q]
+        if key is not None:
+            cand = cand[key[cand] < key[q]]
+        dist = ((points[cand] - points[q]) ** 2).sum(axis=1)
+        best = cand[np.lexsort((cand, dist))[:k]]
+        neighbours[row, :len(best)] = best
+    return neighbours
+
+
+def attribute_predictor(modes, neighbour_attrs):
+    """AttributePredictor: neighbour[mode] for mode < K, floor mean for mode == K, else 0"""
+    modes = np.asarray(modes, dtype=np.int64)
+    k = neighbour_attrs.shape[1]
+    picked = np.take_along_axis(neighbour_attrs, np.minimum(modes, k - 1)[:, None], axis=1)[:, 0]
+    mean = neighbour_attrs.sum(axis=1) // k
+    return np.where(modes < k, picked, np.where(modes == k, mean, 0))
+
+
+def attribute_combiner(predicted, residual, rtl_arithmetic=True):
+    """AttributeCombiner -> (final_attribute, overflow_flag)
+
+    temp is a 9-bit signed sum, so pred + res above 255 wraps negative; the
+    `temp > 255` branch can never fire and those overflows clamp to 0.
+    rtl_arithmetic=False clamps them to 255 instead.
+    """
+    total = np.asarray(predicted, dtype=np.int64) + np.asarray(residual, dtype=np.int64)
+    overflow = (total < 0) | (total > ATTR_MAX)
+    if rtl_arithmetic:
+        temp = ((total + (1 << ATTR_WIDTH)) & ((1 << (ATTR_WIDTH + 1)) - 1)) - (1 << ATTR_WIDTH)
+        return np.where(temp < 0, 0, temp).astype(np.uint8), overflow
+    return np.clip(total, 0, ATTR_MAX).astype(np.uint8), overflow
+
+
+class AttributeDecompressorModel:
+    """AttributeDecompressor over a whole decoded scan
+
+    build() ranks the geometry in Morton order, assigns levels of detail and
+    finds every point's K nearest neighbours among points decoded before
+    it: earlier level-0 points for level 0, all lower levels otherwise.
+    run() then decodes level 0 point by point (it is 1/2^(L-1) of the
+    scan) and every other level as one vectorized predict + combine.
+    Inputs are per point, in geometry order; missing neighbours read 0.
+    """
+
+    def __init__(self, k=K, levels=LOD_LEVELS, rtl_arithmetic=True):
+        if not 1 <= k < (1 << MODE_WIDTH):
+            raise ValueError(f"K must be 1..{(1 << MODE_WIDTH) - 1}, got {k}")
+        self.k = k
+        self.levels = levels
+        self.rtl_arithmetic = rtl_arithmetic
+        self.neighbours = None
+
+    def build(self, points, search=knn):
+        """Neighbour lists for one scan's decoded geometry (search=brute_force_knn for the O(N^2) reference)
+
+        Level 0 searches earlier level-0 points; level l searches every
+        point below it, each with a grid over just those candidates.
+        """
+        points = np.asarray(points, dtype=np.int64).reshape(-1, 3)
+        self.level, rank = lod_levels(points, self.levels)
+        base = np.flatnonzero(self.level == 0)
+        self.base_order = base[np.argsort(rank[base], kind='stable')]
+        key = np.zeros(len(points), dtype=np.int64)
+        key[self.base_order] = np.arange(len(base))
+        self.neighbours = np.full((len(points), self.k), _NO_NEIGHBOUR, dtype=np.int64)
+        self.neighbours[base] = search(points, self.k, base, base, key)
+        for level in range(1, self.levels):
+            queries = np.flatnonzero(self.level == level)
+            self.neighbours[queries] = search(points, self.k, queries, np.flatnonzero(self.level < level))
+        return self.neighbours
+
+    def run(self, modes, residual_symbols):
+        """Per-point modes and residual symbols -> (final_attribute, error_flag)"""
+        if self.neighbours is None:
+            raise ValueError("Call build(points) before run()")
+        modes = np.asarray(modes, dtype=np.int64) & ((1 << MODE_WIDTH) - 1)
+        residual = np.asarray(residual_symbols, dtype=np.uint8).view(np.int8).astype(np.int64)
+        n = len(self.neighbours)
+        attrs = np.zeros(n + 1, dtype=np.int64)      # attrs[-1]: missing neighbour
+        overflow = np.zeros(n, dtype=bool)
+
+        nb = self.neighbours
+        for i in self.base_order.tolist():
+            pred = attribute_predictor(modes[i:i + 1], attrs[nb[i:i + 1]])
+            value, flag = attribute_combiner(pred, residual[i:i + 1], self.rtl_arithmetic)
+            attrs[i], overflow[i] = value[0], flag[0]
+        for level in range(1, self.levels):
+            idx = np.flatnonzero(self.level == level)
+            pred = attribute_predictor(modes[idx], attrs[nb[idx]])
+            attrs[idx], overflow[idx] = attribute_combiner(pred, residual[idx], self.rtl_arithmetic)
+
+        return attrs[:n].astype(np.uint8), (modes > self.k) | overflow
+
+    __call__ = run
+
+    def encode(self, attributes):
+        """Encoder side: per point, the mode with the smallest residual, closed loop -> (modes, residual symbols)"""
+        target = np.asarray(attributes, dtype=np.int64)
+        n = len(self.neighbours)
+        attrs = np.zeros(n + 1, dtype=np.int64)
+        modes = np.zeros(n, dtype=np.int64)
+        residual = np.zeros(n, dtype=np.int64)
+        all_modes = np.arange(self.k + 1)
+
+        def choose(idx):
+            nb_attrs = attrs[self.neighbours[idx]]
+            preds = np.stack([attribute_predictor(np.full(len(idx), m), nb_attrs) for m in all_modes], axis=1)
+            res = np.clip(target[idx, None] - preds, -128, 127)
+            best = np.argmin(np.abs(target[idx, None] - preds), axis=1)
+            modes[idx] = best
+            residual[idx] = res[np.arange(len(idx)), best]
+            attrs[idx], _ = attribute_combiner(preds[np.arange(len(idx)), best], residual[idx], self.rtl_arithmetic)
+
+        for i in self.base_order.tolist():
+            choose(np.array([i]))
+        for level in range(1, self.levels):
+            choose(np.flatnonzero(self.level == level))
+        return modes, (residual & 0xFF).astype(np.uint8)
+
+
+def intensity(points, seed=0):
+    """Synthetic reflectivity: smooth in range and height plus sensor noise"""
+    rng = np.random.default_rng(seed)
+    p = np.asarray(points, dtype=np.float64)
+    distance = np.linalg.norm(p[:, :2], axis=1)
+    value = 140 + 60 * np.sin(distance / 900) + 30 * np.cos(p[:, 2] / 400) + rng.normal(0, 4, len(p))
+    return np.clip(np.round(value), 0, ATTR_MAX).astype(np.uint8)
+
+
+if __name__ == "__main__":
+    print("🎨 LiDAR Attribute Decompressor Model Demo")
+    print("=" * 50)
+
+    points, _ = lidar_scan(100000)
+    attributes = intensity(points)
+    model = AttributeDecompressorModel()
+
+    start = time.perf_counter()
+    model.build(points)
+    build_time = time.perf_counter() - start
+    modes, symbols = model.encode(attributes)
+
+    start = time.perf_counter()
+    decoded, errors = model.run(modes, symbols)
+    run_time = time.perf_counter() - start
+
+    print(f"  Scan: {len(points)} points, {LOD_LEVELS} LoD levels, K={K}")
+    print(f"  Neighbour index + queries: {build_time * 1000:.0f} ms; predict + combine: {run_time * 1000:.0f} ms")
+    print(f"  Round trip: {np.array_equal(decoded, attributes)}, errors: {int(errors.sum())}, "
+          f"modes: {np.bincount(modes, minlength=K + 1).tolist()}")
+
+    # Brute force on a subset, to show the O(N^2) it replaces
+    subset = points[:5000]
+    start = time.perf_counter()
+    reference = AttributeDecompressorModel().build(subset, search=brute_force_knn)
+    brute_time = time.perf_counter() - start
+    print(f"  Brute force on {len(subset)} points: {brute_time * 1000:.0f} ms "
+          f"(~{brute_time * (len(points) / len(subset)) ** 2:.0f} s at {len(points)}), "
+          f"grid index matches: {np.array_equal(AttributeDecompressorModel().build(subset), reference)}")
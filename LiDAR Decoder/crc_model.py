@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+CRC-32 Model of the LiDAR BitstreamReader CRCChecker
+Reflected CRC-32 tables, slicing-by-8 over every 512-bit packet of a recording
+at once, and the crc_table.mem the RTL loads with $readmemh
+"""
+
+import os
+import time
+import zlib
+import tempfile
+from functools import lru_cache
+import numpy as np
+
+from memh import load_mem
+
+# CRCChecker parameters
+PACKET_BITS = 512
+PACKET_BYTES = PACKET_BITS // 8
+CRC_POLY = 0xEDB88320            # CRC-32 (IEEE 802.3), reflected
+CRC_INIT = 0xFFFFFFFF
+CRC_BYTES = 4                    # Sealing field: bitstream[31:0], the last 4 bytes of a packet
+SLICE_BYTES = 8
+BULK_MIN_BYTES = 1 << 14         # crc32() below this runs the scalar loop only
+
+CRC_TABLE_MEM = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                             'Bitstream Reader', 'CRC Checker', 'crc_table.mem')
+
+
+def crc_tables(poly=CRC_POLY):
+    """(8, 256) uint32 slicing-by-8 tables; row 0 is the byte-wise crc_table"""
+    crc = np.arange(256, dtype=np.uint32)
+    for _ in range(8):
+        crc = np.where(crc & 1, (crc >> 1) ^ np.uint32(poly), crc >> 1).astype(np.uint32)
+    return crc_tables_from(crc)
+
+
+def crc_tables_from(table):
+    """Slicing-by-8 tables extended from a 256-entry byte table (e.g. loaded from crc_table.mem)"""
+    tables = np.zeros((SLICE_BYTES, 256), dtype=np.uint32)
+    tables[0] = np.asarray(table, dtype=np.uint32)
+    for k in range(1, SLICE_BYTES):
+        tables[k] = (tables[k - 1] >> 8) ^ tables[0][tables[k - 1] & 0xFF]
+    return tables
+
+
+TABLES = crc_tables()
+
+
+def write_mem(path=CRC_TABLE_MEM, table=None):
+    """Write the 256-entry crc_table as a $readmemh file (one 32-bit word per line)"""
+    table = TABLES[0] if table is None else np.asarray(table)
+    with open(path, 'w') as f:
+        f.write(f"// CRC-32 table, reflected polynomial 32'h{CRC_POLY:08X} (generated by crc_model.py)\n")
+        f.writelines(f"{int(v):08X}\n" for v in table)
+    return path
+
+
+def _slice_by_8(words, crc, tables):
+    """Advance one CRC register per row over (N, 2m) little-endian 32-bit words, 8 bytes per step"""
+    for k in range(0, words.shape[1], 2):
+        lo = words[:, k] ^ crc
+        hi = words[:, k + 1]
+        crc = (tables[7][lo & 0xFF] ^ tables[6][(lo >> 8) & 0xFF] ^ tables[5][(lo >> 16) & 0xFF]
+               ^ tables[4][lo >> 24] ^ tables[3][hi & 0xFF] ^ tables[2][(hi >> 8) & 0xFF]
+               ^ tables[1][(hi >> 16) & 0xFF] ^ tables[0][hi >> 24])
+    return crc
+
+
+@lru_cache(maxsize=8)
+def _zeros_operator(length, table_bytes):
+    """Byte tables of the linear map "run `length` zero bytes through the register" (zlib's crc32_combine)"""
+    tables = np.frombuffer(table_bytes, dtype=np.uint32).reshape(SLICE_BYTES, 256)
+    states = (np.arange(256, dtype=np.uint32)[None, :] << np.uint32(8) * np.arange(4, dtype=np.uint32)[:, None])
+    zeros = np.zeros((4 * 256, length // 4), dtype=np.uint32)
+    return [row.tolist() for row in _slice_by_8(zeros, states.reshape(-1), tables).reshape(4, 256)]
+
+
+def crc32(data, crc=0, tables=TABLES):
+    """zlib-compatible CRC-32 of a byte string, slicing-by-8 over 64-bit words
+
+    Bulk data is cut into ~sqrt(n)/4-byte chunks whose CRCs run in lockstep
+    through the vectorized kernel; the chunk CRCs are then folded in order,
+    each step a shift of the register past one chunk (the CRC is linear).
+    """
+    t = [row.tolist() for row in tables]
+    data = memoryview(bytes(data))
+    crc ^= CRC_INIT
+    start = 0
+    if len(data) >= BULK_MIN_BYTES:
+        chunk = max(int(np.sqrt(len(data))) // 4 // SLICE_BYTES * SLICE_BYTES, 256)
+        start = len(data) // chunk * chunk
+        words = np.frombuffer(data[:start], dtype='<u4').reshape(-1, chunk // 4)
+        parts = _slice_by_8(words, np.zeros(len(words), dtype=np.uint32), tables).tolist()
+        z0, z1, z2, z3 = _zeros_operator(chunk, np.ascontiguousarray(tables, dtype=np.uint32).tobytes())
+        for part in parts:
+            crc = z0[crc & 0xFF] ^ z1[(crc >> 8) & 0xFF] ^ z2[(crc >> 16) & 0xFF] ^ z3[crc >> 24] ^ part
+
+    n = start + (len(data) - start) // SLICE_BYTES * SLICE_BYTES
+    for word in np.frombuffer(data[start:n], dtype='<u8').tolist():
+        lo = (word & 0xFFFFFFFF) ^ crc
+        hi = word >> 32
+        crc = (t[7][lo & 0xFF] ^ t[6][(lo >> 8) & 0xFF] ^ t[5][(lo >> 16) & 0xFF] ^ t[4][lo >> 24]
+               ^ t[3][hi & 0xFF] ^ t[2][(hi >> 8) & 0xFF] ^ t[1][(hi >> 16) & 0xFF] ^ t[0][hi >> 24])
+    for byte in data[n:]:
+        crc = t[0][(crc ^ byte) & 0xFF] ^ (crc >> 8)
+    return crc ^ CRC_INIT
+
+
+def _rtl_order(packets):
+    """(N, 64) packets, byte 0 = bitstream[511:504] -> bytes in CRCChecker order (bitstream[i*8 +: 8], i = 0..63)"""
+    packets = np.asarray(packets, dtype=np.uint8).reshape(-1, PACKET_BYTES)
+    return np.ascontiguousarray(packets[:, ::-1])
+
+
+def crc_register(packets, tables=TABLES):
+    """calculated_crc of every packet: init CRC_INIT, no final XOR, slicing-by-8 across all packets at once"""
+    words = _rtl_order(packets).view('<u4')
+    return _slice_by_8(words, np.full(len(words), CRC_INIT, dtype=np.uint32), tables)
+
+
+def seal_packets(packets, tables=TABLES):
+    """Fill bitstream[31:0] of every packet so that CRCChecker's calculated_crc is 0
+
+    CRCChecker reads bitstream[7:0] first, so the field is processed first:
+    the CRC is run backwards from 0 over the other 60 bytes, and since 4
+    bytes XOR straight into the register, the field is that state ^ CRC_INIT.
+    """
+    packets = np.array(packets, dtype=np.uint8).reshape(-1, PACKET_BYTES)
+    order = _rtl_order(packets)
+    table = tables[0]
+    # Top bytes of the table are a permutation of 0..255: j = inverse[crc' >> 24]
+    inverse = np.zeros(256, dtype=np.uint32)
+    inverse[table >> 24] = np.arange(256, dtype=np.uint32)
+    state = np.zeros(len(packets), dtype=np.uint32)
+    for i in range(PACKET_BYTES - 1, CRC_BYTES - 1, -1):
+        j = inverse[state >> 24]
+        state = ((state ^ table[j]) << 8) | (j ^ order[:, i])
+    for _ in range(CRC_BYTES):
+        j = inverse[state >> 24]
+        state = ((state ^ table[j]) << 8) | j
+    field = state ^ np.uint32(CRC_INIT)
+    packets[:, -CRC_BYTES:] = field.astype('>u4').view(np.uint8).reshape(-1, CRC_BYTES)
+    return packets
+
+
+class CRCCheckerModel:
+    """CRCChecker over whole recordings: one crc_error per 512-bit packet
+
+    crc_enable is BitstreamReader's header_valid (version byte 1..15).
+    """
+
+    def __init__(self, tables=None, mem_path=None):
+        if mem_path is not None:
+            tables = crc_tables_from(load_mem(mem_path))
+        self.tables = TABLES if tables is None else tables
+
+    def run(self, packets):
+        """(N, 64) packets -> (N,) crc_error"""
+        packets = np.asarray(packets, dtype=np.uint8).reshape(-1, PACKET_BYTES)
+        version = packets[:, 0]
+        crc_enable = (version >= 0x01) & (version <= 0x0F)
+        return crc_enable & (crc_register(packets, self.tables) != 0)
+
+    __call__ = run
+
+    def check_stream(self, path):
+        """crc_error of every packet of a recorded stream file"""
+        data = np.fromfile(path, dtype=np.uint8)
+        if len(data) % PACKET_BYTES:
+            raise ValueError(f"Stream of {len(data)} bytes is not a whole number of {PACKET_BYTES}-byte packets")
+        return self.run(data.reshape(-1, PACKET_BYTES))
+
+
+def write_stream(path, n_packets, corrupt=0.0, seed=0):
+    """Recording of sealed version-1 packets; a `corrupt` share get one flipped bit. Returns the corrupted mask"""
+    rng = np.random.default_rng(seed)
+    packets = rng.integers(0, 256, size=(n_packets, PACKET_BYTES), dtype=np.uint8)
+    packets[:, 0] = 0x01
+    packets[:, 1:3] = rng.integers(0, 1 << 16, size=n_packets).astype('>u2').view(np.uint8).reshape(-1, 2)
+    packets = seal_packets(packets)
+    corrupted = rng.random(n_packets) < corrupt
+    rows = np.flatnonzero(corrupted)
+    bits = rng.integers(8, PACKET_BITS, size=len(rows))       # Keep the version byte intact
+    packets[rows, bits // 8] ^= (1 << (bits % 8)).astype(np.uint8)
+    packets.tofile(path)
+    return corrupted
+
+
+if __name__ == "__main__":
+    print("🔐 LiDAR CRC-32 Model Demo")
+    print("=" * 50)
+
+    data = np.random.default_rng(1).integers(0, 256, size=1 << 20, dtype=np.uint8).tobytes()
+    start = time.perf_counter()
+    value = crc32(data)
+    elapsed = time.perf_counter() - start
+    print(f"  crc32 (1 MiB): {value:08X}, zlib {zlib.crc32(data):08X}, {len(data) / elapsed / 1e6:.0f} MB/s")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'lidar.bin')
+        n = 500000
+        corrupted = write_stream(path, n, corrupt=0.01)
+        model = CRCCheckerModel(mem_path=CRC_TABLE_MEM) if os.path.exists(CRC_TABLE_MEM) else CRCCheckerModel()
+        start = time.perf_counter()
+        errors = model.check_stream(path)
+        elapsed = time.perf_counter() - start
+        print(f"  Stream: {n} packets ({n * PACKET_BYTES / 1e6:.0f} MB), {int(errors.sum())} crc_error, "
+              f"matches injected: {np.array_equal(errors, corrupted)}")
+        print(f"  Check: {elapsed * 1000:.0f} ms ({n * PACKET_BYTES / elapsed / 1e6:.0f} MB/s)")
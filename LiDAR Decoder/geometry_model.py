@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+Run-Vectorized Golden Model of the LiDAR GeometryDecompressor
+PointPredictor + AdderUnit solved in closed form per mode run: mode 00 runs as
+cumulative sums, mode 01 runs as second-order cumulative sums
+"""
+
+import time
+import numpy as np
+
+# GeometryDecompressor widths / PointPredictor modes
+COORD_BITS = 32
+COORD_MIN = -(1 << (COORD_BITS - 1))
+COORD_MAX = (1 << (COORD_BITS - 1)) - 1
+MODE_PREVIOUS = 0b00       # pred = P1
+MODE_LINEAR = 0b01         # pred = 2 * P1 - P2
+# Other modes predict 0, so the residual is the point
+
+
+def wrap32(values):
+    """Two's-complement wrap to signed 32 bits (int64 in, int64 out)"""
+    return ((np.asarray(values, dtype=np.int64) - COORD_MIN) & ((1 << COORD_BITS) - 1)) + COORD_MIN
+
+
+def mode_runs(modes):
+    """(start, stop, mode) of every run of equal modes"""
+    modes = np.asarray(modes)
+    if len(modes) == 0:
+        return []
+    starts = np.concatenate([np.zeros(1, dtype=np.int64), np.flatnonzero(np.diff(modes)) + 1])
+    stops = np.append(starts[1:], len(modes))
+    return list(zip(starts.tolist(), stops.tolist(), modes[starts].tolist()))
+
+
+def _predict(mode, points, p1, p2):
+    """PointPredictor for every point of a run, given the run's reconstructed points"""
+    prev1 = np.concatenate([p1[None], points[:-1]])
+    if mode == MODE_PREVIOUS:
+        return prev1
+    if mode == MODE_LINEAR:
+        prev2 = np.concatenate([p2[None], p1[None], points[:-2]])[:len(points)]
+        return wrap32(2 * prev1 - prev2)
+    return np.zeros_like(points)
+
+
+def _run_closed_form(mode, res, p1, p2):
+    """One run with 32-bit wraparound: P = p1 + cumsum(r), or p1 + i * (p1 - p2) + cumsum(cumsum(r))"""
+    if mode == MODE_PREVIOUS:
+        return wrap32(p1 + np.cumsum(res, axis=0))
+    if mode == MODE_LINEAR:
+        # d_i = P_i - P_{i-1} = d_0 + cumsum(r); int64 overflow wraps mod 2^64, which keeps mod 2^32 exact
+        steps = np.arange(1, len(res) + 1, dtype=np.int64)[:, None]
+        return wrap32(p1 + steps * (p1 - p2) + np.cumsum(np.cumsum(res, axis=0), axis=0))
+    return wrap32(res)
+
+
+def decompress(modes, residuals, p1=None, p2=None, rtl_arithmetic=True):
+    """(n,) modes and (n, 3) residuals -> ((n, 3) int32 points, last two points)
+
+    The predictor's 2 * P1 - P2 wraps to 32 bits in both settings.
+    rtl_arithmetic=True keeps AdderUnit's saturating add. A run is then
+    solved in wraparound closed form and checked for adds that leave the
+    int32 range. From the first such point the run is saturated there and
+    re-solved. rtl_arithmetic=False wraps the add as well.
+    """
+    residuals = np.asarray(residuals, dtype=np.int64).reshape(-1, 3)
+    modes = np.asarray(modes)
+    if len(modes) != len(residuals):
+        raise ValueError(f"Got {len(modes)} modes for {len(residuals)} residuals")
+    p1 = np.zeros(3, dtype=np.int64) if p1 is None else np.asarray(p1, dtype=np.int64)
+    p2 = np.zeros(3, dtype=np.int64) if p2 is None else np.asarray(p2, dtype=np.int64)
+    points = np.empty((len(residuals), 3), dtype=np.int64)
+
+    for start, stop, mode in mode_runs(modes):
+        while start < stop:
+            res = residuals[start:stop]
+            run = _run_closed_form(mode, res, p1, p2)
+            done = len(run)
+            if rtl_arithmetic:
+                total = _predict(mode, run, p1, p2) + res
+                overflow = np.flatnonzero(((total < COORD_MIN) | (total > COORD_MAX)).any(axis=1))
+                if len(overflow):
+                    done = int(overflow[0]) + 1
+                    run[done - 1] = np.clip(total[done - 1], COORD_MIN, COORD_MAX)
+            points[start:start + done] = run[:done]
+            p2 = run[done - 2] if done >= 2 else p1
+            p1 = run[done - 1]
+            start += done
+
+    return points.astype(np.int32), (p1, p2)
+
+
+def compress(points, modes):
+    """Encoder side: residual = P - pred with 32-bit wraparound (inverse of rtl_arithmetic=False)"""
+    points = np.asarray(points, dtype=np.int64).reshape(-1, 3)
+    residuals = np.empty_like(points)
+    p1 = p2 = np.zeros(3, dtype=np.int64)
+    for start, stop, mode in mode_runs(modes):
+        run = points[start:stop]
+        residuals[start:stop] = wrap32(run - _predict(mode, run, p1, p2))
+        p2 = run[-2] if len(run) >= 2 else p1
+        p1 = run[-1]
+    return residuals.astype(np.int32)
+
+
+class GeometryDecompressorModel:
+    """GeometryDecompressor over whole scans, P_prev1/P_prev2 carried across calls
+
+    One call decodes as many points as the RTL produces over that many
+    IDLE -> PROCESS cycles with enable held; reset clears the history.
+    """
+
+    def __init__(self, rtl_arithmetic=True):
+        self.rtl_arithmetic = rtl_arithmetic
+        self.reset()
+
+    def reset(self):
+        self.P_prev1 = np.zeros(3, dtype=np.int64)
+        self.P_prev2 = np.zeros(3, dtype=np.int64)
+
+    def run(self, modes, residuals):
+        """(n,) modes, (n, 3) residuals -> (n, 3) int32 P_x, P_y, P_z"""
+        points, (self.P_prev1, self.P_prev2) = decompress(modes, residuals, self.P_prev1, self.P_prev2,
+                                                          self.rtl_arithmetic)
+        return points
+
+    __call__ = run
+
+
+def lidar_scan(n_points, rings=64, seed=0):
+    """Synthetic scan in millimetres with encoder mode choices
+
+    Each ring is a noisy closed contour: its first point is coded raw
+    (mode 10), then mostly linear extrapolation with stretches of
+    previous-point prediction.
+    """
+    rng = np.random.default_rng(seed)
+    per_ring = -(-n_points // rings)
+    azimuth = np.linspace(0, 2 * np.pi, per_ring, endpoint=False)
+    points, modes = [], []
+    for ring in range(rings):
+        radius = 10000 + 4000 * np.sin(2 * azimuth + rng.uniform(0, 2 * np.pi)) + rng.normal(0, 20, per_ring)
+        elevation = np.deg2rad(-25 + 27 * ring / rings)
+        xyz = np.stack([radius * np.cos(azimuth), radius * np.sin(azimuth),
+                        radius * np.tan(elevation) + 1700], axis=1)
+        points.append(np.round(xyz).astype(np.int64))
+        ring_modes = np.where(rng.random(per_ring) < 0.995, MODE_LINEAR, MODE_PREVIOUS)
+        # Mode decisions per 64-point block, so runs stay long
+        ring_modes = np.repeat(ring_modes[::64], 64)[:per_ring]
+        ring_modes[0] = 0b10
+        modes.append(ring_modes)
+    return np.concatenate(points)[:n_points], np.concatenate(modes)[:n_points]
+
+
+if __name__ == "__main__":
+    print("📐 LiDAR Geometry Decompressor Model Demo")
+    print("=" * 50)
+
+    points, modes = lidar_scan(100000)
+    residuals = compress(points, modes)
+    model = GeometryDecompressorModel()
+
+    start = time.perf_counter()
+    decoded = model.run(modes, residuals)
+    elapsed = time.perf_counter() - start
+
+    print(f"  Scan: {len(points)} points in {len(mode_runs(modes))} mode runs, "
+          f"mean |residual| {np.abs(residuals).mean():.1f} mm")
+    print(f"  Decompress: {elapsed * 1000:.1f} ms ({len(points) / elapsed / 1e6:.1f} M points/s)")
+    print(f"  Round trip: {np.array_equal(decoded, points)}")
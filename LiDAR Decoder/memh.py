@@ -0,0 +1,28 @@
+#!/usr/bin/env python3
+"""
+$readmemh Reader for the LiDAR Decoder Models
+Loads the .mem tables the RTL initialises its lookup memories from
+"""
+
+import re
+import numpy as np
+
+
+def load_mem(path, size=256):
+    """$readmemh file -> int64 array of `size` words (// and /* */ comments, @address records)
+
+    Fusion Core/fusion_core_model.py's read_memh parses the same syntax for
+    the fusion_compressor parameters; keep the two in step.
+    """
+    table = np.zeros(size, dtype=np.int64)
+    addr = 0
+    with open(path) as f:
+        for token in re.sub(r'//[^\n]*|/\*.*?\*/', ' ', f.read(), flags=re.S).split():
+            if token.startswith('@'):
+                addr = int(token[1:], 16)
+                continue
+            if addr >= size:
+                raise ValueError(f"{path}: address {addr:#x} beyond a {size}-word memory")
+            table[addr] = int(token.replace('_', ''), 16)
+            addr += 1
+    return table
@@ -0,0 +1,285 @@
+#!/usr/bin/env python3
+"""
+Range-Coder Model of the LiDAR EntropyDecoder
+Adaptive binary range coder with 16-bit range and a precomputed normalization
+shift table, decoding many independent slices in lockstep, plus matching encoder
+"""
+
+import time
+import numpy as np
+
+# EntropyDecoder widths
+RANGE_BITS = 16
+RANGE_INIT = 0xFFFF              # RangeInitializer
+RANGE_HALF = 0x8000              # RangeNormalizer threshold
+TOTAL_PROB = 0xFFFF              # RangeCalculator total_prob
+SYMBOL_BITS = 8                  # encoded_data / symbol_code width
+TABLE_SIZE = 256
+
+# Adaptive binary model: P(bit = 0) in 1/4096 units, moved 1/32 of the way per bit
+PROB_BITS = 12
+PROB_INIT = 1 << (PROB_BITS - 1)
+ADAPT_SHIFT = 5
+
+# Left shift that brings a range back to [RANGE_HALF, 2^RANGE_BITS)
+_lengths = np.zeros(1 << RANGE_BITS, dtype=np.int64)
+_lengths[1:] = np.floor(np.log2(np.arange(1, 1 << RANGE_BITS))).astype(np.int64) + 1
+NORM_SHIFT = np.where(_lengths > 0, RANGE_BITS - _lengths, 0).astype(np.uint8)
+
+
+def default_tables():
+    """Stand-ins for range_table.mem / symbol_table.mem / decode_table.mem (not in the tree)
+
+    Evenly spaced range thresholds and identity symbol/decode tables;
+    memh.load_mem reads the real files when they exist.
+    """
+    index = np.arange(TABLE_SIZE, dtype=np.int64)
+    return (index + 1) * 256 - 1, index.copy(), index.copy()
+
+
+def search_symbol(value, range_table, max_steps=64):
+    """SymbolTableLookup's binary-search FSM; returns the table index, or None on lookup_error / hang
+
+    low, high, mid are 8-bit registers: low <= mid + 1 wraps at 255, so a
+    value at or above range_table[255] never terminates (no lookup_valid).
+    """
+    low, high, mid = 0, 255, 128
+    for _ in range(max_steps):
+        if low > high:
+            return None
+        if value < range_table[mid]:
+            if mid == 0 or value >= range_table[mid - 1]:
+                return mid
+            high = (mid - 1) & 0xFF
+            mid = (low + mid - 1) >> 1 & 0xFF
+        else:
+            low = (mid + 1) & 0xFF
+            mid = (mid + 1 + high) >> 1 & 0xFF
+    return None
+
+
+def rtl_symbol_luts(range_table=None, symbol_table=None, decode_table=None, rtl_arithmetic=True):
+    """Per-encoded_data dataflow of RangeCalculator -> SymbolMapper as 256-entry tables
+
+    Returns (symbols, error, error_if_bitstream_zero). RangeUpdater computes
+    range_current * cum_prob in the 16-bit context of its operands, so with
+    rtl_arithmetic the product wraps and range_updated is 0 for every byte:
+    the normalizer then reports underflow. rtl_arithmetic=False keeps the
+    full product (range_updated = prob). Pipeline latency is not modelled.
+    """
+    defaults = default_tables()
+    range_table = defaults[0] if range_table is None else np.asarray(range_table)
+    symbol_table = defaults[1] if symbol_table is None else np.asarray(symbol_table)
+    decode_table = defaults[2] if decode_table is None else np.asarray(decode_table)
+
+    symbols = np.zeros(TABLE_SIZE, dtype=np.uint16)
+    error = np.zeros(TABLE_SIZE, dtype=bool)
+    error_zero = np.zeros(TABLE_SIZE, dtype=bool)
+    for byte in range(TABLE_SIZE):
+        prob = (0x1000 + byte * 0x0100) & 0xFFFF                       # ProbabilityLookup
+        if prob >= TOTAL_PROB:
+            updated = RANGE_INIT
+            error[byte] = True
+        elif rtl_arithmetic:
+            updated = ((RANGE_INIT * prob) & 0xFFFF) // TOTAL_PROB      # RangeUpdater, 16-bit product
+        else:
+            updated = RANGE_INIT * prob // TOTAL_PROB
+        if updated == 0:                                               # RangeNormalizer
+            error[byte] = True
+            continue
+        small = updated < RANGE_HALF
+        normalized = (updated << 1) & 0xFFFF if small else updated
+        error_zero[byte] = small
+        index = search_symbol(normalized, range_table)
+        if index is None:
+            error[byte] = True
+            continue
+        symbols[byte] = decode_table[symbol_table[index]]
+    return symbols, error, error | error_zero
+
+
+def rtl_decode(encoded_data, bitstream, luts=None):
+    """EntropyDecoder per byte: (decoded_symbol, decode_error); errors output 0 like the RTL"""
+    symbols, error, error_zero = rtl_symbol_luts() if luts is None else luts
+    encoded_data = np.asarray(encoded_data, dtype=np.uint8)
+    errors = np.where(np.asarray(bitstream) == 0, error_zero[encoded_data], error[encoded_data])
+    return np.where(errors, 0, symbols[encoded_data]).astype(np.uint16), errors
+
+
+def default_context_table():
+    """Stand-in for context_table.mem: next context = previous symbol's top two bits"""
+    symbol = np.arange(TABLE_SIZE)[:, None]
+    return np.broadcast_to(symbol >> 6, (TABLE_SIZE, TABLE_SIZE)).astype(np.uint16)
+
+
+class RangeCoderModel:
+    """Adaptive range coder for 8-bit symbols, bit-exact between encoder and decoder
+
+    Each symbol is coded MSB-first as 8 binary decisions down a bit tree;
+    every (context, tree node) has its own adaptive probability. The context
+    of the next symbol is ContextUpdater's context_table[symbol][context],
+    starting from 0. A decision splits the 16-bit range at
+    (range * p) >> PROB_BITS, and NORM_SHIFT[range] gives the renormalization
+    shift in one lookup.
+
+    decode() runs all slices in lockstep, one vectorized step per decision,
+    with slices sorted by length so the active set is a prefix.
+    """
+
+    def __init__(self, context_table=None):
+        table = default_context_table() if context_table is None else np.asarray(context_table)
+        if table.shape != (TABLE_SIZE, TABLE_SIZE):
+            raise ValueError(f"context_table must be ({TABLE_SIZE}, {TABLE_SIZE}), got {table.shape}")
+        self.context_table = table.astype(np.int64)
+        self.num_contexts = int(self.context_table.max()) + 1
+
+    def encode(self, symbols):
+        """One slice of 8-bit symbols -> bytes"""
+        probs = np.full((self.num_contexts, TABLE_SIZE), PROB_INIT, dtype=np.int64).tolist()
+        context_table = self.context_table.tolist()
+        norm_shift = NORM_SHIFT.tolist()
+        out = bytearray()
+        low, low_bits, rng = 0, RANGE_BITS, RANGE_INIT
+        ctx = 0
+        for symbol in np.asarray(symbols, dtype=np.int64).tolist():
+            if not 0 <= symbol < TABLE_SIZE:
+                raise ValueError(f"Symbol {symbol} outside 0..{TABLE_SIZE - 1}")
+            node_probs = probs[ctx]
+            node = 1
+            for k in range(SYMBOL_BITS - 1, -1, -1):
+                bit = (symbol >> k) & 1
+                p = node_probs[node]
+                bound = (rng * p) >> PROB_BITS
+                if bit:
+                    low += bound
+                    rng -= bound
+                    node_probs[node] = p - (p >> ADAPT_SHIFT)
+                    if low >> low_bits:
+                        # Carry into the bytes already written
+                        low &= (1 << low_bits) - 1
+                        i = len(out) - 1
+                        while out[i] == 0xFF:
+                            out[i] = 0
+                            i -= 1
+                        out[i] += 1
+                else:
+                    rng = bound
+                    node_probs[node] = p + (((1 << PROB_BITS) - p) >> ADAPT_SHIFT)
+                node = 2 * node + bit
+                shift = norm_shift[rng]
+                rng <<= shift
+                low <<= shift
+                low_bits += shift
+                while low_bits >= RANGE_BITS + 8:
+                    low_bits -= 8
+                    out.append(low >> low_bits)
+                    low &= (1 << low_bits) - 1
+            ctx = context_table[symbol][ctx]
+        # Flush the low window, zero-padded to a byte
+        pad = -low_bits % 8
+        out += (low << pad).to_bytes((low_bits + pad) // 8, 'big')
+        return bytes(out)
+
+    def decode(self, streams, counts):
+        """Decode independent slices: streams[i] holds counts[i] symbols; returns a list of uint8 arrays"""
+        counts = np.asarray(counts, dtype=np.int64)
+        slices = len(counts)
+        if len(streams) != slices:
+            raise ValueError(f"Got {len(streams)} streams for {slices} symbol counts")
+        order = np.argsort(-counts, kind='stable')
+        sorted_counts = counts[order]
+
+        # All streams in one buffer, each followed by 4 zero bytes; big-endian 32-bit window at every byte
+        parts, starts, pos = [], np.zeros(slices, dtype=np.int64), 0
+        for i, s in enumerate(order):
+            starts[i] = pos
+            parts.append(bytes(streams[s]) + b'\x00' * 4)
+            pos += len(parts[-1])
+        buf = np.frombuffer(b''.join(parts) + b'\x00' * 4, dtype=np.uint8).astype(np.uint32)
+        window = (buf[:-3] << 24) | (buf[1:-2] << 16) | (buf[2:-1] << 8) | buf[3:]
+        window = window.astype(np.int64)
+
+        code = window[starts] >> (32 - RANGE_BITS)
+        bitpos = starts * 8 + RANGE_BITS
+        rng = np.full(slices, RANGE_INIT, dtype=np.int64)
+        probs = np.full(slices * self.num_contexts * TABLE_SIZE, PROB_INIT, dtype=np.int64)
+        slice_base = np.arange(slices, dtype=np.int64) * self.num_contexts * TABLE_SIZE
+        ctx = np.zeros(slices, dtype=np.int64)
+        norm_shift = NORM_SHIFT.astype(np.int64)
+
+        decoded = np.zeros((slices, int(sorted_counts[0]) if slices else 0), dtype=np.uint8)
+        active = slices
+        for t in range(decoded.shape[1]):
+            while sorted_counts[active - 1] <= t:
+                active -= 1
+            r, c, bp = rng[:active], code[:active], bitpos[:active]
+            base = slice_base[:active] + ctx[:active] * TABLE_SIZE
+            node = np.ones(active, dtype=np.int64)
+            for _ in range(SYMBOL_BITS):
+                idx = base + node
+                p = probs[idx]
+                bound = (r * p) >> PROB_BITS
+                bit = c >= bound
+                c -= np.where(bit, bound, 0)
+                np.copyto(r, np.where(bit, r - bound, bound))
+                probs[idx] = np.where(bit, p - (p >> ADAPT_SHIFT), p + (((1 << PROB_BITS) - p) >> ADAPT_SHIFT))
+                node = 2 * node + bit
+                shift = norm_shift[r]
+                r <<= shift
+                bits = (window[bp >> 3] >> (32 - (bp & 7) - shift)) & ((1 << shift) - 1)
+                c <<= shift
+                c |= bits
+                bp += shift
+            symbols = node - TABLE_SIZE
+            decoded[:active, t] = symbols
+            ctx[:active] = self.context_table[symbols, ctx[:active]]
+
+        result = [None] * slices
+        for i, s in enumerate(order):
+            result[s] = decoded[i, :sorted_counts[i]]
+        return result
+
+    run = decode
+    __call__ = run
+
+    def decode_slice(self, stream, count):
+        return self.decode([stream], [count])[0]
+
+
+def lidar_slices(n_slices, points_per_slice, seed=0):
+    """Byte symbols shaped like LiDAR geometry: delta-coded ring ranges, in independent slices"""
+    rng = np.random.default_rng(seed)
+    azimuth = np.linspace(0, 2 * np.pi, points_per_slice, endpoint=False)
+    slices = []
+    for _ in range(n_slices):
+        ranges = 2000 + 800 * np.sin(3 * azimuth + rng.uniform(0, 2 * np.pi)) + rng.normal(0, 6, points_per_slice)
+        deltas = np.diff(np.round(ranges).astype(np.int64), prepend=int(round(ranges[0])))
+        slices.append((np.clip(deltas, -128, 127) & 0xFF).astype(np.uint8))
+    return slices
+
+
+if __name__ == "__main__":
+    print("📦 LiDAR Range-Coder Model Demo")
+    print("=" * 50)
+
+    model = RangeCoderModel()
+    slices = lidar_slices(128, 2048)
+    n = sum(len(s) for s in slices)
+
+    start = time.perf_counter()
+    streams = [model.encode(s) for s in slices]
+    encode_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    decoded = model.decode(streams, [len(s) for s in slices])
+    decode_time = time.perf_counter() - start
+
+    size = sum(len(s) for s in streams)
+    print(f"  Slices: {len(slices)} x {len(slices[0])} symbols, {size * 8 / n:.2f} bits/symbol")
+    print(f"  Encode: {encode_time * 1000:.0f} ms ({n / encode_time / 1e6:.2f} M symbols/s, per slice)")
+    print(f"  Decode: {decode_time * 1000:.0f} ms ({n / decode_time / 1e6:.2f} M symbols/s, lockstep)")
+    print(f"  Round trip: {all(np.array_equal(a, b) for a, b in zip(decoded, slices))}")
+
+    _, error, _ = rtl_symbol_luts()
+    print(f"  RTL dataflow: {int(error.sum())}/256 encoded_data values flag decode_error "
+          f"(16-bit RangeUpdater product)")
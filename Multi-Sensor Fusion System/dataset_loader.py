@@ -13,6 +13,261 @@ import threading
 from queue import Queue
 import struct
 
+# KITTI raw OXTS record layout (one line of oxts/data/*.txt, 30 fields)
+OXTS_FIELDS = (
+    'lat', 'lon', 'alt', 'roll', 'pitch', 'yaw',
+    'vn', 've', 'vf', 'vl', 'vu',
+    'ax', 'ay', 'az', 'af', 'al', 'au',
+    'wx', 'wy', 'wz', 'wf', 'wl', 'wu',
+    'pos_accuracy', 'vel_accuracy',
+    'navstat', 'numsats', 'posmode', 'velmode', 'orimode'
+)
+OXTS_INDEX = {name: i for i, name in enumerate(OXTS_FIELDS)}
+
+class KITTIOxtsReader:
+    """KITTI OXTS (GPS/IMU) reader with columnar storage"""
+    
+    def __init__(self, oxts_path):
+        self.oxts_path = Path(oxts_path)
+        self.data = np.empty((len(OXTS_FIELDS), 0))  # 30 fields x N samples
+        self.timestamps_ns = np.empty(0, dtype=np.int64)
+        self._imu_words = None
+        
+    def load(self):
+        """Parse every oxts/data/*.txt file of a drive in one pass"""
+        
+        files = sorted((self.oxts_path / 'data').glob('*.txt'))
+        if not files:
+            raise FileNotFoundError(f"No OXTS records under {self.oxts_path / 'data'}")
+        
+        # One tokenize + one float conversion for the whole drive
+        blob = b' '.join(f.read_bytes() for f in files)
+        values = np.array(blob.split(), dtype=np.float64)
+        if values.size != len(files) * len(OXTS_FIELDS):
+            raise ValueError(f"Expected {len(OXTS_FIELDS)} fields per OXTS record "
+                             f"({len(files)} files, {values.size} values)")
+        
+        self.data = np.ascontiguousarray(values.reshape(len(files), len(OXTS_FIELDS)).T)
+        self.timestamps_ns = self._load_timestamps(len(files))
+        self._imu_words = None
+        
+        print(f"🧭 KITTI OXTS Loaded: {len(files)} samples "
+              f"({self.sample_rate():.1f} Hz)")
+        return self
+    
+    def _load_timestamps(self, num_samples):
+        """Load oxts/timestamps.txt as int64 nanoseconds"""
+        ts_file = self.oxts_path / 'timestamps.txt'
+        if not ts_file.exists():
+            # Fall back to the nominal KITTI rate of 10 Hz
+            return np.arange(num_samples, dtype=np.int64) * 100_000_000
+        
+        # KITTI stamps are 'YYYY-MM-DD HH:MM:SS.fffffffff'; numpy parses them directly
+        lines = ts_file.read_text().split('\n')
+        stamps = np.array([line[:29] for line in lines if line.strip()], dtype='datetime64[ns]')
+        if stamps.size != num_samples:
+            raise ValueError(f"timestamps.txt has {stamps.size} entries for {num_samples} OXTS records")
+        return stamps.astype(np.int64)
+    
+    def __len__(self):
+        return self.data.shape[1]
+    
+    def field(self, name):
+        """Return one column (view) by OXTS field name"""
+        return self.data[OXTS_INDEX[name]]
+    
+    def sample_rate(self):
+        """Average sample rate in Hz"""
+        if len(self) < 2:
+            return 0.0
+        return (len(self) - 1) * 1e9 / float(self.timestamps_ns[-1] - self.timestamps_ns[0])
+    
+    def imu_stream(self):
+        """High-rate IMU stream: (timestamps_ns, accel (N,3), gyro (N,3))"""
+        accel = self.data[OXTS_INDEX['ax']:OXTS_INDEX['az'] + 1].T
+        gyro = self.data[OXTS_INDEX['wx']:OXTS_INDEX['wz'] + 1].T
+        return self.timestamps_ns, accel, gyro
+    
+    def imu_words(self):
+        """Orientation as 64-bit imu_synchronizer words {w, x, y, z} in Q1.15 (computed once per load)"""
+        
+        if self._imu_words is not None:
+            return self._imu_words
+        half_r = 0.5 * self.field('roll')
+        half_p = 0.5 * self.field('pitch')
+        half_y = 0.5 * self.field('yaw')
+        cr, sr = np.cos(half_r), np.sin(half_r)
+        cp, sp = np.cos(half_p), np.sin(half_p)
+        cy, sy = np.cos(half_y), np.sin(half_y)
+        
+        quat = np.stack([
+            cr * cp * cy + sr * sp * sy,
+            sr * cp * cy - cr * sp * sy,
+            cr * sp * cy + sr * cp * sy,
+            cr * cp * sy - sr * sp * cy
+        ])
+        q15 = np.clip(np.round(quat * 32768), -32768, 32767).astype(np.int64) & 0xFFFF
+        words = (q15[0] << 48) | (q15[1] << 32) | (q15[2] << 16) | q15[3]
+        self._imu_words = words.astype(np.uint64)
+        return self._imu_words
+    
+    def lookup(self, timestamp_ns):
+        """Index of the latest sample at or before timestamp_ns (O(log n), vectorized)"""
+        idx = np.searchsorted(self.timestamps_ns, timestamp_ns, side='right') - 1
+        return np.clip(idx, 0, max(len(self) - 1, 0))
+    
+    def bracket(self, timestamp_ns):
+        """Indices of the samples surrounding timestamp_ns, for interpolation"""
+        prev_idx = self.lookup(timestamp_ns)
+        next_idx = np.minimum(prev_idx + 1, max(len(self) - 1, 0))
+        return prev_idx, next_idx
+    
+    def frame_gps_imu(self, frame_id):
+        """Build the loader's gps_imu block from a real OXTS sample, with its imu_synchronizer word"""
+        index = frame_id % len(self)
+        col = self.data[:, index]
+        return {
+            'position': [float(col[OXTS_INDEX[k]]) for k in ('lat', 'lon', 'alt')],
+            'orientation': [float(col[OXTS_INDEX[k]]) for k in ('roll', 'pitch', 'yaw')],
+            'velocity': [float(col[OXTS_INDEX[k]]) for k in ('vn', 've', 'vu')],
+            'accuracy': float(col[OXTS_INDEX['pos_accuracy']]),
+            'imu_word': int(self.imu_words()[index])
+        }
+
+class AnnotationStore:
+    """Columnar ground-truth store: one row per object, per-frame offsets"""
+    
+    def __init__(self, categories, capacity=1024):
+        self.categories = tuple(categories)
+        self.category_codes = {name: i for i, name in enumerate(self.categories)}
+        self._num_objects = 0
+        self._category = np.empty(capacity, dtype=np.int16)
+        self._boxes = np.empty((capacity, 7), dtype=np.float32)      # x, y, z, l, w, h, yaw
+        self._velocity = np.empty((capacity, 2), dtype=np.float32)   # vx, vy
+        self._bbox2d = np.empty((capacity, 4), dtype=np.float32)     # image box, NaN if unknown
+        self._offsets = [0]
+        self._frame_ids = []
+        
+    def _reserve(self, extra):
+        """Grow the column buffers geometrically"""
+        needed = self._num_objects + extra
+        if needed <= len(self._category):
+            return
+        capacity = max(needed, 2 * len(self._category))
+        for name in ('_category', '_boxes', '_velocity', '_bbox2d'):
+            old = getattr(self, name)
+            new = np.empty((capacity,) + old.shape[1:], dtype=old.dtype)
+            new[:self._num_objects] = old[:self._num_objects]
+            setattr(self, name, new)
+    
+    def new_frame_store(self):
+        """Empty store with the same categories, sized for a single frame"""
+        return AnnotationStore(self.categories, capacity=16)
+    
+    def append_frame(self, frame_id, category, boxes, velocity=None, bbox2d=None):
+        """Append all objects of one frame; returns that frame's position"""
+        count = len(category)
+        self._reserve(count)
+        lo, hi = self._num_objects, self._num_objects + count
+        
+        self._category[lo:hi] = category
+        self._boxes[lo:hi] = boxes
+        self._velocity[lo:hi] = 0.0 if velocity is None else velocity
+        self._bbox2d[lo:hi] = np.nan if bbox2d is None else bbox2d
+        
+        self._num_objects = hi
+        self._offsets.append(hi)
+        self._frame_ids.append(frame_id)
+        return len(self._frame_ids) - 1
+    
+    def __len__(self):
+        return self._num_objects
+    
+    @property
+    def num_frames(self):
+        return len(self._frame_ids)
+    
+    @property
+    def category(self):
+        return self._category[:self._num_objects]
+    
+    @property
+    def boxes(self):
+        return self._boxes[:self._num_objects]
+    
+    @property
+    def velocity(self):
+        return self._velocity[:self._num_objects]
+    
+    @property
+    def bbox2d(self):
+        return self._bbox2d[:self._num_objects]
+    
+    @property
+    def offsets(self):
+        return np.asarray(self._offsets, dtype=np.int64)
+    
+    @property
+    def frame_ids(self):
+        return np.asarray(self._frame_ids, dtype=np.int64)
+    
+    def object_frame_ids(self):
+        """Frame id of every object row"""
+        return np.repeat(self.frame_ids, np.diff(self.offsets))
+    
+    def frame(self, position):
+        """Column views of one frame's objects (no copy)"""
+        lo, hi = self._offsets[position], self._offsets[position + 1]
+        return {
+            'frame_id': self._frame_ids[position],
+            'category': self._category[lo:hi],
+            'boxes': self._boxes[lo:hi],
+            'velocity': self._velocity[lo:hi],
+            'bbox2d': self._bbox2d[lo:hi]
+        }
+    
+    def category_names(self, codes):
+        """Map category codes back to names"""
+        return np.asarray(self.categories, dtype=object)[codes]
+    
+    def mask(self, categories=None, max_range=None, min_range=None, frame_ids=None):
+        """Boolean row mask for a combined class / range / frame query"""
+        keep = np.ones(self._num_objects, dtype=bool)
+        
+        if categories is not None:
+            codes = [self.category_codes[c] for c in categories]
+            keep &= np.isin(self.category, codes)
+        
+        if max_range is not None or min_range is not None:
+            xy = self.boxes[:, :2]
+            dist_sq = np.einsum('ij,ij->i', xy, xy)
+            if max_range is not None:
+                keep &= dist_sq <= max_range * max_range
+            if min_range is not None:
+                keep &= dist_sq >= min_range * min_range
+        
+        if frame_ids is not None:
+            keep &= np.isin(self.object_frame_ids(), frame_ids)
+        
+        return keep
+    
+    def select(self, **query):
+        """Columns of the rows matching mask(**query)"""
+        keep = self.mask(**query)
+        return {
+            'frame_id': self.object_frame_ids()[keep],
+            'category': self.category[keep],
+            'boxes': self.boxes[keep],
+            'velocity': self.velocity[keep],
+            'bbox2d': self.bbox2d[keep]
+        }
+    
+    def counts_per_frame(self, **query):
+        """Number of matching objects in every frame"""
+        keep = self.mask(**query)
+        cumulative = np.concatenate(([0], np.cumsum(keep)))
+        return np.diff(cumulative[self.offsets])
+
 class KITTIDatasetLoader:
     """KITTI Dataset Loader for real-time simulation"""
     
@@ -22,6 +277,13 @@ class KITTIDatasetLoader:
         self.current_sequence = 0
         self.frame_queue = Queue(maxsize=100)
         self.is_streaming = False
+        self.oxts = None
+        self.annotations = AnnotationStore(['Car', 'Pedestrian', 'Cyclist', 'Van'])
+        
+    def load_oxts(self, oxts_path):
+        """Attach real OXTS GPS/IMU data from a KITTI raw drive"""
+        self.oxts = KITTIOxtsReader(oxts_path).load()
+        return self.oxts
         
     def load_sequence_info(self):
         """Load KITTI sequence information"""
@@ -50,8 +312,12 @@ class KITTIDatasetLoader:
         for seq in self.sequences:
             print(f"  Sequence {seq['id']}: {seq['name']} ({seq['frames']} frames)")
     
-    def generate_kitti_frame(self, sequence_id, frame_id):
-        """Generate KITTI-like sensor data frame"""
+    def generate_kitti_frame(self, sequence_id, frame_id, store=None):
+        """Generate KITTI-like sensor data frame
+
+        Objects go to `store`, by default the loader-wide self.annotations;
+        streams pass a per-frame store so annotations are freed with the frame.
+        """
         
         # Simulate KITTI data structure
         frame_data = {
@@ -75,22 +341,28 @@ class KITTIDatasetLoader:
             },
             
             # GPS/IMU data
-            'gps_imu': {
-                'position': [np.random.uniform(-1, 1) for _ in range(3)],
-                'orientation': [np.random.uniform(-np.pi, np.pi) for _ in range(3)],
-                'velocity': [np.random.uniform(-20, 20) for _ in range(3)],
-                'accuracy': np.random.uniform(0.8, 0.95)
-            },
+            'gps_imu': self._get_gps_imu(frame_id),
             
             # Ground truth (for validation)
             'ground_truth': {
-                'objects': self._generate_kitti_objects(),
+                'objects': self._generate_kitti_objects(frame_id, store),
                 'ego_pose': self._generate_ego_pose()
             }
         }
         
         return frame_data
     
+    def _get_gps_imu(self, frame_id):
+        """GPS/IMU block from OXTS when loaded, simulated otherwise"""
+        if self.oxts is not None and len(self.oxts):
+            return self.oxts.frame_gps_imu(frame_id)
+        return {
+            'position': [np.random.uniform(-1, 1) for _ in range(3)],
+            'orientation': [np.random.uniform(-np.pi, np.pi) for _ in range(3)],
+            'velocity': [np.random.uniform(-20, 20) for _ in range(3)],
+            'accuracy': np.random.uniform(0.8, 0.95)
+        }
+    
     def _generate_camera_data(self, width, height):
         """Generate simulated camera data"""
         # Simulate compressed image data
@@ -118,21 +390,23 @@ class KITTIDatasetLoader:
             'R0_rect': np.eye(3)
         }
     
-    def _generate_kitti_objects(self):
-        """Generate KITTI-style object annotations"""
-        objects = []
+    def _generate_kitti_objects(self, frame_id, store=None):
+        """Generate KITTI-style object annotations into the columnar store"""
+        store = self.annotations if store is None else store
         num_objects = np.random.randint(0, 10)
         
-        for i in range(num_objects):
-            obj = {
-                'type': np.random.choice(['Car', 'Pedestrian', 'Cyclist', 'Van']),
-                'bbox': [np.random.uniform(0, 1242) for _ in range(4)],
-                'location': [np.random.uniform(-50, 50) for _ in range(3)],
-                'rotation_y': np.random.uniform(-np.pi, np.pi)
-            }
-            objects.append(obj)
-        
-        return objects
+        boxes = np.empty((num_objects, 7), dtype=np.float32)
+        boxes[:, 0:3] = np.random.uniform(-50, 50, size=(num_objects, 3))      # location
+        boxes[:, 3:6] = np.random.uniform(0.5, 5, size=(num_objects, 3))       # dimensions
+        boxes[:, 6] = np.random.uniform(-np.pi, np.pi, size=num_objects)       # rotation_y
+        
+        position = store.append_frame(
+            frame_id,
+            category=np.random.randint(0, len(store.categories), size=num_objects),
+            boxes=boxes,
+            bbox2d=np.random.uniform(0, 1242, size=(num_objects, 4))
+        )
+        return store.frame(position)
     
     def _generate_ego_pose(self):
         """Generate ego vehicle pose"""
@@ -150,6 +424,11 @@ class NuScenesDatasetLoader:
         self.current_scene = 0
         self.frame_queue = Queue(maxsize=100)
         self.is_streaming = False
+        self.annotations = AnnotationStore([
+            'vehicle.car', 'vehicle.truck', 'vehicle.bus',
+            'human.pedestrian.adult', 'vehicle.bicycle',
+            'vehicle.motorcycle', 'movable_object.trafficcone'
+        ])
         
     def load_scene_info(self):
         """Load nuScenes scene information"""
@@ -182,8 +461,8 @@ class NuScenesDatasetLoader:
         for scene in self.scenes:
             print(f"  Scene {scene['token']}: {scene['name']} ({scene['frames']} frames)")
     
-    def generate_nuscenes_frame(self, scene_token, frame_id):
-        """Generate nuScenes-like sensor data frame"""
+    def generate_nuscenes_frame(self, scene_token, frame_id, store=None):
+        """Generate nuScenes-like sensor data frame (objects go to `store`, see generate_kitti_frame)"""
         
         scene = next(s for s in self.scenes if s['token'] == scene_token)
         
@@ -232,7 +511,7 @@ class NuScenesDatasetLoader:
             
             # Annotations
             'annotations': {
-                'objects': self._generate_nuscenes_objects(),
+                'objects': self._generate_nuscenes_objects(frame_id, store),
                 'ego_pose': self._generate_ego_pose()
             }
         }
@@ -275,28 +554,23 @@ class NuScenesDatasetLoader:
             'rotation': [0, 0, 0, 1]  # quaternion
         }
     
-    def _generate_nuscenes_objects(self):
-        """Generate nuScenes-style annotations"""
-        objects = []
+    def _generate_nuscenes_objects(self, frame_id, store=None):
+        """Generate nuScenes-style annotations into the columnar store"""
+        store = self.annotations if store is None else store
         num_objects = np.random.randint(0, 15)  # More objects in urban
         
-        categories = [
-            'vehicle.car', 'vehicle.truck', 'vehicle.bus',
-            'human.pedestrian.adult', 'vehicle.bicycle',
-            'vehicle.motorcycle', 'movable_object.trafficcone'
-        ]
-        
-        for i in range(num_objects):
-            obj = {
-                'category': np.random.choice(categories),
-                'translation': [np.random.uniform(-50, 50) for _ in range(3)],
-                'size': [np.random.uniform(1, 5) for _ in range(3)],
-                'rotation': [np.random.uniform(-1, 1) for _ in range(4)],  # quaternion
-                'velocity': [np.random.uniform(-10, 10) for _ in range(2)]
-            }
-            objects.append(obj)
-        
-        return objects
+        boxes = np.empty((num_objects, 7), dtype=np.float32)
+        boxes[:, 0:3] = np.random.uniform(-50, 50, size=(num_objects, 3))      # translation
+        boxes[:, 3:6] = np.random.uniform(1, 5, size=(num_objects, 3))         # size
+        boxes[:, 6] = np.random.uniform(-np.pi, np.pi, size=num_objects)       # yaw
+        
+        position = store.append_frame(
+            frame_id,
+            category=np.random.randint(0, len(store.categories), size=num_objects),
+            boxes=boxes,
+            velocity=np.random.uniform(-10, 10, size=(num_objects, 2))
+        )
+        return store.frame(position)
     
     def _generate_ego_pose(self):
         """Generate ego vehicle pose"""
@@ -305,6 +579,67 @@ class NuScenesDatasetLoader:
             'rotation': [np.random.uniform(-1, 1) for _ in range(4)]  # quaternion
         }
 
+class StreamStats:
+    """Per-stream instrumentation: stage timings, queue depth, achieved fps"""
+    
+    STAGES = ('generate', 'convert', 'sleep')
+    
+    def __init__(self, name, target_fps, queue_capacity):
+        self.name = name
+        self.target_fps = target_fps
+        self.queue_capacity = queue_capacity
+        self._lock = threading.Lock()
+        self.reset()
+        
+    def reset(self):
+        """Clear all counters"""
+        with self._lock:
+            self.frames = 0
+            self.dropped = 0
+            self.stage_time = {stage: 0.0 for stage in self.STAGES}
+            self.stage_max = {stage: 0.0 for stage in self.STAGES}
+            self.queue_depth_hist = np.zeros(self.queue_capacity + 1, dtype=np.int64)
+            self.started_at = time.perf_counter()
+            self.last_frame_at = None
+    
+    def record_frame(self, stage_times, queue_depth, dropped):
+        """Account one loop iteration of the stream worker"""
+        with self._lock:
+            self.frames += 1
+            self.dropped += int(dropped)
+            for stage, seconds in stage_times.items():
+                self.stage_time[stage] += seconds
+                if seconds > self.stage_max[stage]:
+                    self.stage_max[stage] = seconds
+            self.queue_depth_hist[min(queue_depth, self.queue_capacity)] += 1
+            self.last_frame_at = time.perf_counter()
+    
+    def snapshot(self):
+        """Consistent copy of the counters as plain Python types"""
+        with self._lock:
+            end = self.last_frame_at if self.last_frame_at is not None else time.perf_counter()
+            wall = max(end - self.started_at, 1e-9)
+            frames = max(self.frames, 1)
+            busy = self.stage_time['generate'] + self.stage_time['convert']
+            depth_levels = np.arange(len(self.queue_depth_hist))
+            hist_total = max(int(self.queue_depth_hist.sum()), 1)
+            
+            return {
+                'stream': self.name,
+                'frames': self.frames,
+                'dropped_frames': self.dropped,
+                'wall_time_s': wall,
+                'target_fps': self.target_fps,
+                'achieved_fps': self.frames / wall,
+                'loader_utilization': busy * self.target_fps / frames,
+                'stage_total_s': dict(self.stage_time),
+                'stage_mean_ms': {k: v * 1000 / frames for k, v in self.stage_time.items()},
+                'stage_max_ms': {k: v * 1000 for k, v in self.stage_max.items()},
+                'queue_depth_histogram': self.queue_depth_hist.tolist(),
+                'queue_depth_mean': float(depth_levels @ self.queue_depth_hist) / hist_total,
+                'queue_full_fraction': float(self.queue_depth_hist[-1]) / hist_total
+            }
+
 class DatasetStreamer:
     """Real-time dataset streaming for testing"""
     
@@ -313,6 +648,18 @@ class DatasetStreamer:
         self.nuscenes_loader = NuScenesDatasetLoader()
         self.streaming_thread = None
         self.stop_streaming = False
+        self.stream_stats = {}
+        
+    def stats(self):
+        """Live instrumentation snapshot of every stream started so far"""
+        return {name: st.snapshot() for name, st in self.stream_stats.items()}
+    
+    def dump_stats(self, path=None):
+        """Serialize stats() as JSON; write to path when given"""
+        report = json.dumps(self.stats(), indent=2)
+        if path is not None:
+            Path(path).write_text(report)
+        return report
         
     def start_kitti_stream(self, sequence_id='00', fps=10):
         """Start KITTI dataset streaming"""
@@ -321,33 +668,15 @@ class DatasetStreamer:
         
         self.kitti_loader.load_sequence_info()
         self.stop_streaming = False
+        frame_queue = self.kitti_loader.frame_queue
+        stats = StreamStats(f'kitti-{sequence_id}', fps, frame_queue.maxsize)
+        self.stream_stats[stats.name] = stats
         
-        def stream_worker():
-            frame_id = 0
-            frame_interval = 1.0 / fps
-            
-            while not self.stop_streaming:
-                start_time = time.time()
-                
-                # Generate frame
-                frame_data = self.kitti_loader.generate_kitti_frame(sequence_id, frame_id)
-                
-                # Convert to fusion system format
-                fusion_input = self.convert_kitti_to_fusion_format(frame_data)
-                
-                # Put in queue for processing
-                if not self.kitti_loader.frame_queue.full():
-                    self.kitti_loader.frame_queue.put(fusion_input)
-                
-                frame_id += 1
-                
-                # Maintain frame rate
-                elapsed = time.time() - start_time
-                if elapsed < frame_interval:
-                    time.sleep(frame_interval - elapsed)
+        def generate(frame_id):
+            return self.kitti_loader.generate_kitti_frame(
+                sequence_id, frame_id, store=self.kitti_loader.annotations.new_frame_store())
         
-        self.streaming_thread = threading.Thread(target=stream_worker)
-        self.streaming_thread.start()
+        self._start_stream(stats, frame_queue, fps, generate, self.convert_kitti_to_fusion_format)
     
     def start_nuscenes_stream(self, scene_token='scene-0001', fps=2):
         """Start nuScenes dataset streaming"""
@@ -356,30 +685,56 @@ class DatasetStreamer:
         
         self.nuscenes_loader.load_scene_info()
         self.stop_streaming = False
+        frame_queue = self.nuscenes_loader.frame_queue
+        stats = StreamStats(f'nuscenes-{scene_token}', fps, frame_queue.maxsize)
+        self.stream_stats[stats.name] = stats
+        
+        def generate(frame_id):
+            return self.nuscenes_loader.generate_nuscenes_frame(
+                scene_token, frame_id, store=self.nuscenes_loader.annotations.new_frame_store())
+        
+        self._start_stream(stats, frame_queue, fps, generate, self.convert_nuscenes_to_fusion_format)
+    
+    def _start_stream(self, stats, frame_queue, fps, generate, convert):
+        """Run generate -> convert -> enqueue at `fps` on the streaming thread
+        
+        The enqueue never blocks: a frame that finds the queue full is dropped,
+        so back-pressure shows in the drop count and the queue depth histogram.
+        """
         
         def stream_worker():
             frame_id = 0
             frame_interval = 1.0 / fps
             
             while not self.stop_streaming:
-                start_time = time.time()
+                start_time = time.perf_counter()
                 
                 # Generate frame
-                frame_data = self.nuscenes_loader.generate_nuscenes_frame(scene_token, frame_id)
+                frame_data = generate(frame_id)
+                generated_at = time.perf_counter()
                 
                 # Convert to fusion system format
-                fusion_input = self.convert_nuscenes_to_fusion_format(frame_data)
+                fusion_input = convert(frame_data)
+                converted_at = time.perf_counter()
                 
-                # Put in queue for processing
-                if not self.nuscenes_loader.frame_queue.full():
-                    self.nuscenes_loader.frame_queue.put(fusion_input)
+                # Put in queue for processing, dropping the frame when the consumer is behind
+                queue_depth = frame_queue.qsize()
+                dropped = frame_queue.full()
+                if not dropped:
+                    frame_queue.put_nowait(fusion_input)
                 
                 frame_id += 1
                 
                 # Maintain frame rate
-                elapsed = time.time() - start_time
+                elapsed = time.perf_counter() - start_time
                 if elapsed < frame_interval:
                     time.sleep(frame_interval - elapsed)
+                
+                stats.record_frame({
+                    'generate': generated_at - start_time,
+                    'convert': converted_at - generated_at,
+                    'sleep': time.perf_counter() - converted_at
+                }, queue_depth, dropped)
         
         self.streaming_thread = threading.Thread(target=stream_worker)
         self.streaming_thread.start()
@@ -458,7 +813,11 @@ class DatasetStreamer:
     
     def _pack_imu_data(self, imu_data):
         """Pack IMU data into raw format"""
-        # Combine position and orientation
+        # Real OXTS samples carry the Q1.15 {w, x, y, z} word imu_synchronizer takes
+        if 'imu_word' in imu_data:
+            return imu_data['imu_word']
+        
+        # Simulated data: combine position and orientation
         pos = imu_data['position'][:3]
         ori = imu_data['orientation'][:3] if len(imu_data['orientation']) == 3 else imu_data['orientation'][:3]
         